@@ -0,0 +1,93 @@
+"""
+Benchmarks the request charge (RU) and latency of searching accounts by name with each 'account_name_match' mode.
+
+Runs against the Cosmos account configured in .env, so point it at an emulator or a test account. The
+container should use deploy/accounts-indexing-policy.json. Seed it once, then run the searches:
+
+    python -m benchmarks.bench_account_name_search --seed 100000
+    python -m benchmarks.bench_account_name_search
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from azure.cosmos import CosmosClient
+from src.config import Settings
+from src.data_models.Account import Account
+from src.db_service.QueryTemplateRegistry import QueryTemplateRegistry
+
+WORDS = ["everyday", "checking", "savings", "joint", "travel", "rewards", "business", "college", "holiday", "emergency", "fund", "premier"]
+
+settings = Settings()
+
+templates = QueryTemplateRegistry(
+    "SELECT * FROM {0}".format(settings.accounts_container_id),
+    {
+        "account_name": "{0}.account_name LIKE @account_name".format(settings.accounts_container_id),
+        "account_name_prefix": "STARTSWITH({0}.account_name, @account_name_prefix)".format(settings.accounts_container_id),
+        "account_name_token": "ARRAY_CONTAINS({0}.account_name_tokens, @account_name_token)".format(settings.accounts_container_id)
+    }
+)
+
+# The same search with each mode.
+searches = {
+    "contains": { "account_name": "%Holiday%" },
+    "prefix": { "account_name_prefix": "Holiday" },
+    "token": { "account_name_token": "holiday" }
+}
+
+
+def seed(container, count: int) -> None:
+    rng = random.Random(0)
+
+    for i in range(count):
+        name = " ".join(word.capitalize() for word in rng.sample(WORDS, 3))
+        account = Account("bench{0}".format(i), name, "checking", "Some Bank", "user::bench", "100.00")
+        container.upsert_item(account.__dict__)
+
+        if (i + 1) % 1000 == 0:
+            print("{0} accounts seeded.".format(i + 1))
+
+
+# Runs a query to the end, returning its total request charge, latency in ms and result count.
+def run(container, params: dict[str, any]) -> tuple[float, float, int]:
+    query = templates.build(params, 0, 100)
+    charge = 0.0
+    count = 0
+    started = time.perf_counter()
+
+    pages = container.query_items(query.query_str, parameters=query.build_where_params(), enable_cross_partition_query=True).by_page()
+
+    for page in pages:
+        count += len(list(page))
+        charge += float(container.client_connection.last_response_headers.get("x-ms-request-charge", 0))
+
+    return charge, (time.perf_counter() - started) * 1000, count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", type=int, default=0, help="Number of accounts to seed before searching.")
+    parser.add_argument("--iterations", type=int, default=20, help="Number of times each search is run.")
+    args = parser.parse_args()
+
+    client = CosmosClient(settings.endpoint, settings.key)
+    container = client.get_database_client(settings.database_id).get_container_client(settings.accounts_container_id)
+
+    if args.seed > 0:
+        seed(container, args.seed)
+
+    for mode, params in searches.items():
+        runs = [run(container, params) for _ in range(args.iterations)]
+
+        print("{0:>9}: {1:8.2f} RU  {2:8.2f} ms (median)  {3} results".format(
+            mode,
+            statistics.median(charge for charge, _, _ in runs),
+            statistics.median(latency for _, latency, _ in runs),
+            runs[0][2]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmarks the CPU time GET /accounts spends on a point read once the document is back from the database.
+
+Compares the previous path (JSON string round trip, pydantic models and FastAPI response serialization)
+with the point-read fast path. Run from the repository root:
+
+    python -m benchmarks.bench_get_account_by_id
+"""
+
+import json
+import timeit
+
+from fastapi.encoders import jsonable_encoder
+from src.libs.api_model_mappers.account_mapper import map_to_account_api_model, map_to_account_api_result_json
+from src.libs.api_model_mappers.api_result_mapper import map_to_api_result
+from src.libs.api_models.ApiResult import ApiResult
+
+ITERATIONS = 20000
+
+# A document as it is read from the accounts container.
+document = {
+    "id": "account::1234",
+    "_rid": "abcdefghijklmnopqrstuvwx==",
+    "_self": "dbs/abc==/colls/abcdef=/docs/abcdefghijklmnopqrstuvwx==/",
+    "_etag": "\"00000000-0000-0000-0000-000000000000\"",
+    "_attachments": "attachments/",
+    "_ts": 1700000000,
+    "collection_name": "account",
+    "account_id": "1234",
+    "account_name": "Everyday Checking",
+    "account_type": "checking",
+    "account_institution": "Some Bank",
+    "account_owner_id": "user::some_user",
+    "balance": "1000.00"
+}
+
+
+# DbService.get returned a JSON string that the router parsed, mapped and FastAPI validated and serialized.
+def previous_path() -> bytes:
+    account = map_to_account_api_model(json.loads(json.dumps(document)))
+    result = map_to_api_result(account, 1, 1)
+    content = jsonable_encoder(ApiResult.validate(result))
+
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+# The document is mapped straight to the response bytes.
+def point_read_path() -> bytes:
+    return map_to_account_api_result_json(document, 1)
+
+
+def main():
+    assert json.loads(previous_path()) == json.loads(point_read_path())
+
+    for name, path in (("previous", previous_path), ("point read", point_read_path)):
+        seconds = min(timeit.repeat(path, number=ITERATIONS, repeat=5))
+        print("{0:>12}: {1:8.2f} us/request".format(name, seconds / ITERATIONS * 1000000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Sets 'balance_cents' on accounts written before balances were stored in cents.
+
+Balance searches, range filters and adjustments use 'balance_cents', so run this once after deploying it. Uses the
+Cosmos account configured in .env. Run from the repository root:
+
+    python -m deploy.backfill_balance_cents --dry-run
+    python -m deploy.backfill_balance_cents
+
+Each account is patched only if it has not changed since it was read, so it is safe to run while the API is serving.
+Running it again only touches accounts still missing 'balance_cents'.
+"""
+
+import argparse
+
+from src.config import Settings
+from src.db_service.DbOptions import DbOptions
+from src.db_service.DbService import DbService
+from src.db_service.Query import Query
+from src.exceptions.NoResultsFoundError import NoResultsFoundError
+from src.exceptions.PreconditionFailedError import PreconditionFailedError
+from src.libs.utils.balance import to_cents
+
+MAX_RETRIES = 5
+
+
+# Sets the cents of one account, rereading it if it changed in between. 'False' if it needed no backfill.
+def backfill(accounts_db: DbService, account: dict[str, any], partition_key_field: str) -> bool:
+    for _ in range(MAX_RETRIES):
+        if account is None or account.get("balance_cents") is not None:
+            return False
+
+        partition_key = account[partition_key_field]
+
+        try:
+            accounts_db.patch(account["id"], partition_key, [{ "op": "set", "path": "/balance_cents", "value": to_cents(account["balance"]) }], account["_etag"])
+            return True
+
+        except PreconditionFailedError:
+            account = accounts_db.read(account["id"], partition_key)
+
+        except NoResultsFoundError:
+            return False
+
+    raise PreconditionFailedError("Account '{0}' changed too often to backfill.".format(account["id"]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dry-run", action="store_true", help="Count the accounts to backfill without changing them.")
+    parser.add_argument("--page-size", type=int, default=1000, help="Number of accounts read per page.")
+    args = parser.parse_args()
+
+    settings = Settings()
+
+    accounts_db = DbService(DbOptions(settings.endpoint, settings.key, settings.database_id, settings.accounts_container_id))
+    accounts_db.connect()
+
+    query = Query("SELECT * FROM c WHERE c.collection_name = 'account' AND NOT IS_DEFINED(c.balance_cents)")
+    found = 0
+    backfilled = 0
+    failed = 0
+
+    for account in accounts_db.query_items(query, args.page_size):
+        found += 1
+
+        if args.dry_run:
+            continue
+
+        try:
+            if backfill(accounts_db, account, settings.accounts_partition_key):
+                backfilled += 1
+
+        except (PreconditionFailedError, ValueError) as e:
+            print("Could not backfill '{0}': {1}".format(account["id"], e))
+            failed += 1
+
+        if found % 1000 == 0:
+            print("{0} accounts backfilled.".format(backfilled))
+
+    if args.dry_run:
+        print("{0} accounts to backfill.".format(found))
+
+    else:
+        print("Done. {0} of {1} accounts backfilled, {2} failed.".format(backfilled, found, failed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Copies the accounts container into a new container partitioned by another account field.
+
+A container's partition key cannot be changed, so partitioning accounts by owner means copying them into a
+new container. Uses the Cosmos account configured in .env. Run from the repository root:
+
+    python -m deploy.migrate_accounts_partition --target accounts-by-owner
+
+Then set ACCOUNTS_CONTAINER_ID to the target container and ACCOUNTS_PARTITION_KEY to the partition key used,
+and restart the API. Accounts written to the source container during the copy are picked up by running the
+migration again, as accounts are upserted.
+
+When partitioning by owner, the id of each account copied is also claimed in the projections container. The target
+container only rejects an account id already used within the same owner's partition, so the API checks the claims to
+keep account ids unique across owners.
+"""
+
+import argparse
+import json
+import os
+
+from azure.cosmos import CosmosClient, PartitionKey
+from src.config import Settings
+from src.data_models.AccountIdClaim import AccountIdClaim
+
+# Fields set by the database, which the target container sets again.
+SYSTEM_FIELDS = ("_rid", "_self", "_etag", "_attachments", "_ts")
+
+INDEXING_POLICY_PATH = os.path.join(os.path.dirname(__file__), "accounts-indexing-policy.json")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", required=True, help="Id of the container to copy accounts into. Created if it does not exist.")
+    parser.add_argument("--partition-key", default="account_owner_id", choices=("account_id", "account_owner_id"), help="Field the target container is partitioned by.")
+    parser.add_argument("--page-size", type=int, default=1000, help="Number of accounts read per page.")
+    args = parser.parse_args()
+
+    settings = Settings()
+
+    if args.target == settings.accounts_container_id:
+        parser.error("--target must be a different container than the source.")
+
+    with open(INDEXING_POLICY_PATH) as f:
+        indexing_policy = json.load(f)
+
+    client = CosmosClient(settings.endpoint, settings.key)
+    database = client.get_database_client(settings.database_id)
+    source = database.get_container_client(settings.accounts_container_id)
+    target = database.create_container_if_not_exists(
+        id=args.target,
+        partition_key=PartitionKey(path="/" + args.partition_key),
+        indexing_policy=indexing_policy)
+    projections = database.get_container_client(settings.projections_container_id)
+
+    copied = 0
+    skipped = 0
+
+    for page in source.query_items("SELECT * FROM c", enable_cross_partition_query=True, max_item_count=args.page_size).by_page():
+        for item in page:
+            if not item.get(args.partition_key):
+                print("Skipping '{0}': it has no {1}.".format(item.get("id"), args.partition_key))
+                skipped += 1
+                continue
+
+            target.upsert_item({ k: v for k, v in item.items() if k not in SYSTEM_FIELDS })
+
+            if args.partition_key == "account_owner_id":
+                projections.upsert_item(AccountIdClaim(item["account_id"], item["account_owner_id"]).__dict__)
+
+            copied += 1
+
+        print("{0} accounts copied.".format(copied))
+
+    print("Done. {0} accounts copied to '{1}', {2} skipped.".format(copied, args.target, skipped))
+
+
+if __name__ == "__main__":
+    main()
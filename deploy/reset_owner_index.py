@@ -0,0 +1,66 @@
+"""
+Has the accounts of owners indexed again in the account owner index read by GET /accounts/mine.
+
+Removes the marker recording that an owner's accounts were indexed, so the owner's next listing indexes their accounts
+again from the accounts container. Uses the Cosmos account configured in .env. Run from the repository root:
+
+    python -m deploy.reset_owner_index --owner user::some_user
+    python -m deploy.reset_owner_index --dry-run
+    python -m deploy.reset_owner_index
+
+Without '--owner', every owner is indexed again the next time they list their accounts. Index entries are kept and
+only replaced by the same or a newer version of their account, so it is safe to run while the API is serving.
+"""
+
+import argparse
+
+from azure.cosmos.exceptions import CosmosResourceNotFoundError
+from src.config import Settings
+from src.data_models.AccountOwnerIndexMarker import AccountOwnerIndexMarker
+from src.db_service.DbOptions import DbOptions
+from src.db_service.DbService import DbService
+from src.db_service.Query import Query
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--owner", help="The account owner id to index again, such as 'user::some_user'. Every owner by default.")
+    parser.add_argument("--dry-run", action="store_true", help="Count the owners to index again without changing them.")
+    parser.add_argument("--page-size", type=int, default=1000, help="Number of markers read per page.")
+    args = parser.parse_args()
+
+    settings = Settings()
+
+    owner_index_db = DbService(DbOptions(settings.endpoint, settings.key, settings.database_id, settings.owner_index_container_id))
+    owner_index_db.connect()
+
+    if args.owner is not None:
+        markers = [AccountOwnerIndexMarker(args.owner).__dict__]
+
+    else:
+        markers = owner_index_db.query_items(Query("SELECT c.id, c.account_owner_id FROM c WHERE c.collection_name = 'account_owner_index_marker'"), args.page_size)
+
+    reset = 0
+
+    for marker in markers:
+        if args.dry_run:
+            reset += 1
+            continue
+
+        try:
+            owner_index_db.delete(marker["id"], marker["account_owner_id"])
+            reset += 1
+
+        except CosmosResourceNotFoundError:
+            # The owner was not indexed yet.
+            pass
+
+    if args.dry_run:
+        print("{0} owners to index again.".format(reset))
+
+    else:
+        print("Done. {0} owners will be indexed again when they next list their accounts.".format(reset))
+
+
+if __name__ == "__main__":
+    main()
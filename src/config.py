@@ -5,12 +5,35 @@ class Settings(BaseSettings):
     secret_key: str
     algorithm: str
     access_token_expire_minutes: int = 30
+    token_cache_size: int = 1024
+    rotate_token_key_on_sighup: bool = False
     endpoint: str
     key: str
     database_id:str
     users_container_id:str
     accounts_container_id: str
+    accounts_partition_key: str = "account_id"
+    projections_container_id: str = "projections"
+    owner_index_container_id: str = "account-owner-index"
+    projector_page_size: int = 100
+    projector_poll_interval_seconds: float = 5
     max_page_size: int
+    export_page_size: int = 1000
+    bulk_max_items: int = 10000
+    bulk_max_concurrency: int = 32
+    batch_get_max_items: int = 100
+    batch_get_max_concurrency: int = 16
+    balance_adjust_max_retries: int = 5
+    balance_adjust_retry_after_seconds: int = 1
+    user_cache_ttl_seconds: int = 300
+    user_cache_negative_ttl_seconds: int = 30
+    user_cache_max_size: int = 10000
+    account_cache_backend: str = "none"
+    account_cache_ttl_seconds: int = 30
+    account_cache_max_size: int = 10000
+    account_count_cache_ttl_seconds: int = 10
+    account_count_cache_max_size: int = 1000
+    redis_url: str = None
 
     class Config:
         env_file = ".env"
\ No newline at end of file
@@ -1,4 +1,7 @@
+import re
+
 from src.data_models.Entity import Entity
+from src.libs.utils.balance import to_cents
 from decimal import Decimal
 
 _collection_name = "account"
@@ -6,6 +9,12 @@ _collection_name = "account"
 class Account(Entity):
     """
     Holds the account data.
+
+    Remarks
+    -------
+    The balance is stored in cents as 'balance_cents', which is what the database searches, sums and
+    increments. 'balance' is the balance as given when the account was last written and is only read
+    for accounts written before 'balance_cents' was added.
     """
 
     def __init__(self, account_id: str, account_name: str = "", account_type: str = "", account_institution: str = "", account_owner_id: str = "", balance: Decimal = Decimal("0.00")):
@@ -48,10 +57,41 @@ class Account(Entity):
         self.id = self.create_id(account_id)
         self.account_id = account_id
         self.account_name = account_name
+        self.account_name_tokens = self.create_name_tokens(account_name)
         self.account_type = account_type
         self.account_institution = account_institution
         self.account_owner_id = account_owner_id
         self.balance = balance
+        self.balance_cents = to_cents(balance)
+
+
+    def create_name_tokens(self, account_name: str) -> list[str]:
+        """
+        Creates the search tokens of an account name.
+
+        Parameters
+        ----------
+        account_name: str
+            The name of the account.
+
+        Returns
+        -------
+        list[str]
+            The distinct lower case words of the name, in the order they appear.
+
+        Remarks
+        -------
+        The tokens are stored with the account so a word of its name can be searched with
+        'ARRAY_CONTAINS', which uses the index, instead of 'LIKE', which scans every account.
+        """
+
+        tokens = list[str]()
+
+        for token in re.split(r"[^0-9a-z]+", account_name.lower()):
+            if token != "" and token not in tokens:
+                tokens.append(token)
+
+        return tokens
 
 
     def __validate_account_id(self, account_id: str):
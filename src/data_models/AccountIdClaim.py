@@ -0,0 +1,40 @@
+from src.data_models.Entity import Entity
+
+_collection_name = "account_id_claim"
+
+class AccountIdClaim(Entity):
+    """
+    Holds the owner an account id belongs to. Claims are partitioned by id, so an account id can only be claimed
+    once across every owner, even when accounts are partitioned by owner.
+    """
+
+    def __init__(self, account_id: str, account_owner_id: str):
+        """
+        Creates a new account id claim.
+
+        Parameters
+        ----------
+        account_id: str
+            The account id claimed.
+
+        account_owner_id: str
+            The owner claiming the account id.
+
+        Raises
+        ------
+        ValueError
+            Raised if the account_id or account_owner_id are undefined.
+        """
+
+        super().__init__(_collection_name)
+
+        if not account_owner_id or account_owner_id.isspace():
+            raise ValueError("'account_owner_id' must be defined.")
+
+        self.create_id(account_id)
+        self.account_id = account_id
+        self.account_owner_id = account_owner_id
+
+
+    def __str__(self) -> str:
+        return "'id': '{0}' | 'account_id': '{1}' | 'account_owner_id': '{2}'".format(self.id, self.account_id, self.account_owner_id)
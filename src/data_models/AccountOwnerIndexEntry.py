@@ -0,0 +1,48 @@
+from src.data_models.Entity import Entity
+
+_collection_name = "account_owner_index_entry"
+
+class AccountOwnerIndexEntry(Entity):
+    """
+    Holds the summary of one account in the index of its owner's accounts. Entries are partitioned by owner,
+    so an owner's accounts are read from one partition however many accounts there are.
+    """
+
+    def __init__(self, account_owner_id: str, account_id: str, account: dict[str, any] = None, account_ts: int = 0):
+        """
+        Creates a new account owner index entry.
+
+        Parameters
+        ----------
+        account_owner_id: str
+            The owner of the account.
+
+        account_id: str
+            The account indexed.
+
+        account: dict[str, any]
+            The summary of the account. Empty by default.
+
+        account_ts: int
+            The last modified time of the account summarized. Older versions of the account do not replace newer ones.
+
+        Raises
+        ------
+        ValueError
+            Raised if the account_owner_id or account_id are undefined.
+        """
+
+        super().__init__(_collection_name)
+
+        if not account_owner_id or account_owner_id.isspace():
+            raise ValueError("'account_owner_id' must be defined.")
+
+        self.create_id(account_id)
+        self.account_owner_id = account_owner_id
+        self.account_id = account_id
+        self.account = dict[str, any]() if account is None else account
+        self.account_ts = account_ts
+
+
+    def __str__(self) -> str:
+        return "'id': '{0}' | 'account_owner_id': '{1}' | 'account_id': '{2}' | 'account_ts': {3}".format(self.id, self.account_owner_id, self.account_id, self.account_ts)
@@ -0,0 +1,40 @@
+from src.data_models.Entity import Entity
+
+_collection_name = "account_owner_index_marker"
+
+class AccountOwnerIndexMarker(Entity):
+    """
+    Records that the accounts of an owner were indexed, even if the owner has no accounts. It is kept in the
+    owner's partition of the account owner index, next to the owner's index entries.
+    """
+
+    def __init__(self, account_owner_id: str, accounts: int = 0):
+        """
+        Creates a new account owner index marker.
+
+        Parameters
+        ----------
+        account_owner_id: str
+            The owner whose accounts were indexed.
+
+        accounts: int
+            The number of accounts indexed.
+
+        Raises
+        ------
+        ValueError
+            Raised if the account_owner_id is undefined.
+        """
+
+        super().__init__(_collection_name)
+
+        if not account_owner_id or account_owner_id.isspace():
+            raise ValueError("'account_owner_id' must be defined.")
+
+        self.create_id(account_owner_id)
+        self.account_owner_id = account_owner_id
+        self.accounts = accounts
+
+
+    def __str__(self) -> str:
+        return "'id': '{0}' | 'account_owner_id': '{1}' | 'accounts': {2}".format(self.id, self.account_owner_id, self.accounts)
@@ -0,0 +1,57 @@
+import hashlib
+
+from src.data_models.Entity import Entity
+
+_collection_name = "account_summary"
+
+class AccountSummary(Entity):
+    """
+    Holds the number of accounts and their total balance sharing a value of a field, such as an owner or institution.
+
+    Remarks
+    -------
+    The id holds a hash of the exact value, as searches match values exactly. Values differing only in case
+    or spacing, such as 'Some Bank' and 'somebank', are summarized apart.
+    """
+
+    def __init__(self, dimension: str, value: str, count: int = 0, balance_cents: int = 0):
+        """
+        Creates a new account summary.
+
+        Parameters
+        ----------
+        dimension: str
+            What the accounts are summarized by. Example: 'institution'.
+
+        value: str
+            The value the accounts share. Example: 'Some Bank'.
+
+        count: int
+            The number of accounts.
+
+        balance_cents: int
+            The total balance of the accounts in cents.
+
+        Raises
+        ------
+        ValueError
+            Raised if the dimension or value are undefined.
+        """
+
+        super().__init__(_collection_name)
+
+        if not dimension or dimension.isspace():
+            raise ValueError("'dimension' must be defined.")
+
+        if not value or value.isspace():
+            raise ValueError("'value' must be defined.")
+
+        self.id = "{0}::{1}::{2}".format(_collection_name, dimension, hashlib.sha256(value.encode("utf-8")).hexdigest())
+        self.dimension = dimension
+        self.value = value
+        self.count = count
+        self.balance_cents = balance_cents
+
+
+    def __str__(self) -> str:
+        return "'id': '{0}' | 'dimension': '{1}' | 'value': '{2}' | 'count': {3} | 'balance_cents': {4}".format(self.id, self.dimension, self.value, self.count, self.balance_cents)
@@ -0,0 +1,166 @@
+import asyncio
+import logging as logger # TODO: Need a way to configure logging dynamically.
+
+from src.db_service.DbOptions import DbOptions
+
+from azure.cosmos.aio import CosmosClient
+
+class AsyncCosmosClientRegistry():
+    """
+    Holds the async Cosmos clients shared by every AsyncDbService in the process.
+
+    Remarks
+    -------
+    This is the asyncio counterpart of CosmosClientRegistry. The async clients are bound to
+    the event loop they were opened on, so they must be opened and closed from the
+    application's startup and shutdown events.
+
+    Methods
+    -------
+    register()
+        Registers database options to open on startup.
+
+    open()
+        Opens the container clients of every registered database option.
+
+    get_container()
+        Gets the pooled container client for the database options.
+
+    close()
+        Closes every client opened by the registry.
+    """
+
+    def __init__(self):
+        self.__lock = asyncio.Lock()
+        self.__registered = dict[tuple, DbOptions]()
+        self.__clients = dict[tuple, CosmosClient]()
+        self.__containers = dict[tuple, any]()
+
+
+    def register(self, db_options: DbOptions) -> None:
+        """
+        Registers database options so their container is opened on startup.
+
+        Parameters
+        ----------
+        db_options: DbOptions
+            Options for the container to register.
+
+        Raises
+        ------
+        TypeError
+            Raised if the db_options are not defined.
+        """
+
+        if db_options is None:
+            raise TypeError("db_options cannot be 'None'.")
+
+        self.__registered[self.__container_key(db_options)] = db_options
+
+
+    async def open(self) -> None:
+        """
+        Opens the container clients of every registered database option.
+
+        Raises
+        ------
+        Exception
+            Raised if an unexpected error occurs.
+        """
+
+        registered = list(self.__registered.values())
+
+        logger.info("Opening {0} registered async container(s).".format(len(registered)))
+
+        for db_options in registered:
+            await self.get_container(db_options)
+
+
+    async def get_container(self, db_options: DbOptions):
+        """
+        Gets the pooled container client for the database options, opening it if needed.
+
+        Parameters
+        ----------
+        db_options: DbOptions
+            Options for the container to get.
+
+        Returns
+        -------
+        ContainerProxy
+            The shared async container client.
+
+        Raises
+        ------
+        Exception
+            Raised if an unexpected error occurs.
+        """
+
+        container_key = self.__container_key(db_options)
+
+        container = self.__containers.get(container_key)
+        if container is not None:
+            return container
+
+        async with self.__lock:
+            # Another task may have opened it while waiting on the lock.
+            container = self.__containers.get(container_key)
+            if container is not None:
+                return container
+
+            client_key = self.__client_key(db_options)
+            client = self.__clients.get(client_key)
+
+            if client is None:
+                logger.info("Opening async connection to database.")
+
+                client = CosmosClient(db_options.endpoint, db_options.key)
+                self.__clients[client_key] = client
+
+                logger.info("Async database connection opened.")
+
+            logger.info("Getting container {0} in database {1}.".format(db_options.container_id, db_options.database_id))
+
+            container = client.get_database_client(db_options.database_id).get_container_client(db_options.container_id)
+            self.__containers[container_key] = container
+
+            logger.info("Container retrieved.")
+
+            return container
+
+
+    async def close(self) -> None:
+        """
+        Closes every client opened by the registry.
+        """
+
+        clients = list(self.__clients.values())
+        self.__clients.clear()
+        self.__containers.clear()
+
+        for client in clients:
+            try:
+                await client.close()
+
+            except Exception as e:
+                logger.exception("close exception -> Error closing async database connection: {0}".format(e))
+
+        logger.info("{0} async database connection(s) closed.".format(len(clients)))
+
+
+    """
+    Private Methods
+    """
+
+    # Key identifying a client connection.
+    def __client_key(self, db_options: DbOptions) -> tuple:
+        return (db_options.endpoint, db_options.key)
+
+
+    # Key identifying a container connection.
+    def __container_key(self, db_options: DbOptions) -> tuple:
+        return (db_options.endpoint, db_options.key, db_options.database_id, db_options.container_id)
+
+
+# Process-wide registry shared by every AsyncDbService.
+async_client_registry = AsyncCosmosClientRegistry()
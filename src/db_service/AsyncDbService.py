@@ -0,0 +1,812 @@
+import json
+import logging as logger # TODO: Need a way to configure logging dynamically.
+from src.db_service.DbOptions import DbOptions
+from src.db_service.Query import Query
+from src.db_service.AsyncCosmosClientRegistry import AsyncCosmosClientRegistry, async_client_registry
+
+from src.exceptions.NoResultsFoundError import NoResultsFoundError
+from src.exceptions.ObjectConflictError import ObjectConflictError
+from src.exceptions.PreconditionFailedError import PreconditionFailedError
+
+from azure.core import MatchConditions
+from azure.cosmos.exceptions import CosmosAccessConditionFailedError, CosmosHttpResponseError, CosmosResourceExistsError, CosmosResourceNotFoundError
+
+class AsyncDbService():
+    """
+    Manages connections or operations to the database using the asyncio Cosmos client.
+
+    Remarks
+    -------
+    Has the same surface as DbService, but every operation is a coroutine so callers
+    do not block a threadpool worker for the database round trip.
+
+    Attributes
+    ----------
+    dbOptions: DbOptions
+            Options for configuring the database service.
+
+    Methods
+    -------
+    connect()
+        Connects to the database using the pooled client registry.
+
+    get()
+        Gets an item in the database collection.
+
+    read()
+        Reads an item in the database collection without converting it to JSON.
+
+    get_etag()
+        Gets the etag of an item without reading it, if it is known.
+
+    query()
+        Queries items in the database collection.
+
+    query_items()
+        Streams the items of a query page by page.
+
+    query_page()
+        Queries a page of items, resuming from a continuation token.
+
+    count()
+        Counts the items matching a count query.
+
+    create()
+        Creates an item in the database collection if it does not exist.
+
+    upsert()
+        Upserts an item in the database collection.
+
+    patch()
+        Applies partial updates to an item, optionally only if its etag matches.
+
+    delete()
+        Deletes an item in the database collection.
+    """
+
+    def __init__(self, db_options: DbOptions, registry: AsyncCosmosClientRegistry = async_client_registry):
+        """        
+        Parameters
+        ----------
+        db_options: DbOptions
+            Options for configuring the database service.
+
+        registry: AsyncCosmosClientRegistry
+            The registry holding the pooled async database clients. The process-wide registry by default.
+        """
+        self.db_options = db_options
+        self.client_registry = registry
+        self.container = None
+
+        if db_options is not None:
+            self.client_registry.register(db_options)
+
+
+    async def connect(self) -> None:
+        """
+        Connects to the database.
+
+        Remarks
+        -------
+        The container client is taken from the shared client registry, so only the first
+        call in the process opens a connection. Subsequent calls are a no-op.
+
+        Raises
+        ------
+        Exception
+            Raised if an unexpected error occurs.
+        """
+
+        if self.container is not None:
+            return
+
+        try: # Validate the dbOptions before connecting.
+            logger.debug("Validating DB options.")
+            
+            self.__validate_db_options()
+
+            logger.debug("DB options are valid.")
+
+        except Exception as e:
+            logger.exception("connect exception -> Error validating db options: {0}".format(e))
+            raise
+
+        try: # Get pooled container.
+            logger.info("Getting container {0}.".format(self.db_options.container_id))
+
+            self.container = await self.client_registry.get_container(self.db_options)
+
+            logger.info("Container retrieved.")
+        
+        except Exception as e:
+            logger.exception("connect exception -> Error getting container: {0}".format(e))
+            raise
+
+
+    async def get(self, id: str, partition_key: str) -> str:
+        """
+        Gets an item from the database.
+
+        Parameters
+        ----------
+        id: str
+            The unique id of the item being retrieved.
+
+        partition_key: str
+            The partition key used for the database item collection.
+
+        Returns
+        -------
+        str
+            The JSON document of the item in the collection this database is querying.
+
+        Raises
+        ------
+        ValueError
+            Raised if the parameters given are invalid.
+
+        CosmosHttpResponseError
+            Raised if the item could not be retrieved.
+
+        Exception
+            Raised if an unexpected error occurs.
+        """
+
+        try:
+            logger.debug("Validating parameter 'id' and 'partition_key'.")
+            
+            self.__validate_id_and_partition_key(id, partition_key)
+            
+            logger.debug("'id' and 'partition_key' are valid.")
+
+        except ValueError as e:
+            logger.exception("get exception -> Parameter invalid: {0}".format(e))
+            raise
+
+        try:
+            logger.info("Getting item by id: {0}".format(id))
+            logger.debug("id: {0}, partition_key: {1}".format(id, partition_key))
+
+            response = await self.container.read_item(item=id, partition_key=partition_key)
+
+            logger.info("Item retrieved: {0}.".format(response))
+            
+            # Convert result to json and return generic object.
+            j = json.dumps(response)
+
+            return j
+
+        except CosmosHttpResponseError as e:
+            logger.warning("Could not get item by id {0} with partition key {1}.".format(id, partition_key))
+            return None
+
+        except Exception as e:
+            logger.exception("get exception -> Error getting item by id: {0}".format(e))
+            raise
+
+    
+    async def read(self, id: str, partition_key: str) -> dict[str, any]:
+        """
+        Reads an item from the database as it is stored, without converting it to JSON.
+
+        Parameters
+        ----------
+        id: str
+            The unique id of the item being retrieved.
+
+        partition_key: str
+            The partition key used for the database item collection.
+
+        Returns
+        -------
+        dict[str, any]
+            The item. 'None' if it does not exist.
+
+        Raises
+        ------
+        ValueError
+            Raised if the parameters given are invalid.
+
+        Exception
+            Raised if an unexpected error occurs.
+        """
+
+        try:
+            self.__validate_id_and_partition_key(id, partition_key)
+
+        except ValueError as e:
+            logger.exception("read exception -> Parameter invalid: {0}".format(e))
+            raise
+
+        try:
+            return await self.container.read_item(item=id, partition_key=partition_key)
+
+        except CosmosResourceNotFoundError:
+            logger.warning("Could not read item by id {0} with partition key {1}.".format(id, partition_key))
+            return None
+
+        except Exception as e:
+            logger.exception("read exception -> Error reading item by id: {0}".format(e))
+            raise
+
+
+    async def get_etag(self, id: str, partition_key: str) -> str:
+        """
+        Gets the etag of an item without reading it, if it is known.
+
+        Remarks
+        -------
+        This service keeps no copy of the items it reads, so the etag is never known and
+        callers read the item instead. CachedDbService returns the etag of its cached copy.
+
+        Returns
+        -------
+        str
+            Always 'None'.
+        """
+
+        return None
+
+    
+    async def query(self, query: Query) -> str:
+        """
+        Queries the database with a given search query string.
+
+        Parameters
+        ----------
+        query: Query
+            The query information to use for the query's execution.
+
+        Returns
+        -------
+        str
+            The JSON documents from the result as a JSON string.
+
+        Raises
+        ------
+        Exception
+            Raised if an unexpected error occurs.
+        """
+        try:
+            logger.debug("Validating 'query' is valid.")
+
+            if query is None:
+                raise TypeError("'query' must be defined.")
+
+            logger.debug("'query' is valid.")
+        
+        except TypeError as e:
+            logger.exception("query exception -> Parameters are invalid: {0}".format(e))
+            raise
+
+        try:
+            logger.debug("Building where params for database API.")
+
+            params = query.build_where_params()
+
+            logger.debug("Where params built: {0}".format(json.dumps(params)))
+            logger.info("Querying database with: {0}".format(str(query)))
+
+            if params is None:
+                result = [item async for item in self.container.query_items(
+                    query.query_str,
+                    **query.build_partition_options())]
+
+            else:
+                result = [item async for item in self.container.query_items(
+                    query.query_str,
+                    parameters=params,
+                    **query.build_partition_options())]
+
+            if result is not None and len(result) > 0:
+                j = json.dumps(result)
+
+                logger.info("{0} results retrieved: {1}".format(len(result), j))
+
+                return j
+
+            else:
+                logger.warning("No results found for given query: {0}".format(str(query)))
+                return None
+
+        except Exception as e:
+            logger.exception("query exception -> Error querying items: {0}".format(e))
+            raise
+
+
+    async def query_items(self, query: Query, page_size: int = None):
+        """
+        Queries the database, yielding each item as the pages of results are read.
+
+        Parameters
+        ----------
+        query: Query
+            The query information to use for the query's execution.
+
+        page_size: int
+            The maximum number of items read per round trip. The database default if 'None'.
+
+        Yields
+        ------
+        dict[str, any]
+            Each item in the results.
+
+        Raises
+        ------
+        TypeError
+            Raised if the query is not defined.
+
+        Exception
+            Raised if an unexpected error occurs.
+
+        Remarks
+        -------
+        Only one page of results is held in memory at a time and the items are not converted
+        to a JSON string, so callers can map them as they arrive.
+        """
+
+        try:
+            logger.debug("Validating 'query' is valid.")
+
+            if query is None:
+                raise TypeError("'query' must be defined.")
+
+            logger.debug("'query' is valid.")
+        
+        except TypeError as e:
+            logger.exception("query_items exception -> Parameters are invalid: {0}".format(e))
+            raise
+
+        try:
+            logger.info("Streaming query results with: {0}".format(str(query)))
+
+            pages = self.container.query_items(
+                query.query_str,
+                parameters=query.build_where_params(),
+                **query.build_partition_options(),
+                max_item_count=page_size).by_page()
+
+            count = 0
+            async for page in pages:
+                async for item in page:
+                    count += 1
+                    yield item
+
+            logger.info("{0} results streamed.".format(count))
+
+        except Exception as e:
+            logger.exception("query_items exception -> Error querying items: {0}".format(e))
+            raise
+
+
+    async def query_page(self, query: Query, page_size: int, continuation_token: str = None) -> tuple[list[dict[str, any]], str]:
+        """
+        Queries a single page of results, resuming from a continuation token.
+
+        Parameters
+        ----------
+        query: Query
+            The query information to use for the query's execution.
+
+        page_size: int
+            The maximum number of items in the page.
+
+        continuation_token: str
+            The token returned with the previous page. 'None' to get the first page.
+
+        Returns
+        -------
+        tuple[list[dict[str, any]], str]
+            The items in the page and the continuation token for the next page. The token is
+            'None' if there are no more pages.
+
+        Raises
+        ------
+        TypeError
+            Raised if the query is not defined.
+
+        ValueError
+            Raised if the page size is not greater than 0.
+
+        Exception
+            Raised if an unexpected error occurs.
+
+        Remarks
+        -------
+        Unlike OFFSET/LIMIT, resuming from a continuation token costs the same for every page.
+        """
+
+        try:
+            logger.debug("Validating 'query' and 'page_size' are valid.")
+
+            if query is None:
+                raise TypeError("'query' must be defined.")
+
+            if page_size is None or page_size <= 0:
+                raise ValueError("'page_size' must be greater than 0.")
+
+            logger.debug("'query' and 'page_size' are valid.")
+        
+        except (TypeError, ValueError) as e:
+            logger.exception("query_page exception -> Parameters are invalid: {0}".format(e))
+            raise
+
+        try:
+            params = query.build_where_params()
+
+            logger.info("Querying page of {0} with: {1}".format(page_size, str(query)))
+            logger.debug("continuation_token: {0}".format(continuation_token))
+
+            pager = self.container.query_items(
+                query.query_str,
+                parameters=params,
+                **query.build_partition_options(),
+                max_item_count=page_size).by_page(continuation_token)
+
+            try:
+                page = await pager.__anext__()
+                result = [item async for item in page]
+
+            except StopAsyncIteration:
+                result = list()
+
+            logger.info("{0} results retrieved.".format(len(result)))
+
+            return result, pager.continuation_token
+
+        except Exception as e:
+            logger.exception("query_page exception -> Error querying page: {0}".format(e))
+            raise
+
+
+    async def count(self, query: Query) -> int:
+        """
+        Counts the items matching a count query.
+
+        Parameters
+        ----------
+        query: Query
+            The query to execute, selecting 'VALUE COUNT(1)'.
+
+        Returns
+        -------
+        int
+            The number of items counted.
+
+        Raises
+        ------
+        TypeError
+            Raised if the query is not defined.
+
+        Exception
+            Raised if an unexpected error occurs.
+
+        Remarks
+        -------
+        Only the count is returned by the database, so counting costs far less than reading the items.
+        The partial counts of each partition are added together.
+        """
+
+        try:
+            logger.debug("Validating 'query' is valid.")
+
+            if query is None:
+                raise TypeError("'query' must be defined.")
+
+            logger.debug("'query' is valid.")
+        
+        except TypeError as e:
+            logger.exception("count exception -> Parameters are invalid: {0}".format(e))
+            raise
+
+        try:
+            logger.info("Counting items with: {0}".format(str(query)))
+
+            result = sum([value async for value in self.container.query_items(
+                query.query_str,
+                parameters=query.build_where_params(),
+                **query.build_partition_options())])
+
+            logger.info("{0} items counted.".format(result))
+
+            return result
+
+        except Exception as e:
+            logger.exception("count exception -> Error counting items: {0}".format(e))
+            raise
+
+
+    async def create(self, item: dict[str, any]) -> str:
+        """
+        Creates an item in the database, failing if an item with the same id already exists.
+
+        Parameters
+        ----------
+        item: dict[str, any]
+            The object's dictionary key value pair.
+
+        Returns
+        -------
+        str
+            The JSON document of the object created.
+
+        Raises
+        ------
+        TypeError
+            Raised if the parameter given is invalid.
+
+        ObjectConflictError
+            Raised if an item with the same id already exists.
+
+        Exception
+            Raised if an unexpected error occurs.
+
+        Remarks
+        -------
+        The existence check is done by the database in the same round trip as the write,
+        so two concurrent creates of the same item cannot both succeed.
+        """
+
+        try:
+            logger.debug("Validating parameter 'item' is valid.")
+
+            if item is None:
+                raise TypeError("The item must be defined.")
+
+            logger.debug("Parameter 'item' is valid.")
+
+        except TypeError as e:
+            logger.exception("create exception -> Parameter invalid: {0}".format(e))
+            raise
+
+        try:
+            logger.info("Creating item: {0}".format(json.dumps(item)))
+
+            result = await self.container.create_item(item)
+            
+            # Convert result to json and return generic object.
+            j = json.dumps(result)
+
+            logger.info("Item created: {0}".format(j))
+
+            return j
+
+        except CosmosResourceExistsError as e:
+            logger.warning("create -> Item '{0}' already exists.".format(item.get("id")))
+            raise ObjectConflictError("Item '{0}' already exists.".format(item.get("id")))
+        
+        except Exception as e:
+            logger.exception("create exception -> Error creating item: {0}".format(e))
+            raise
+
+
+    async def upsert(self, item: dict[str, any]) -> str:
+        """
+        Upserts an item in the database.
+
+        Parameters
+        ----------
+        item: dict[str, any]
+            The object's dictionary key value pair.
+
+        Returns
+        -------
+        str
+            The JSON document of the object upserted.
+
+        Raises
+        ------
+        TypeError
+            Raised if the parameter given is invalid.
+
+        Exception
+            Raised if an unexpected error occurs.
+
+        """
+
+        try:
+            logger.debug("Validating parameter 'item' is valid.")
+
+            if item is None:
+                raise TypeError("The item must be defined.")
+
+            logger.debug("Parameter 'item' is valid.")
+
+        except TypeError as e:
+            logger.exception("upsert exception -> Parameter invalid: {0}".format(e))
+            raise
+
+        try:
+            logger.info("Getting item: {0}".format(json.dumps(item)))
+
+            result = await self.container.upsert_item(item)
+            
+            # Convert result to json and return generic object.
+            j = json.dumps(result)
+
+            logger.info("Item retrieved: {0}".format(j))
+
+            return j
+        
+        except Exception as e:
+            logger.exception("upsert exception -> Error upserting item: {0}".format(e))
+            raise
+    
+    
+    async def patch(self, id: str, partition_key: str, operations: list[dict[str, any]], etag: str = None, filter_predicate: str = None) -> str:
+        """
+        Applies partial updates to an item in the database.
+
+        Parameters
+        ----------
+        id: str
+            The unique id of the item being patched.
+
+        partition_key: str
+            The partition key used for the database item collection.
+
+        operations: list[dict[str, any]]
+            The patch operations to apply. Example:
+                operations = [
+                    { "op": "set", "path": "/account_name", "value": "Savings" }
+                ]
+
+        etag: str
+            Only patch the item if its '_etag' still matches. 'None' by default, which patches
+            the item whatever its version.
+
+        filter_predicate: str
+            Only patch the item if it matches this condition. Example: "FROM c WHERE c.balance >= 0".
+            'None' by default.
+
+        Returns
+        -------
+        str
+            The JSON document of the item after it was patched.
+
+        Raises
+        ------
+        ValueError
+            Raised if the parameters given are invalid.
+
+        NoResultsFoundError
+            Raised if the item does not exist.
+
+        PreconditionFailedError
+            Raised if the item's etag does not match or it does not match the filter predicate.
+
+        Exception
+            Raised if an unexpected error occurs.
+
+        Remarks
+        -------
+        Only the operations are sent to the database and the update is applied in one round trip,
+        so there is no read-modify-write of the whole item.
+        """
+
+        try:
+            logger.debug("Validating parameter 'id', 'partition_key' and 'operations'.")
+            
+            self.__validate_id_and_partition_key(id, partition_key)
+
+            if operations is None or len(operations) == 0:
+                raise ValueError("operations must be defined and not empty.")
+            
+            logger.debug("'id', 'partition_key' and 'operations' are valid.")
+
+        except ValueError as e:
+            logger.exception("patch exception -> Parameter invalid: {0}".format(e))
+            raise
+
+        try:
+            logger.info("Patching item by id: {0}".format(id))
+            logger.debug("id: {0}, partition_key: {1}, operations: {2}, etag: {3}, filter_predicate: {4}".format(id, partition_key, json.dumps(operations), etag, filter_predicate))
+
+            if etag is None:
+                result = await self.container.patch_item(item=id, partition_key=partition_key, patch_operations=operations, filter_predicate=filter_predicate)
+
+            else:
+                result = await self.container.patch_item(item=id, partition_key=partition_key, patch_operations=operations, filter_predicate=filter_predicate,
+                    etag=etag, match_condition=MatchConditions.IfNotModified)
+
+            # Convert result to json and return generic object.
+            j = json.dumps(result)
+
+            logger.info("Item patched: {0}".format(j))
+
+            return j
+
+        except CosmosResourceNotFoundError as e:
+            logger.warning("patch -> Could not find item by id {0} with partition key {1}.".format(id, partition_key))
+            raise NoResultsFoundError("Item '{0}' does not exist.".format(id))
+
+        except CosmosAccessConditionFailedError as e:
+            logger.warning("patch -> Precondition failed for item '{0}': {1}".format(id, e))
+            raise PreconditionFailedError("Item '{0}' was changed or does not meet the condition of the update.".format(id))
+
+        except Exception as e:
+            logger.exception("patch exception -> Error patching item: {0}".format(e))
+            raise
+
+
+    async def delete(self, id: str, partition_key: str) -> None:
+        """
+        Deletes an item from the database.
+
+        Parameters
+        ----------
+         id: str
+            The unique id of the item being retrieved.
+
+        partition_key: str
+            The partition key used for the database item collection.
+
+        Raises
+        ------
+        ValueError
+            Raised if the parameters given are invalid.
+
+        CosmosResourceNotFoundError
+            Raised if the item cannot be found to be deleted.
+
+        Exception
+            Raised if an unexpected error occurs.
+        """
+        
+        try:
+            logger.debug("Validating parameter 'id' and 'partition_key'.")
+            
+            self.__validate_id_and_partition_key(id, partition_key)
+            
+            logger.debug("'id' and 'partition_key' are valid.")
+
+        except ValueError as e:
+            logger.exception("delete exception -> Parameter invalid: {0}".format(e))
+            raise
+
+        try:
+            logger.info("Deleting item by id: '{0}'".format(id))
+            logger.debug("id: {0}, partition_key: {1}".format(id, partition_key))
+
+            await self.container.delete_item(item=id, partition_key=partition_key)
+
+            logger.info("Item with id '{0}' deleted.".format(id))
+
+        except CosmosResourceNotFoundError as e:
+            logger.exception("delete exception -> Could not find item to delete: {0}".format(e))
+            raise
+        
+        except Exception as e:
+            logger.exception("delete exception -> Error deleting item: {0}".format(e))
+            raise
+
+
+    """
+    Private Methods
+    """
+
+    # Validates the db options.
+    def __validate_db_options(self) -> None:
+        if self.db_options is None:
+            raise TypeError("db_options cannot be 'None'.")
+        
+        if not self.db_options.endpoint or self.db_options.endpoint.isspace():
+            raise ValueError("The endpoint must be defined.")
+        
+        elif not self.db_options.key or self.db_options.key.isspace():
+            raise ValueError("The key must be defined.")
+
+        elif not self.db_options.database_id or self.db_options.database_id.isspace():
+            raise ValueError("The database id must be defined.")
+
+        elif not self.db_options.container_id or self.db_options.container_id.isspace():
+            raise ValueError("The container id must be defined.")
+
+
+    # Validates the id and partition key are valid.
+    def __validate_id_and_partition_key(self, id: str, partition_key: str) -> None:
+        if not id or id.isspace():
+            raise ValueError("id must be defined.")
+
+        elif not partition_key or partition_key.isspace():
+            raise ValueError("partition_key must be defined.")
@@ -0,0 +1,263 @@
+import json
+import logging as logger # TODO: Need a way to configure logging dynamically.
+
+from src.db_service.AsyncDbService import AsyncDbService
+from src.db_service.Query import Query
+from src.db_service.cache.CacheBackend import CacheBackend
+from src.exceptions.NoResultsFoundError import NoResultsFoundError
+from src.exceptions.PreconditionFailedError import PreconditionFailedError
+
+class CachedDbService():
+    """
+    Read-through cache in front of an AsyncDbService.
+
+    Remarks
+    -------
+    Has the same surface as AsyncDbService. Point reads are served from the cache when
+    possible. Writes replace the cached document with the one the database returns, and
+    deletes remove it. Cached documents keep their '_etag', so a conditional write that
+    fails because the document changed also evicts the stale cached copy. Queries are not
+    cached.
+
+    Methods
+    -------
+    connect()
+        Connects to the database.
+
+    get()
+        Gets an item in the database collection, from the cache if it is cached.
+
+    read()
+        Reads an item in the database collection, from the cache if it is cached.
+
+    get_etag()
+        Gets the etag of the cached copy of an item.
+
+    create(), upsert(), patch(), delete()
+        Writes to the database collection and updates the cache.
+
+    query(), query_items(), query_page(), count()
+        Queries the database collection without the cache.
+    """
+
+    def __init__(self, db_service: AsyncDbService, cache: CacheBackend, ttl_seconds: int, partition_key_field: str):
+        """
+        Parameters
+        ----------
+        db_service: AsyncDbService
+            The database service to cache.
+
+        cache: CacheBackend
+            Where cached documents are stored.
+
+        ttl_seconds: int
+            The time in seconds a document is cached for.
+
+        partition_key_field: str
+            The field of the documents holding their partition key.
+        """
+
+        self.db_service = db_service
+        self.cache = cache
+        self.ttl_seconds = ttl_seconds
+        self.partition_key_field = partition_key_field
+
+
+    async def connect(self) -> None:
+        await self.db_service.connect()
+
+
+    async def read(self, id: str, partition_key: str) -> dict[str, any]:
+        """
+        Reads an item, from the cache if it is cached or else from the database.
+
+        Parameters
+        ----------
+        id: str
+            The unique id of the item being retrieved.
+
+        partition_key: str
+            The partition key used for the database item collection.
+
+        Returns
+        -------
+        dict[str, any]
+            The item. 'None' if it does not exist.
+
+        Raises
+        ------
+        ValueError
+            Raised if the parameters given are invalid.
+
+        Exception
+            Raised if an unexpected error occurs.
+        """
+
+        key = self.__cache_key(id, partition_key)
+        document = await self.__get_cached(key)
+
+        if document is not None:
+            logger.debug("Item '{0}' read from cache.".format(id))
+            return document
+
+        document = await self.db_service.read(id, partition_key)
+
+        if document is not None:
+            await self.__set_cached(key, document, False)
+
+        return document
+
+
+    async def get(self, id: str, partition_key: str) -> str:
+        """
+        Gets an item, from the cache if it is cached or else from the database.
+
+        Returns
+        -------
+        str
+            The JSON document of the item. 'None' if it does not exist.
+        """
+
+        document = await self.read(id, partition_key)
+
+        if document is None:
+            return None
+
+        return json.dumps(document)
+
+
+    async def get_etag(self, id: str, partition_key: str) -> str:
+        """
+        Gets the etag of the cached copy of an item without reading the database.
+
+        Parameters
+        ----------
+        id: str
+            The unique id of the item.
+
+        partition_key: str
+            The partition key used for the database item collection.
+
+        Returns
+        -------
+        str
+            The etag of the cached item. 'None' if it is not cached.
+        """
+
+        document = await self.__get_cached(self.__cache_key(id, partition_key))
+
+        if document is None:
+            return None
+
+        return document.get("_etag")
+
+
+    async def query(self, query: Query) -> str:
+        return await self.db_service.query(query)
+
+
+    def query_items(self, query: Query, page_size: int = None):
+        return self.db_service.query_items(query, page_size)
+
+
+    async def query_page(self, query: Query, page_size: int, continuation_token: str = None) -> tuple[list[dict[str, any]], str]:
+        return await self.db_service.query_page(query, page_size, continuation_token)
+
+
+    async def count(self, query: Query) -> int:
+        return await self.db_service.count(query)
+
+
+    async def create(self, item: dict[str, any]) -> str:
+        result = await self.db_service.create(item)
+        await self.__set_written(result)
+
+        return result
+
+
+    async def upsert(self, item: dict[str, any]) -> str:
+        result = await self.db_service.upsert(item)
+        await self.__set_written(result)
+
+        return result
+
+
+    async def patch(self, id: str, partition_key: str, operations: list[dict[str, any]], etag: str = None, filter_predicate: str = None) -> str:
+        key = self.__cache_key(id, partition_key)
+
+        try:
+            result = await self.db_service.patch(id, partition_key, operations, etag, filter_predicate)
+
+        except (NoResultsFoundError, PreconditionFailedError):
+            # The cached copy no longer matches the database.
+            await self.__delete_cached(key)
+            raise
+
+        await self.__set_written(result)
+
+        return result
+
+
+    async def delete(self, id: str, partition_key: str) -> None:
+        try:
+            await self.db_service.delete(id, partition_key)
+
+        finally:
+            await self.__delete_cached(self.__cache_key(id, partition_key))
+
+
+    """
+    Private Methods
+    """
+
+    # Key of an item in the cache.
+    def __cache_key(self, id: str, partition_key: str) -> str:
+        return "{0}:{1}:{2}".format(self.db_service.db_options.container_id, partition_key, id)
+
+
+    # Caches a document returned by a write, keyed by its own id and partition key.
+    async def __set_written(self, result: str) -> None:
+        document = json.loads(result)
+        partition_key = document.get(self.partition_key_field)
+
+        if document.get("id") is None or partition_key is None:
+            return
+
+        await self.__set_cached(self.__cache_key(document["id"], partition_key), document, True)
+
+
+    # Cache failures are logged and treated as a miss so the database still serves the request.
+    async def __get_cached(self, key: str) -> dict[str, any]:
+        try:
+            return await self.cache.get(key)
+
+        except Exception as e:
+            logger.exception("cache exception -> Error getting '{0}' from the cache: {1}".format(key, e))
+            return None
+
+
+    # Caches a document unless a newer version of it is already cached. '_ts' is in seconds, so a document read with
+    # the same '_ts' as the cached one may be older than it and never replaces it. A written document does, as the write
+    # returned the latest version.
+    async def __set_cached(self, key: str, document: dict[str, any], written: bool) -> None:
+        try:
+            cached = await self.cache.get(key)
+
+            if cached is not None:
+                cached_ts, ts = cached.get("_ts", 0), document.get("_ts", 0)
+
+                if cached_ts > ts or (cached_ts == ts and not written):
+                    return
+
+            await self.cache.set(key, document, self.ttl_seconds)
+
+        except Exception as e:
+            logger.exception("cache exception -> Error setting '{0}' in the cache: {1}".format(key, e))
+
+
+    async def __delete_cached(self, key: str) -> None:
+        try:
+            await self.cache.delete(key)
+
+        except Exception as e:
+            logger.exception("cache exception -> Error deleting '{0}' from the cache: {1}".format(key, e))
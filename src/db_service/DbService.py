@@ -2,9 +2,14 @@ import json
 import logging as logger # TODO: Need a way to configure logging dynamically.
 from src.db_service.DbOptions import DbOptions
 from src.db_service.Query import Query
+from src.db_service.CosmosClientRegistry import CosmosClientRegistry, client_registry
 
-from azure.cosmos import CosmosClient
-from azure.cosmos.exceptions import CosmosHttpResponseError, CosmosResourceNotFoundError
+from src.exceptions.NoResultsFoundError import NoResultsFoundError
+from src.exceptions.ObjectConflictError import ObjectConflictError
+from src.exceptions.PreconditionFailedError import PreconditionFailedError
+
+from azure.core import MatchConditions
+from azure.cosmos.exceptions import CosmosAccessConditionFailedError, CosmosHttpResponseError, CosmosResourceExistsError, CosmosResourceNotFoundError
 
 class DbService():
     """
@@ -18,38 +23,78 @@ class DbService():
     Methods
     -------
     connect()
-        Connects to the database.
+        Connects to the database using the pooled client registry.
 
     get()
         Gets an item in the database collection.
 
+    read()
+        Reads an item in the database collection without converting it to JSON.
+
+    query()
+        Queries items in the database collection.
+
+    query_items()
+        Streams the items of a query page by page.
+
+    query_page()
+        Queries a page of items, resuming from a continuation token.
+
+    count()
+        Counts the items matching a count query.
+
+    read_change_feed()
+        Reads the items changed since a continuation token page by page.
+
+    create()
+        Creates an item in the database collection if it does not exist.
+
     upsert()
         Upserts an item in the database collection.
+
+    patch()
+        Applies partial updates to an item, optionally only if its etag matches.
+
+    delete()
+        Deletes an item in the database collection.
     """
 
-    def __init__(self, db_options: DbOptions):
+    def __init__(self, db_options: DbOptions, registry: CosmosClientRegistry = client_registry):
         """        
         Parameters
         ----------
         db_options: DbOptions
             Options for configuring the database service.
+
+        registry: CosmosClientRegistry
+            The registry holding the pooled database clients. The process-wide registry by default.
         """
         self.db_options = db_options
-        self.client = None
-        self.db = None
+        self.client_registry = registry
         self.container = None
 
+        if db_options is not None:
+            self.client_registry.register(db_options)
+
 
     def connect(self) -> None:
         """
         Connects to the database.
 
+        Remarks
+        -------
+        The container client is taken from the shared client registry, so only the first
+        call in the process opens a connection. Subsequent calls are a no-op.
+
         Raises
         ------
         Exception
             Raised if an unexpected error occurs.
         """
 
+        if self.container is not None:
+            return
+
         try: # Validate the dbOptions before connecting.
             logger.debug("Validating DB options.")
             
@@ -61,33 +106,10 @@ class DbService():
             logger.exception("connect exception -> Error validating db options: {0}".format(e))
             raise
 
-        try: # Open database connection.
-            logger.info("Opening connection to database.")
-            logger.debug("endpoint: {0}, key: {1}".format(self.db_options.endpoint, self.db_options.key))
-
-            self.client = CosmosClient(self.db_options.endpoint, self.db_options.key)
-
-            logger.info("Database connection opened.")
-
-        except Exception as e:
-            logger.exception("connect exception -> Error opening connection to the database: {0}".format(e))
-            raise
-        
-        try: # Get database.
-            logger.info("Getting database {0}.".format(self.db_options.database_id))
-
-            self.db = self.client.get_database_client(self.db_options.database_id)
-
-            logger.info("Database retrieved.")
-        
-        except Exception as e:
-            logger.exception("connect exception -> Error getting database: {0}".format(e))
-            raise
-        
-        try: # Get container.
+        try: # Get pooled container.
             logger.info("Getting container {0}.".format(self.db_options.container_id))
 
-            self.container = self.db.get_container_client(self.db_options.container_id)
+            self.container = self.client_registry.get_container(self.db_options)
 
             logger.info("Container retrieved.")
         
@@ -158,6 +180,51 @@ class DbService():
             raise
 
     
+    def read(self, id: str, partition_key: str) -> dict[str, any]:
+        """
+        Reads an item from the database as it is stored, without converting it to JSON.
+
+        Parameters
+        ----------
+        id: str
+            The unique id of the item being retrieved.
+
+        partition_key: str
+            The partition key used for the database item collection.
+
+        Returns
+        -------
+        dict[str, any]
+            The item. 'None' if it does not exist.
+
+        Raises
+        ------
+        ValueError
+            Raised if the parameters given are invalid.
+
+        Exception
+            Raised if an unexpected error occurs.
+        """
+
+        try:
+            self.__validate_id_and_partition_key(id, partition_key)
+
+        except ValueError as e:
+            logger.exception("read exception -> Parameter invalid: {0}".format(e))
+            raise
+
+        try:
+            return self.container.read_item(item=id, partition_key=partition_key)
+
+        except CosmosResourceNotFoundError:
+            logger.warning("Could not read item by id {0} with partition key {1}.".format(id, partition_key))
+            return None
+
+        except Exception as e:
+            logger.exception("read exception -> Error reading item by id: {0}".format(e))
+            raise
+
+    
     def query(self, query: Query) -> str:
         """
         Queries the database with a given search query string.
@@ -200,13 +267,13 @@ class DbService():
             if params is None:
                 result = list(self.container.query_items(
                     query.query_str,
-                    enable_cross_partition_query=query.enable_cross_partition_query))
+                    **query.build_partition_options()))
 
             else:
                 result = list(self.container.query_items(
                     query.query_str,
                     parameters=params,
-                    enable_cross_partition_query=query.enable_cross_partition_query))
+                    **query.build_partition_options()))
 
             if result is not None and len(result) > 0:
                 j = json.dumps(result)
@@ -224,6 +291,325 @@ class DbService():
             raise
 
 
+    def query_items(self, query: Query, page_size: int = None):
+        """
+        Queries the database, yielding each item as the pages of results are read.
+
+        Parameters
+        ----------
+        query: Query
+            The query information to use for the query's execution.
+
+        page_size: int
+            The maximum number of items read per round trip. The database default if 'None'.
+
+        Yields
+        ------
+        dict[str, any]
+            Each item in the results.
+
+        Raises
+        ------
+        TypeError
+            Raised if the query is not defined.
+
+        Exception
+            Raised if an unexpected error occurs.
+
+        Remarks
+        -------
+        Only one page of results is held in memory at a time and the items are not converted
+        to a JSON string, so callers can map them as they arrive.
+        """
+
+        try:
+            logger.debug("Validating 'query' is valid.")
+
+            if query is None:
+                raise TypeError("'query' must be defined.")
+
+            logger.debug("'query' is valid.")
+        
+        except TypeError as e:
+            logger.exception("query_items exception -> Parameters are invalid: {0}".format(e))
+            raise
+
+        try:
+            logger.info("Streaming query results with: {0}".format(str(query)))
+
+            pages = self.container.query_items(
+                query.query_str,
+                parameters=query.build_where_params(),
+                **query.build_partition_options(),
+                max_item_count=page_size).by_page()
+
+            count = 0
+            for page in pages:
+                for item in page:
+                    count += 1
+                    yield item
+
+            logger.info("{0} results streamed.".format(count))
+
+        except Exception as e:
+            logger.exception("query_items exception -> Error querying items: {0}".format(e))
+            raise
+
+
+    def query_page(self, query: Query, page_size: int, continuation_token: str = None) -> tuple[list[dict[str, any]], str]:
+        """
+        Queries a single page of results, resuming from a continuation token.
+
+        Parameters
+        ----------
+        query: Query
+            The query information to use for the query's execution.
+
+        page_size: int
+            The maximum number of items in the page.
+
+        continuation_token: str
+            The token returned with the previous page. 'None' to get the first page.
+
+        Returns
+        -------
+        tuple[list[dict[str, any]], str]
+            The items in the page and the continuation token for the next page. The token is
+            'None' if there are no more pages.
+
+        Raises
+        ------
+        TypeError
+            Raised if the query is not defined.
+
+        ValueError
+            Raised if the page size is not greater than 0.
+
+        Exception
+            Raised if an unexpected error occurs.
+
+        Remarks
+        -------
+        Unlike OFFSET/LIMIT, resuming from a continuation token costs the same for every page.
+        """
+
+        try:
+            logger.debug("Validating 'query' and 'page_size' are valid.")
+
+            if query is None:
+                raise TypeError("'query' must be defined.")
+
+            if page_size is None or page_size <= 0:
+                raise ValueError("'page_size' must be greater than 0.")
+
+            logger.debug("'query' and 'page_size' are valid.")
+        
+        except (TypeError, ValueError) as e:
+            logger.exception("query_page exception -> Parameters are invalid: {0}".format(e))
+            raise
+
+        try:
+            params = query.build_where_params()
+
+            logger.info("Querying page of {0} with: {1}".format(page_size, str(query)))
+            logger.debug("continuation_token: {0}".format(continuation_token))
+
+            pager = self.container.query_items(
+                query.query_str,
+                parameters=params,
+                **query.build_partition_options(),
+                max_item_count=page_size).by_page(continuation_token)
+
+            try:
+                page = next(pager)
+                result = list(page)
+
+            except StopIteration:
+                result = list()
+
+            logger.info("{0} results retrieved.".format(len(result)))
+
+            return result, pager.continuation_token
+
+        except Exception as e:
+            logger.exception("query_page exception -> Error querying page: {0}".format(e))
+            raise
+
+
+    def read_change_feed(self, continuation_token: str = None, page_size: int = None):
+        """
+        Reads the latest version of every item changed since a continuation token, page by page.
+
+        Parameters
+        ----------
+        continuation_token: str
+            The token yielded with the last page read. 'None' to read from the beginning of the container.
+
+        page_size: int
+            The maximum number of items read per round trip. The database default if 'None'.
+
+        Yields
+        ------
+        tuple[list[dict[str, any]], str]
+            The items of each page, in the order they were changed within a partition, and the
+            continuation token to resume after the page. Stops once every change has been read.
+
+        Raises
+        ------
+        Exception
+            Raised if an unexpected error occurs.
+
+        Remarks
+        -------
+        Deleted items are not part of the change feed, and items changed more than once since the
+        token are only read once, in their latest version.
+        """
+
+        try:
+            logger.info("Reading change feed from {0}.".format("the beginning" if continuation_token is None else "continuation token"))
+            logger.debug("continuation_token: {0}".format(continuation_token))
+
+            if continuation_token is None:
+                pager = self.container.query_items_change_feed(start_time="Beginning", max_item_count=page_size).by_page()
+
+            else:
+                pager = self.container.query_items_change_feed(continuation=continuation_token, max_item_count=page_size).by_page()
+
+            count = 0
+            for page in pager:
+                items = list(page)
+                count += len(items)
+
+                yield items, pager.continuation_token
+
+            logger.info("{0} changes read.".format(count))
+
+        except Exception as e:
+            logger.exception("read_change_feed exception -> Error reading change feed: {0}".format(e))
+            raise
+
+
+    def count(self, query: Query) -> int:
+        """
+        Counts the items matching a count query.
+
+        Parameters
+        ----------
+        query: Query
+            The query to execute, selecting 'VALUE COUNT(1)'.
+
+        Returns
+        -------
+        int
+            The number of items counted.
+
+        Raises
+        ------
+        TypeError
+            Raised if the query is not defined.
+
+        Exception
+            Raised if an unexpected error occurs.
+
+        Remarks
+        -------
+        Only the count is returned by the database, so counting costs far less than reading the items.
+        The partial counts of each partition are added together.
+        """
+
+        try:
+            logger.debug("Validating 'query' is valid.")
+
+            if query is None:
+                raise TypeError("'query' must be defined.")
+
+            logger.debug("'query' is valid.")
+        
+        except TypeError as e:
+            logger.exception("count exception -> Parameters are invalid: {0}".format(e))
+            raise
+
+        try:
+            logger.info("Counting items with: {0}".format(str(query)))
+
+            result = sum(self.container.query_items(
+                query.query_str,
+                parameters=query.build_where_params(),
+                **query.build_partition_options()))
+
+            logger.info("{0} items counted.".format(result))
+
+            return result
+
+        except Exception as e:
+            logger.exception("count exception -> Error counting items: {0}".format(e))
+            raise
+
+
+    def create(self, item: dict[str, any]) -> str:
+        """
+        Creates an item in the database, failing if an item with the same id already exists.
+
+        Parameters
+        ----------
+        item: dict[str, any]
+            The object's dictionary key value pair.
+
+        Returns
+        -------
+        str
+            The JSON document of the object created.
+
+        Raises
+        ------
+        TypeError
+            Raised if the parameter given is invalid.
+
+        ObjectConflictError
+            Raised if an item with the same id already exists.
+
+        Exception
+            Raised if an unexpected error occurs.
+
+        Remarks
+        -------
+        The existence check is done by the database in the same round trip as the write,
+        so two concurrent creates of the same item cannot both succeed.
+        """
+
+        try:
+            logger.debug("Validating parameter 'item' is valid.")
+
+            if item is None:
+                raise TypeError("The item must be defined.")
+
+            logger.debug("Parameter 'item' is valid.")
+
+        except TypeError as e:
+            logger.exception("create exception -> Parameter invalid: {0}".format(e))
+            raise
+
+        try:
+            logger.info("Creating item: {0}".format(json.dumps(item)))
+
+            result = self.container.create_item(item)
+            
+            # Convert result to json and return generic object.
+            j = json.dumps(result)
+
+            logger.info("Item created: {0}".format(j))
+
+            return j
+
+        except CosmosResourceExistsError as e:
+            logger.warning("create -> Item '{0}' already exists.".format(item.get("id")))
+            raise ObjectConflictError("Item '{0}' already exists.".format(item.get("id")))
+        
+        except Exception as e:
+            logger.exception("create exception -> Error creating item: {0}".format(e))
+            raise
+
+
     def upsert(self, item: dict[str, any]) -> str:
         """
         Upserts an item in the database.
@@ -277,6 +663,102 @@ class DbService():
             raise
     
     
+    def patch(self, id: str, partition_key: str, operations: list[dict[str, any]], etag: str = None, filter_predicate: str = None) -> str:
+        """
+        Applies partial updates to an item in the database.
+
+        Parameters
+        ----------
+        id: str
+            The unique id of the item being patched.
+
+        partition_key: str
+            The partition key used for the database item collection.
+
+        operations: list[dict[str, any]]
+            The patch operations to apply. Example:
+                operations = [
+                    { "op": "set", "path": "/account_name", "value": "Savings" }
+                ]
+
+        etag: str
+            Only patch the item if its '_etag' still matches. 'None' by default, which patches
+            the item whatever its version.
+
+        filter_predicate: str
+            Only patch the item if it matches this condition. Example: "FROM c WHERE c.balance >= 0".
+            'None' by default.
+
+        Returns
+        -------
+        str
+            The JSON document of the item after it was patched.
+
+        Raises
+        ------
+        ValueError
+            Raised if the parameters given are invalid.
+
+        NoResultsFoundError
+            Raised if the item does not exist.
+
+        PreconditionFailedError
+            Raised if the item's etag does not match or it does not match the filter predicate.
+
+        Exception
+            Raised if an unexpected error occurs.
+
+        Remarks
+        -------
+        Only the operations are sent to the database and the update is applied in one round trip,
+        so there is no read-modify-write of the whole item.
+        """
+
+        try:
+            logger.debug("Validating parameter 'id', 'partition_key' and 'operations'.")
+            
+            self.__validate_id_and_partition_key(id, partition_key)
+
+            if operations is None or len(operations) == 0:
+                raise ValueError("operations must be defined and not empty.")
+            
+            logger.debug("'id', 'partition_key' and 'operations' are valid.")
+
+        except ValueError as e:
+            logger.exception("patch exception -> Parameter invalid: {0}".format(e))
+            raise
+
+        try:
+            logger.info("Patching item by id: {0}".format(id))
+            logger.debug("id: {0}, partition_key: {1}, operations: {2}, etag: {3}, filter_predicate: {4}".format(id, partition_key, json.dumps(operations), etag, filter_predicate))
+
+            if etag is None:
+                result = self.container.patch_item(item=id, partition_key=partition_key, patch_operations=operations, filter_predicate=filter_predicate)
+
+            else:
+                result = self.container.patch_item(item=id, partition_key=partition_key, patch_operations=operations, filter_predicate=filter_predicate,
+                    etag=etag, match_condition=MatchConditions.IfNotModified)
+
+            # Convert result to json and return generic object.
+            j = json.dumps(result)
+
+            logger.info("Item patched: {0}".format(j))
+
+            return j
+
+        except CosmosResourceNotFoundError as e:
+            logger.warning("patch -> Could not find item by id {0} with partition key {1}.".format(id, partition_key))
+            raise NoResultsFoundError("Item '{0}' does not exist.".format(id))
+
+        except CosmosAccessConditionFailedError as e:
+            logger.warning("patch -> Precondition failed for item '{0}': {1}".format(id, e))
+            raise PreconditionFailedError("Item '{0}' was changed or does not meet the condition of the update.".format(id))
+
+        except Exception as e:
+            logger.exception("patch exception -> Error patching item: {0}".format(e))
+            raise
+
+
     def delete(self, id: str, partition_key: str) -> None:
         """
         Deletes an item from the database.
@@ -5,7 +5,7 @@ class Query:
     Specifies how to query the database
     """
 
-    def __init__(self, query_str: str, where_params: dict[str, any]=None, enable_cross_partition_query=True):
+    def __init__(self, query_str: str, where_params: dict[str, any]=None, enable_cross_partition_query=True, partition_key: str=None):
         """
         Parameters
         ----------
@@ -22,6 +22,10 @@ class Query:
 
         enable_cross_partition_query: bool
             Should be 'True' if the container is partitioned. 'True' by default.
+
+        partition_key: str
+            The partition key every result is in. The query is then only sent to that partition
+            instead of every partition. 'None' by default.
         
         Raises
         ------
@@ -34,6 +38,7 @@ class Query:
         self.query_str = query_str
         self.where_params = where_params
         self.enable_cross_partition_query = enable_cross_partition_query
+        self.partition_key = partition_key
 
 
     def build_where_params(self) -> list[dict[str, object]]:
@@ -55,10 +60,26 @@ class Query:
         return param_list
 
 
+    def build_partition_options(self) -> dict[str, any]:
+        """
+        Builds the partition options for the database API to use.
+
+        Returns
+        -------
+        dict[str, any]
+            The partition key if the query is scoped to one partition, otherwise whether the
+            query may span partitions.
+        """
+        if self.partition_key is not None:
+            return { "partition_key": self.partition_key }
+
+        return { "enable_cross_partition_query": self.enable_cross_partition_query }
+
+
     def __str__(self) -> str:
         formatted_where_params = "Not defined."
 
         if self.where_params is not None and len(self.where_params) > 0:
             formatted_where_params = json.dumps(self.where_params)
 
-        return "'query_str': '{0}' | 'where_params': '{1}' | 'enable_cross_partition_query': {2}".format(self.query_str, formatted_where_params, self.enable_cross_partition_query)
\ No newline at end of file
+        return "'query_str': '{0}' | 'where_params': '{1}' | 'enable_cross_partition_query': {2} | 'partition_key': '{3}'".format(self.query_str, formatted_where_params, self.enable_cross_partition_query, self.partition_key)
\ No newline at end of file
@@ -0,0 +1,333 @@
+import threading
+
+from src.db_service.Query import Query
+from src.exceptions.InvalidParameterError import InvalidParameterError
+
+class QueryTemplateRegistry():
+    """
+    Parameterized query text for each combination of a fixed set of filters, compiled once.
+
+    Remarks
+    -------
+    Each combination (shape) of the filters is compiled into canonical query text the first time
+    it is used, with the filter values, offset and limit passed as parameters. Requests of the
+    same shape therefore send the exact same query text, which lets the database reuse its cached
+    query plan. Only the shapes requests use are compiled, which is far fewer than every
+    combination. Queries filtering on the partition key filter are only sent to that partition.
+    The number of queries built from each template is counted to report template hit rates.
+
+    A sort is only combined with the filters an index can serve it with: filters on the sorted
+    field, and at most one equality filter whose field is ordered by ahead of the sorted field,
+    which needs a composite index of both fields. Any other sorted shape would read every item to
+    sort it, so it is rejected.
+
+    Methods
+    -------
+    build()
+        Builds a query from the template matching the filters given.
+
+    build_count()
+        Builds a query counting the results of the template matching the filters given.
+
+    get_stats()
+        Gets how often each template has been used.
+
+    get_composite_indexes()
+        Gets the pairs of fields sorted queries are ordered by, each needing a composite index.
+    """
+
+    def __init__(self, select_str: str, filters: dict[str, str], partition_key_filter: str = None, sorts: dict[str, tuple[str, dict[str, str]]] = None, count_str: str = None):
+        """
+        Parameters
+        ----------
+        select_str: str
+            The query text before the WHERE clause. Example: 'SELECT * FROM accounts'.
+
+        filters: dict[str, str]
+            The condition of each filter by filter name, in the order conditions are joined.
+            Each condition takes its value from the parameter '@<filter name>'.
+            Example:
+                filters = {
+                    "account_type": "accounts.account_type=@account_type"
+                }
+
+        partition_key_filter: str
+            The filter matching the partition key of the container by equality. Queries using it are scoped
+            to the partition of its value. 'None' by default, meaning every query spans partitions.
+
+        sorts: dict[str, tuple[str, dict[str, str]]]
+            The field each sort orders by and the filters it can be combined with, by sort name. Each filter
+            maps to the field ordered by ahead of the sorted one, or 'None' if it filters the sorted field.
+            'None' by default, meaning queries cannot be sorted.
+            Example:
+                sorts = {
+                    "balance": ("accounts.balance_cents", {
+                        "account_type": "accounts.account_type",
+                        "min_balance": None
+                    })
+                }
+
+        count_str: str
+            The count query text before the WHERE clause. Example: 'SELECT VALUE COUNT(1) FROM accounts'.
+            'None' by default, meaning results cannot be counted.
+
+        Raises
+        ------
+        ValueError
+            Raised if the select_str or filters are not defined, or the partition_key_filter or a sort's filter is not a filter.
+        """
+
+        if select_str is None or select_str.isspace():
+            raise ValueError("'select_str' must be defined.")
+
+        if filters is None or len(filters) == 0:
+            raise ValueError("'filters' must be defined.")
+
+        if partition_key_filter is not None and partition_key_filter not in filters:
+            raise ValueError("'partition_key_filter' must be one of the filters.")
+
+        sorts = dict[str, tuple[str, dict[str, str]]]() if sorts is None else sorts
+
+        for name, (_, sort_filters) in sorts.items():
+            if any(filter_name not in filters for filter_name in sort_filters):
+                raise ValueError("The filters of sort '{0}' must be filters.".format(name))
+
+        self.select_str = select_str
+        self.partition_key_filter = partition_key_filter
+        self.filter_names = list(filters.keys())
+        self.sorts = sorts
+        self.count_str = count_str
+        self.queries = 0
+        self.__lock = threading.Lock()
+        self.__uses = dict[tuple, int]()
+        self.__filters = dict(filters)
+        self.__templates = dict[tuple, str]()
+        self.__count_templates = dict[tuple, str]()
+
+
+    def build(self, params: dict[str, any], offset: int = None, limit: int = None, order_by: str = None, descending: bool = False, select_str: str = None) -> Query:
+        """
+        Builds a query from the template matching the filters given.
+
+        Parameters
+        ----------
+        params: dict[str, any]
+            The value of each filter by filter name. Filters that are 'None' or not given are not applied.
+
+        offset: int
+            The number of results skipped. The query is not paged with OFFSET/LIMIT if 'None'.
+
+        limit: int
+            The maximum number of results. Required if offset is given.
+
+        order_by: str
+            The name of the sort results are ordered by. Not sorted if 'None'.
+
+        descending: bool
+            Whether results are sorted in descending order. 'False' by default.
+
+        select_str: str
+            The query text before the WHERE clause, replacing the registry's to project the results.
+            Example: 'SELECT accounts.account_id FROM accounts'. The registry's select_str is used if 'None'.
+
+        Returns
+        -------
+        Query
+            The query using the shared template text, scoped to one partition if it filters on the partition key.
+
+        Raises
+        ------
+        ValueError
+            Raised if a filter or the sort is unknown, or the limit is missing.
+
+        InvalidParameterError
+            Raised if the sort cannot be combined with the filters without reading every item.
+        """
+
+        unknown = [name for name in params if name not in self.filter_names]
+
+        if len(unknown) > 0:
+            raise ValueError("Unknown filter(s) {0}.".format(", ".join(unknown)))
+
+        use_offset = offset is not None
+
+        if use_offset and limit is None:
+            raise ValueError("'limit' must be defined when 'offset' is.")
+
+        if order_by is not None and order_by not in self.sorts:
+            raise ValueError("Unknown sort '{0}'.".format(order_by))
+
+        names = tuple(name for name in self.filter_names if params.get(name) is not None)
+        sort = None
+
+        if order_by is not None:
+            self.__validate_sort(names, order_by)
+            sort = (order_by, descending)
+
+        shape = (names, use_offset, sort, select_str)
+        where_params = dict[str, any]()
+
+        for name in names:
+            where_params["@" + name] = params[name]
+
+        if use_offset:
+            where_params["@offset"] = offset
+            where_params["@limit"] = limit
+
+        with self.__lock:
+            template = self.__templates.get(shape)
+
+            if template is None:
+                template = self.__templates[shape] = self.__compile(names, use_offset, sort, select_str)
+
+            self.queries += 1
+            self.__uses[shape] = self.__uses.get(shape, 0) + 1
+
+        partition_key = None if self.partition_key_filter is None else params.get(self.partition_key_filter)
+
+        return Query(template, where_params, partition_key=partition_key)
+
+
+    def build_count(self, params: dict[str, any]) -> Query:
+        """
+        Builds a query counting the results of the template matching the filters given.
+
+        Parameters
+        ----------
+        params: dict[str, any]
+            The value of each filter by filter name. Filters that are 'None' or not given are not applied.
+
+        Returns
+        -------
+        Query
+            The count query, with the same parameters and partition as the template's query.
+
+        Raises
+        ------
+        ValueError
+            Raised if a filter is unknown or results cannot be counted.
+
+        Remarks
+        -------
+        Count templates are compiled when first used and are not counted in get_stats().
+        """
+
+        if self.count_str is None:
+            raise ValueError("'count_str' must be defined to count results.")
+
+        unknown = [name for name in params if name not in self.filter_names]
+
+        if len(unknown) > 0:
+            raise ValueError("Unknown filter(s) {0}.".format(", ".join(unknown)))
+
+        names = tuple(name for name in self.filter_names if params.get(name) is not None)
+
+        with self.__lock:
+            template = self.__count_templates.get(names)
+
+            if template is None:
+                template = self.__count_templates[names] = self.__compile(names, False, None, self.count_str)
+
+        partition_key = None if self.partition_key_filter is None else params.get(self.partition_key_filter)
+
+        return Query(template, { "@" + name: params[name] for name in names }, partition_key=partition_key)
+
+
+    def get_stats(self) -> dict[str, any]:
+        """
+        Gets how often each template has been used.
+
+        Returns
+        -------
+        dict[str, any]
+            The number of templates compiled, the number of queries built and the share of them
+            built by each shape, keyed by its filter names joined with '+' ('none' if unfiltered),
+            suffixed with ':paged' if paged with OFFSET/LIMIT, with ':<sort> asc|desc' if sorted and
+            with ':projected' if built with its own select_str.
+        """
+
+        with self.__lock:
+            queries = self.queries
+            uses = dict(self.__uses)
+
+        shapes = dict[str, float]()
+
+        for (names, use_offset, sort, select_str), count in uses.items():
+            shape = "{0}{1}{2}{3}".format(
+                "+".join(names) if len(names) > 0 else "none",
+                ":paged" if use_offset else "",
+                "" if sort is None else ":{0} {1}".format(sort[0], "desc" if sort[1] else "asc"),
+                "" if select_str is None else ":projected")
+            shapes[shape] = shapes.get(shape, 0) + count / queries
+
+        return {
+            "templates": len(self),
+            "queries": queries,
+            "shapes": shapes
+        }
+
+
+    def get_composite_indexes(self) -> list[tuple[str, str]]:
+        """
+        Gets the pairs of fields sorted queries are ordered by, each needing a composite index.
+
+        Returns
+        -------
+        list[tuple[str, str]]
+            The field of each equality filter and the field of the sort it is combined with, in the
+            order they are sorted by. An ascending index on both serves both sort orders.
+        """
+
+        indexes = list[tuple[str, str]]()
+
+        for field, sort_filters in self.sorts.values():
+            for ahead in sort_filters.values():
+                if ahead is not None and (ahead, field) not in indexes:
+                    indexes.append((ahead, field))
+
+        return indexes
+
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__templates)
+
+
+    """
+    Private Methods
+    """
+
+    # Rejects a sorted shape that no index can serve.
+    def __validate_sort(self, names: tuple[str], order_by: str):
+        sort_filters = self.sorts[order_by][1]
+        unsorted = [name for name in names if name not in sort_filters]
+
+        if len(unsorted) > 0:
+            raise InvalidParameterError("Results filtered by {0} cannot be sorted by '{1}' without reading every item.".format(", ".join(unsorted), order_by))
+
+        ahead = [name for name in names if sort_filters[name] is not None]
+
+        if len(ahead) > 1:
+            raise InvalidParameterError("Results sorted by '{0}' can only be filtered by one of {1} at a time.".format(order_by, ", ".join(ahead)))
+
+
+    # Compiles the query text of a shape.
+    def __compile(self, names: tuple[str], use_offset: bool, sort: tuple[str, bool], select_str: str = None) -> str:
+        query_str = self.select_str if select_str is None else select_str
+
+        if len(names) > 0:
+            query_str += " WHERE " + " AND ".join(self.__filters[name] for name in names)
+
+        if sort is not None:
+            order_by, descending = sort
+            field, sort_filters = self.sorts[order_by]
+            direction = " DESC" if descending else " ASC"
+
+            # An equality filter's field is ordered by first so the composite index of both fields serves the query.
+            fields = [sort_filters[name] for name in names if sort_filters[name] is not None] + [field]
+            query_str += " ORDER BY " + ", ".join(ordered + direction for ordered in fields)
+
+        if use_offset:
+            query_str += " OFFSET @offset LIMIT @limit"
+
+        return query_str
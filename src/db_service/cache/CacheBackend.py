@@ -0,0 +1,69 @@
+class CacheBackend():
+    """
+    A store of database documents used by CachedDbService.
+
+    Remarks
+    -------
+    Backends only store and return documents. Keying, invalidation and staleness checks are
+    handled by CachedDbService, so any key value store can be plugged in.
+
+    Methods
+    -------
+    get()
+        Gets a document from the cache.
+
+    set()
+        Sets a document in the cache.
+
+    delete()
+        Removes a document from the cache.
+    """
+
+    async def get(self, key: str) -> dict[str, any]:
+        """
+        Gets a document from the cache.
+
+        Parameters
+        ----------
+        key: str
+            The key of the document.
+
+        Returns
+        -------
+        dict[str, any]
+            The cached document. 'None' if it is not cached.
+        """
+
+        raise NotImplementedError()
+
+
+    async def set(self, key: str, document: dict[str, any], ttl_seconds: int) -> None:
+        """
+        Sets a document in the cache.
+
+        Parameters
+        ----------
+        key: str
+            The key of the document.
+
+        document: dict[str, any]
+            The document to cache.
+
+        ttl_seconds: int
+            The time in seconds the document is cached for.
+        """
+
+        raise NotImplementedError()
+
+
+    async def delete(self, key: str) -> None:
+        """
+        Removes a document from the cache if it is cached.
+
+        Parameters
+        ----------
+        key: str
+            The key of the document.
+        """
+
+        raise NotImplementedError()
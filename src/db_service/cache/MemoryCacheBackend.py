@@ -0,0 +1,34 @@
+from src.db_service.cache.CacheBackend import CacheBackend
+from src.libs.utils.TtlCache import TtlCache
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Caches documents in the memory of this process in a bounded LRU.
+
+    Remarks
+    -------
+    Each process has its own cache, so writes made by other processes are only seen once
+    the cached document expires or a conditional write finds it is stale.
+    """
+
+    def __init__(self, max_size: int):
+        """
+        Parameters
+        ----------
+        max_size: int
+            The maximum number of documents cached.
+        """
+
+        self.cache = TtlCache(max_size)
+
+
+    async def get(self, key: str) -> dict[str, any]:
+        return self.cache.get(key)
+
+
+    async def set(self, key: str, document: dict[str, any], ttl_seconds: int) -> None:
+        self.cache.set(key, document, ttl_seconds)
+
+
+    async def delete(self, key: str) -> None:
+        self.cache.delete(key)
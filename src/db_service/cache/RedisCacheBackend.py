@@ -0,0 +1,40 @@
+import json
+
+from src.db_service.cache.CacheBackend import CacheBackend
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Caches documents in Redis, or any server compatible with the Redis protocol, so every
+    process shares one cache.
+    """
+
+    def __init__(self, client: any, key_prefix: str = "cache:"):
+        """
+        Parameters
+        ----------
+        client: any
+            An asyncio Redis client, such as 'redis.asyncio.Redis'.
+
+        key_prefix: str
+            Prefix added to every key. 'cache:' by default.
+        """
+
+        self.client = client
+        self.key_prefix = key_prefix
+
+
+    async def get(self, key: str) -> dict[str, any]:
+        value = await self.client.get(self.key_prefix + key)
+
+        if value is None:
+            return None
+
+        return json.loads(value)
+
+
+    async def set(self, key: str, document: dict[str, any], ttl_seconds: int) -> None:
+        await self.client.set(self.key_prefix + key, json.dumps(document), ex=ttl_seconds)
+
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(self.key_prefix + key)
@@ -1,12 +1,23 @@
+import logging as logger
+import threading
+
 from src.token_helper.TokenHelper import TokenHelper
 from src.db_service.DbService import DbService
+from src.db_service.AsyncDbService import AsyncDbService
+from src.libs.utils.TtlCache import TtlCache
 
 class TokenHelperInjector:
     """
     Injects a token helper service.
+
+    Remarks
+    -------
+    One TokenHelper is built up front and shared by every request. It holds no per-request
+    state, so it is safe to share across threads and tasks. Use rotate_key() to swap the key
+    without restarting the application.
     """
 
-    def __init__(self, secret_key: str, algorithm: str, access_token_expire_minutes: int):
+    def __init__(self, secret_key: str, algorithm: str, access_token_expire_minutes: int, token_cache_size: int = 0):
         """
         Creates a new TokenHelperInjector.
 
@@ -20,11 +31,20 @@ class TokenHelperInjector:
 
         access_token_expire_minutes: int
             The time in minutes for the token to expire.
+
+        token_cache_size: int
+            The maximum number of verified tokens to cache. 0 by default, which disables the cache.
+
+        Raises
+        ------
+        ValueError
+            Raised if the secret key or algorithm are undefined.
         """
 
-        self.secret_key = secret_key
-        self.algorithm = algorithm
         self.access_token_expires_minutes = access_token_expire_minutes
+        self.token_cache_size = token_cache_size
+        self.__lock = threading.Lock()
+        self.token_helper = self.__build_token_helper(secret_key, algorithm)
 
     def __call__(self) -> TokenHelper:
         """
@@ -33,10 +53,46 @@ class TokenHelperInjector:
         Returns
         -------
         TokenHelper
-            The token helper instance.
+            The shared token helper instance.
+        """
+
+        return self.token_helper
+
+    def rotate_key(self, secret_key: str, algorithm: str = None) -> None:
+        """
+        Replaces the key used to sign and verify tokens.
+
+        Parameters
+        ----------
+        secret_key: str
+            The new secret key to sign tokens with.
+
+        algorithm: str
+            The new algorithm to encrypt tokens with. The current algorithm if 'None'.
+
+        Raises
+        ------
+        ValueError
+            Raised if the secret key or algorithm are undefined.
+
+        Remarks
+        -------
+        The new token helper is fully built before it is swapped in, so requests in flight keep
+        using the old key. Tokens verified with the old key are not carried over to the new
+        key's cache.
         """
 
-        return TokenHelper(self.secret_key, self.algorithm, self.access_token_expires_minutes)
+        with self.__lock:
+            algorithm = self.token_helper.algo if algorithm is None else algorithm
+            self.token_helper = self.__build_token_helper(secret_key, algorithm)
+
+        logger.info("Token key rotated.")
+
+    # Builds a token helper with its own verified token cache.
+    def __build_token_helper(self, secret_key: str, algorithm: str) -> TokenHelper:
+        token_cache = TtlCache(self.token_cache_size) if self.token_cache_size > 0 else None
+
+        return TokenHelper(secret_key, algorithm, self.access_token_expires_minutes, token_cache)
 
 
 class DbServiceInjector:
@@ -60,6 +116,11 @@ class DbServiceInjector:
         """
         Calls the DbServiceInjector instance.
 
+        Remarks
+        -------
+        The connection is pooled by the client registry, so this only opens a
+        connection if it was not already opened on startup.
+
         Returns
         -------
         DbService
@@ -67,4 +128,40 @@ class DbServiceInjector:
         """
 
         self.db_service.connect()
+        return self.db_service
+
+
+class AsyncDbServiceInjector:
+    """
+    Injects an async database service.
+    """
+
+    def __init__(self, db_service: AsyncDbService):
+        """
+        Creates a new AsyncDbServiceInjector.
+
+        Parameters
+        ----------
+        db_service: AsyncDbService
+            The async database service to inject.
+        """
+
+        self.db_service = db_service
+
+    async def __call__(self) -> AsyncDbService:
+        """
+        Calls the AsyncDbServiceInjector instance.
+
+        Remarks
+        -------
+        The connection is pooled by the async client registry, so this only opens a
+        connection if it was not already opened on startup.
+
+        Returns
+        -------
+        AsyncDbService
+            The async db service instance.
+        """
+
+        await self.db_service.connect()
         return self.db_service
\ No newline at end of file
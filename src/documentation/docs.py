@@ -4,8 +4,16 @@ __all__ = [
     "version",
     "tags_metadata",
     "get_accounts_responses",
+    "get_my_accounts_responses",
+    "get_accounts_summary_responses",
+    "get_account_query_stats_responses",
+    "export_accounts_responses",
     "post_account_responses",
-    "put_account_responses"
+    "post_accounts_bulk_responses",
+    "post_accounts_bulk_request",
+    "batch_get_accounts_responses",
+    "put_account_responses",
+    "adjust_account_balance_responses"
 ]
 
 app_title = "My Finance Advisor Banking API"
@@ -24,6 +32,141 @@ tags_metadata = [
 ]
 
 get_accounts_responses = {
+    304: {
+        "description": "The account has not changed since the etag given in 'If-None-Match'."
+    },
+    400: {
+        "description": "Parameters are invalid.",
+        "content": {
+            "application/json": {
+                "example": {"status_code": 0, "detail": "string"}
+            }
+        }
+    },
+    401: {
+        "description": "Access Denied.",
+        "content": {
+            "application/json": {
+                "example": {"status_code": 0, "detail": "string"}
+            }
+        }
+    },
+    404: {
+        "description": "No accounts found based on search parameters.",
+        "content": {
+            "application/json": {
+                "example": {"status_code": 0, "detail": "string"}
+            }
+        }
+    },
+    500: {
+        "description": "Error occurred getting accounts or unexpected error.",
+        "content": {
+            "application/json": {
+                "example": {"status_code": 0, "detail": "string"}
+            }
+        }
+    }
+}
+
+get_my_accounts_responses = {
+    400: {
+        "description": "Parameters given are invalid.",
+        "content": {
+            "application/json": {
+                "example": {"status_code": 0, "detail": "string"}
+            }
+        }
+    },
+    401: {
+        "description": "Access Denied.",
+        "content": {
+            "application/json": {
+                "example": {"status_code": 0, "detail": "string"}
+            }
+        }
+    },
+    404: {
+        "description": "You have no accounts.",
+        "content": {
+            "application/json": {
+                "example": {"status_code": 0, "detail": "string"}
+            }
+        }
+    },
+    500: {
+        "description": "Error occurred getting your accounts or unexpected error.",
+        "content": {
+            "application/json": {
+                "example": {"status_code": 0, "detail": "string"}
+            }
+        }
+    }
+}
+
+get_accounts_summary_responses = {
+    400: {
+        "description": "Parameters are invalid.",
+        "content": {
+            "application/json": {
+                "example": {"status_code": 0, "detail": "string"}
+            }
+        }
+    },
+    401: {
+        "description": "Access Denied.",
+        "content": {
+            "application/json": {
+                "example": {"status_code": 0, "detail": "string"}
+            }
+        }
+    },
+    404: {
+        "description": "No accounts found based on parameters given.",
+        "content": {
+            "application/json": {
+                "example": {"status_code": 0, "detail": "string"}
+            }
+        }
+    },
+    500: {
+        "description": "Error occurred getting the summary or unexpected error.",
+        "content": {
+            "application/json": {
+                "example": {"status_code": 0, "detail": "string"}
+            }
+        }
+    }
+}
+
+get_account_query_stats_responses = {
+    401: {
+        "description": "Access Denied.",
+        "content": {
+            "application/json": {
+                "example": {"status_code": 0, "detail": "string"}
+            }
+        }
+    },
+    500: {
+        "description": "Unexpected error.",
+        "content": {
+            "application/json": {
+                "example": {"status_code": 0, "detail": "string"}
+            }
+        }
+    }
+}
+
+export_accounts_responses = {
+    200: {
+        "description": "Accounts as newline-delimited JSON, one account per line.",
+        "content": {
+            "application/x-ndjson": {
+                "example": "{\"account_id\": \"string\", \"account_name\": \"string\", \"account_type\": \"string\", \"account_institution\": \"string\", \"balance\": \"0.00\"}\n"
+            }
+        }
+    },
     400: {
         "description": "Parameters are invalid.",
         "content": {
@@ -93,6 +236,80 @@ post_account_responses = {
     }
 }
 
+post_accounts_bulk_responses = {
+    400: {
+        "description": "Body is not a list of accounts, is empty or has too many accounts.",
+        "content": {
+            "application/json": {
+                "example": {"status_code": 0, "detail": "string"}
+            }
+        }
+    },
+    401: {
+        "description": "Access Denied.",
+        "content": {
+            "application/json": {
+                "example": {"status_code": 0, "detail": "string"}
+            }
+        }
+    },
+    500: {
+        "description": "Unexpected error.",
+        "content": {
+            "application/json": {
+                "example": {"status_code": 0, "detail": "string"}
+            }
+        }
+    }
+}
+
+post_accounts_bulk_request = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {
+                "schema": {
+                    "type": "array",
+                    "items": {"$ref": "#/components/schemas/AccountModel"}
+                }
+            },
+            "application/x-ndjson": {
+                "schema": {
+                    "type": "string",
+                    "description": "One AccountModel JSON object per line."
+                }
+            }
+        }
+    }
+}
+
+batch_get_accounts_responses = {
+    400: {
+        "description": "No account ids given, too many account ids or an account id is invalid.",
+        "content": {
+            "application/json": {
+                "example": {"status_code": 0, "detail": "string"}
+            }
+        }
+    },
+    401: {
+        "description": "Access Denied.",
+        "content": {
+            "application/json": {
+                "example": {"status_code": 0, "detail": "string"}
+            }
+        }
+    },
+    500: {
+        "description": "Unexpected error.",
+        "content": {
+            "application/json": {
+                "example": {"status_code": 0, "detail": "string"}
+            }
+        }
+    }
+}
+
 put_account_responses = {
     400: {
         "description": "Parameters are invalid.",
@@ -118,6 +335,14 @@ put_account_responses = {
             }
         }
     },
+    412: {
+        "description": "Account was changed since the etag given was read.",
+        "content": {
+            "application/json": {
+                "example": {"status_code": 0, "detail": "string"}
+            }
+        }
+    },
     500: {
         "description": "Error occurred getting accounts or unexpected error.",
         "content": {
@@ -126,4 +351,55 @@ put_account_responses = {
             }
         }
     }
+}
+
+adjust_account_balance_responses = {
+    400: {
+        "description": "Parameters are invalid.",
+        "content": {
+            "application/json": {
+                "example": {"status_code": 0, "detail": "string"}
+            }
+        }
+    },
+    401: {
+        "description": "Access Denied.",
+        "content": {
+            "application/json": {
+                "example": {"status_code": 0, "detail": "string"}
+            }
+        }
+    },
+    404: {
+        "description": "No account found for account_id given.",
+        "content": {
+            "application/json": {
+                "example": {"status_code": 0, "detail": "string"}
+            }
+        }
+    },
+    409: {
+        "description": "Balance is not enough for the adjustment.",
+        "content": {
+            "application/json": {
+                "example": {"status_code": 0, "detail": "string"}
+            }
+        }
+    },
+    500: {
+        "description": "Error occurred adjusting the balance or unexpected error.",
+        "content": {
+            "application/json": {
+                "example": {"status_code": 0, "detail": "string"}
+            }
+        }
+    },
+    503: {
+        "description": "The account is changing too often to adjust. Try again after 'Retry-After' seconds.",
+        "content": {
+            "application/json": {
+                "example": {"status_code": 0, "detail": "string"}
+            }
+        }
+    }
 }
\ No newline at end of file
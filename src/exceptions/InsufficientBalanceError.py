@@ -0,0 +1,16 @@
+
+class InsufficientBalanceError(Exception):
+    """
+    The balance is not enough to apply the change.
+    """
+
+    def __init__(self, message: str = None):
+        """
+        Parameters
+        ----------
+        message: str
+            Message to include in the exception.
+        """
+
+        self.message = message
+        super().__init__(self, message)
\ No newline at end of file
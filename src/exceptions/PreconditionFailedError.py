@@ -0,0 +1,16 @@
+
+class PreconditionFailedError(Exception):
+    """
+    The object was changed or does not meet the condition the operation required.
+    """
+
+    def __init__(self, message: str = None):
+        """
+        Parameters
+        ----------
+        message: str
+            Message to include in the exception.
+        """
+
+        self.message = message
+        super().__init__(self, message)
\ No newline at end of file
@@ -1,7 +1,13 @@
 import logging as logger
+import orjson
 
 from src.libs.api_models.AccountModel import AccountModel
 from src.data_models.Account import Account
+from src.libs.utils.balance import from_cents
+
+# The API model fields with their defaults, read once instead of on every mapping.
+_account_api_model_fields = tuple((name, field.default) for name, field in AccountModel.__fields__.items())
+_account_api_model_field_names = tuple(name for name, _ in _account_api_model_fields)
 
 def map_to_account_api_model(payload: dict[str, any]) -> AccountModel:
     """
@@ -39,7 +45,7 @@ def map_to_account_api_model(payload: dict[str, any]) -> AccountModel:
         account.account_name = payload["account_name"]
         account.account_type = payload["account_type"]
         account.account_institution = payload["account_institution"]
-        account.balance = payload["balance"]
+        account.balance = __get_balance(payload)
 
         logger.debug("Payload converted to account model: {0}".format(account.__str__()))
 
@@ -123,4 +129,110 @@ def map_to_account_api_models(payload: list[dict[str, any]]) -> list:
 
     except Exception as e:
         logger.error("map_to_account_api_models exception -> An error occurred mapping multiple account models: {0}".format(e))
-        raise
\ No newline at end of file
+        raise
+
+
+def map_to_account_api_fields(payload: dict[str, any], fields: list[str]) -> dict[str, any]:
+    """
+    Maps the account data model to only the given fields of the account API model.
+
+    Parameters
+    ----------
+    payload: dict[str, any]
+        The account document, or the projection of it holding the data model fields of the API model fields.
+
+    fields: list[str]
+        The account API model fields to map.
+
+    Returns
+    -------
+    dict[str, any]
+        The value of each field by field name. Fields missing from the payload use the API model defaults.
+
+    Raises
+    ------
+    TypeError
+        Raised if the payload passed is None.
+    """
+
+    if payload is None:
+        logger.error("map_to_account_api_fields exception -> Cannot map empty JSON payload to model.")
+        raise TypeError("Cannot map empty JSON payload to model.")
+
+    content = { name: payload.get(name, default) for name, default in _account_api_model_fields if name in fields }
+
+    if "balance" in content and payload.get("balance_cents") is not None:
+        content["balance"] = from_cents(payload["balance_cents"])
+
+    return content
+
+
+def map_to_account_data_model_fields(fields: list[str]) -> list[str]:
+    """
+    Gets the account data model fields the given account API model fields are mapped from.
+
+    Parameters
+    ----------
+    fields: list[str]
+        The account API model fields.
+
+    Returns
+    -------
+    list[str]
+        The data model fields to read, such as for projecting a query to only the fields needed.
+    """
+
+    data_model_fields = list[str]()
+
+    for name in fields:
+        data_model_fields.extend(("balance", "balance_cents") if name == "balance" else (name,))
+
+    return data_model_fields
+
+
+def map_to_account_api_result_json(payload: dict[str, any], page: int, fields: list[str] = None) -> bytes:
+    """
+    Maps an account data model straight to the JSON of an API result holding the account API model.
+
+    Parameters
+    ----------
+    payload: dict[str, any]
+        The account document read from the database.
+
+    page: int
+        Page number of the result.
+
+    fields: list[str]
+        The account API model fields the content is limited to. Every field if 'None'.
+
+    Returns
+    -------
+    bytes
+        The JSON of the API result. Same shape as an ApiResult with an AccountModel as its content.
+
+    Raises
+    ------
+    TypeError
+        Raised if the payload passed is None.
+
+    Remarks
+    -------
+    This is the fast path for reading one account. It skips building the pydantic models and
+    serializes the result once.
+    """
+
+    if payload is None:
+        logger.error("map_to_account_api_result_json exception -> Cannot map empty JSON payload to model.")
+        raise TypeError("Cannot map empty JSON payload to model.")
+
+    content = map_to_account_api_fields(payload, _account_api_model_field_names if fields is None else fields)
+
+    return orjson.dumps({ "content": content, "results": 1, "page": page, "continuation_token": None, "total": None })
+
+
+# Gets the balance of an account document, from its cents if it has them.
+def __get_balance(payload: dict[str, any]) -> str:
+    if payload.get("balance_cents") is not None:
+        return from_cents(payload["balance_cents"])
+
+    return payload["balance"]
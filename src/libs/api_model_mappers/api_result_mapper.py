@@ -2,7 +2,7 @@ import logging as logger
 
 from src.libs.api_models.ApiResult import ApiResult
 
-def map_to_api_result(content: any, results: int, page: int) -> ApiResult:
+def map_to_api_result(content: any, results: int, page: int, continuation_token: str = None, total: int = None) -> ApiResult:
     """
     Maps the content to an API result.
 
@@ -17,6 +17,12 @@ def map_to_api_result(content: any, results: int, page: int) -> ApiResult:
     page: int
         Page number of current results.
 
+    continuation_token: str
+        Opaque token for the next page of results. 'None' by default.
+
+    total: int
+        Number of results across every page. 'None' by default.
+
     Raises
     ----------
     TypeError
@@ -44,7 +50,7 @@ def map_to_api_result(content: any, results: int, page: int) -> ApiResult:
         logger.debug("'page' parameter valid.")
         logger.debug("Creating API result")
 
-        result = ApiResult(content=content, results=results, page=page)
+        result = ApiResult(content=content, results=results, page=page, continuation_token=continuation_token, total=total)
 
         logger.debug("API results created.")
 
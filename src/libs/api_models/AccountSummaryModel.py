@@ -0,0 +1,29 @@
+from pydantic import BaseModel
+
+class AccountSummaryModel(BaseModel):
+    """
+    Totals of the accounts sharing an owner, institution or account type.
+
+    Parameters
+    ----------
+    dimension: str
+        What the accounts are summarized by: 'owner', 'institution' or 'type'.
+
+    value: str
+        The owner, institution or account type the accounts share.
+
+    count: int
+        The number of accounts.
+
+    balance: str
+        The total balance of the accounts.
+    """
+
+    dimension: str = None
+    value: str = None
+    count: int = 0
+    balance: str = "0.00"
+
+
+    def __str__(self) -> str:
+        return "'dimension': '{0}' | 'value': '{1}' | 'count': {2} | 'balance': '${3}'".format(self.dimension, self.value, self.count, self.balance)
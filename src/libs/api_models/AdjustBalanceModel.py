@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+
+class AdjustBalanceModel(BaseModel):
+    """
+    A change to apply to an account's balance.
+
+    Parameters
+    ----------
+    amount: str
+        The amount to add to the balance, with exactly 2 decimal places. Negative to subtract.
+        Example: '-25.00'.
+
+    allow_negative: bool
+        Whether the balance may go below 0.00. 'False' by default.
+    """
+
+    amount: str = None
+    allow_negative: bool = False
+
+
+    def __str__(self) -> str:
+        return "'amount': '${0}' | 'allow_negative': {1}".format(self.amount, self.allow_negative)
\ No newline at end of file
@@ -15,6 +15,13 @@ class ApiResult(BaseModel):
     page: int
         The current page number where the results were retrieved.
 
+    continuation_token: str
+        Opaque token to pass back to get the next page when paging with a cursor.
+        'None' if there are no more pages or the results were not paged with a cursor.
+
+    total: int
+        The number of results across every page. 'None' unless it was requested.
+
     Remarks
     -------
     This should only be used for returning content on successful status codes.
@@ -23,3 +30,5 @@ class ApiResult(BaseModel):
     content: object = None
     results: int = 0
     page: int = 0
+    continuation_token: str = None
+    total: int = None
@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+
+class BatchGetAccountsModel(BaseModel):
+    """
+    The accounts to get in one call.
+
+    Parameters
+    ----------
+    account_ids: list[str]
+        The account ids of the accounts to get.
+    """
+
+    account_ids: list[str] = None
+
+
+    def __str__(self) -> str:
+        return "'account_ids': {0}".format(self.account_ids)
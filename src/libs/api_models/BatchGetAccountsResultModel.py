@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+
+from src.libs.api_models.AccountModel import AccountModel
+
+class BatchGetAccountsResultModel(BaseModel):
+    """
+    The result of getting many accounts in one call.
+
+    Parameters
+    ----------
+    found: list[AccountModel]
+        The accounts found, in the order their account ids were given.
+
+    missing: list[str]
+        The account ids of the accounts not found.
+    """
+
+    found: list[AccountModel] = []
+    missing: list[str] = []
+
+
+    def __str__(self) -> str:
+        return "'found': {0} | 'missing': {1}".format(len(self.found), self.missing)
@@ -0,0 +1,29 @@
+from pydantic import BaseModel
+
+class BulkItemResultModel(BaseModel):
+    """
+    The result of one item in a bulk operation.
+
+    Parameters
+    ----------
+    index: int
+        The position of the item in the request.
+
+    account_id: str
+        The account id of the item. 'None' if the item could not be read.
+
+    status_code: int
+        The HTTP status code the item would have had as a single request.
+
+    detail: str
+        Details on why the item failed. 'None' if it succeeded.
+    """
+
+    index: int = 0
+    account_id: str = None
+    status_code: int = 0
+    detail: str = None
+
+
+    def __str__(self) -> str:
+        return "'index': {0} | 'account_id': '{1}' | 'status_code': {2} | 'detail': '{3}'".format(self.index, self.account_id, self.status_code, self.detail)
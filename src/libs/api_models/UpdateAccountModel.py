@@ -13,12 +13,17 @@ class UpdateAccountModel(BaseModel):
         The new account name.
     balance: str
         The new balance of the account. 
+
+    etag: str
+        Only update the account if it has not changed since it was read with this etag.
+        Optional. The 'If-Match' header can be used instead.
     """
     
     account_id: str = None
     account_name: str = None
     balance: str = None
+    etag: str = None
 
     
     def __str__(self) -> str:
-        return "'account_id': '{0}' | 'account_name': '{1}' | 'balance': '${2}'".format(self.account_id, self.account_name, self.balance)
\ No newline at end of file
+        return "'account_id': '{0}' | 'account_name': '{1}' | 'balance': '${2}' | 'etag': '{3}'".format(self.account_id, self.account_name, self.balance, self.etag)
\ No newline at end of file
@@ -0,0 +1,142 @@
+import threading
+import time
+
+from collections import OrderedDict
+
+class TtlCache():
+    """
+    A bounded, thread-safe, in-process LRU cache whose entries expire after a time to live.
+
+    Methods
+    -------
+    get()
+        Gets a value from the cache.
+
+    set()
+        Sets a value in the cache.
+
+    delete()
+        Removes a value from the cache.
+
+    clear()
+        Removes every value from the cache.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float = None):
+        """
+        Parameters
+        ----------
+        max_size: int
+            The maximum number of entries kept. The least recently used entry is evicted
+            when full. A size of 0 or less disables the cache.
+
+        ttl_seconds: float
+            The default time in seconds an entry lives. 'None' by default, meaning entries
+            only leave the cache when evicted or removed.
+        """
+
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.__lock = threading.Lock()
+        self.__entries = OrderedDict[any, tuple[any, float]]()
+
+
+    def get(self, key: any, default: any = None) -> any:
+        """
+        Gets a value from the cache.
+
+        Parameters
+        ----------
+        key: any
+            The key of the value.
+
+        default: any
+            The value returned if the key is not cached or has expired. 'None' by default.
+
+        Returns
+        -------
+        any
+            The cached value or the default.
+        """
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return default
+
+            value, expires_at = entry
+
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self.__entries[key]
+                self.misses += 1
+                return default
+
+            self.__entries.move_to_end(key)
+            self.hits += 1
+
+            return value
+
+
+    def set(self, key: any, value: any, ttl_seconds: float = None) -> None:
+        """
+        Sets a value in the cache.
+
+        Parameters
+        ----------
+        key: any
+            The key of the value.
+
+        value: any
+            The value to cache.
+
+        ttl_seconds: float
+            The time in seconds this entry lives. The cache's default time to live if 'None'.
+        """
+
+        if self.max_size <= 0:
+            return
+
+        ttl_seconds = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires_at = None if ttl_seconds is None else time.monotonic() + ttl_seconds
+
+        with self.__lock:
+            self.__entries[key] = (value, expires_at)
+            self.__entries.move_to_end(key)
+
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+
+    def delete(self, key: any) -> None:
+        """
+        Removes a value from the cache if it is cached.
+
+        Parameters
+        ----------
+        key: any
+            The key of the value to remove.
+        """
+
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+
+    def clear(self) -> None:
+        """
+        Removes every value from the cache.
+        """
+
+        with self.__lock:
+            self.__entries.clear()
+
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+
+    def __str__(self) -> str:
+        return "'size': {0} | 'max_size': {1} | 'hits': {2} | 'misses': {3}".format(len(self), self.max_size, self.hits, self.misses)
@@ -8,9 +8,11 @@ import logging as logger
 from fastapi import Depends, HTTPException, Request
 from src.token_helper.TokenHelper import JWTClaimsError, ExpiredSignatureError, JWTError
 from src.data_models.User import User
-from src.dependencies import DbServiceInjector, TokenHelperInjector
+from src.dependencies import AsyncDbServiceInjector, TokenHelperInjector
 from src.token_helper.TokenHelper import TokenHelper
-from src.db_service.DbService import DbOptions, DbService
+from src.db_service.DbOptions import DbOptions
+from src.db_service.AsyncDbService import AsyncDbService
+from src.libs.utils.TtlCache import TtlCache
 from src.config import Settings
 
 settings = Settings()
@@ -18,10 +20,14 @@ settings = Settings()
 SECRET_KEY = settings.secret_key
 ALGORITHM = settings.algorithm
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.access_token_expire_minutes
+TOKEN_CACHE_SIZE = settings.token_cache_size
 ENDPOINT = settings.endpoint
 KEY = settings.key
 DATABASE_ID = settings.database_id
 USERS_CONTAINER_ID = settings.users_container_id
+USER_CACHE_TTL_SECONDS = settings.user_cache_ttl_seconds
+USER_CACHE_NEGATIVE_TTL_SECONDS = settings.user_cache_negative_ttl_seconds
+USER_CACHE_MAX_SIZE = settings.user_cache_max_size
 ORIGIN_LIST = settings.origins.split(",")
 
 users_db_options = DbOptions(
@@ -31,10 +37,59 @@ users_db_options = DbOptions(
         USERS_CONTAINER_ID
     )
 
-users_db = DbServiceInjector(DbService(users_db_options))
-token_helper = TokenHelperInjector(SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES)
+users_db = AsyncDbServiceInjector(AsyncDbService(users_db_options))
+token_helper = TokenHelperInjector(SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES, TOKEN_CACHE_SIZE)
 
-def authorize_access(request: Request, token_helper: TokenHelper = Depends(token_helper), users_db: DbService = Depends(users_db)) -> str:
+# Users confirmed to exist (True) or not exist (False), keyed by user id.
+verified_users = TtlCache(USER_CACHE_MAX_SIZE, USER_CACHE_TTL_SECONDS)
+
+
+def invalidate_user(user: str) -> None:
+    """
+    Removes a user from the verified user cache. Call this when a user is deleted or disabled
+    so their next request is checked against the database again.
+
+    Parameters
+    ----------
+    user: str
+        The username to invalidate.
+    """
+
+    user_id = User(user, "_").create_id(user)
+    verified_users.delete(user_id)
+
+    logger.info("User '{0}' removed from the verified user cache.".format(user))
+
+
+def reload_token_key() -> bool:
+    """
+    Reads the token key and algorithm from the settings again and rotates to them if they changed.
+    Called on SIGHUP, so the key can be rotated by updating the settings without a restart.
+
+    Returns
+    -------
+    bool
+        'True' if the key was rotated.
+
+    Raises
+    ------
+    ValueError
+        Raised if the new secret key or algorithm are undefined. The current key is kept.
+    """
+
+    reloaded_settings = Settings()
+    current = token_helper()
+
+    if reloaded_settings.secret_key == current.secret_key and reloaded_settings.algorithm == current.algo:
+        logger.info("Token key unchanged.")
+        return False
+
+    token_helper.rotate_key(reloaded_settings.secret_key, reloaded_settings.algorithm)
+
+    return True
+
+
+async def authorize_access(request: Request, token_helper: TokenHelper = Depends(token_helper), users_db: AsyncDbService = Depends(users_db)) -> str:
     """
     Authorizes access based on the token
 
@@ -43,7 +98,7 @@ def authorize_access(request: Request, token_helper: TokenHelper = Depends(token
     token_helper: TokenHelper
         Helps validates the token.
 
-    users_db: DbService
+    users_db: AsyncDbService
         Manages users in the database.
 
     request: Request
@@ -77,7 +132,16 @@ def authorize_access(request: Request, token_helper: TokenHelper = Depends(token
 
         logger.info("Validating user '{0}'".format(user_in_token))
 
-        if users_db.get(user.id, user.user) is None:
+        user_exists = verified_users.get(user.id)
+
+        if user_exists is None:
+            logger.debug("User '{0}' not in the verified user cache. Checking database.".format(user_in_token))
+
+            # Only a user that is not found is cached as not existing. Other errors, such as throttling, are not cached.
+            user_exists = await users_db.read(user.id, user.user) is not None
+            verified_users.set(user.id, user_exists, USER_CACHE_TTL_SECONDS if user_exists else USER_CACHE_NEGATIVE_TTL_SECONDS)
+
+        if not user_exists:
             logger.warning("User '{0}' is not authorized.".format(user_in_token))
             raise JWTClaimsError("User '{0}' is not authorized.".format(user_in_token))
 
@@ -0,0 +1,62 @@
+from decimal import Decimal, InvalidOperation
+
+def to_cents(balance: any) -> int:
+    """
+    Converts a monetary value to whole cents.
+
+    Parameters
+    ----------
+    balance: any
+        The monetary value as a Decimal, string or number. Example: '1000.00'.
+
+    Returns
+    -------
+    int
+        The value in cents, rounded to the nearest cent. Example: 100000.
+
+    Raises
+    ------
+    ValueError
+        Raised if the balance is not a number.
+
+    Remarks
+    -------
+    Balances are stored in cents so the database can index, compare, sum and increment them
+    exactly, which it cannot do with decimal strings.
+    """
+
+    try:
+        cents = (Decimal(str(balance)) * 100).to_integral_value()
+
+    except InvalidOperation:
+        raise ValueError("'{0}' is not a monetary value.".format(balance))
+
+    if not cents.is_finite():
+        raise ValueError("'{0}' is not a monetary value.".format(balance))
+
+    return int(cents)
+
+
+def from_cents(cents: int) -> str:
+    """
+    Converts whole cents to a monetary value with 2 decimal places.
+
+    Parameters
+    ----------
+    cents: int
+        The value in cents. Example: 100000.
+
+    Returns
+    -------
+    str
+        The monetary value. Example: '1000.00'.
+
+    Remarks
+    -------
+    The value is built from the digits of the cents, so it is exact and never in exponent form however large it is.
+    """
+
+    cents = int(cents)
+    units, remainder = divmod(abs(cents), 100)
+
+    return "{0}{1}.{2:02d}".format("-" if cents < 0 else "", units, remainder)
@@ -1,6 +1,18 @@
+import logging as logger
+import signal
+import threading
+
 from fastapi import FastAPI
 from src.routers import accounts
+from src.libs.utils.authorize import reload_token_key
+from src.db_service.CosmosClientRegistry import client_registry
+from src.db_service.AsyncCosmosClientRegistry import async_client_registry
 from src.documentation.docs import *
+from src.config import Settings
+
+settings = Settings()
+
+ROTATE_TOKEN_KEY_ON_SIGHUP = settings.rotate_token_key_on_sighup
 
 app = FastAPI(
     title=app_title,
@@ -9,4 +21,55 @@ app = FastAPI(
     openapi_tags=tags_metadata
 )
 
-app.include_router(accounts.router)
\ No newline at end of file
+app.include_router(accounts.router)
+
+
+def rotate_token_key_on_signal(signum: int, frame: any) -> None:
+    """
+    Reloads the token key from the settings. The key is reloaded off the signal handler, so it
+    never waits on a lock held by the code it interrupted.
+    """
+
+    def reload():
+        try:
+            reload_token_key()
+
+        except Exception as e:
+            logger.exception("rotate_token_key_on_signal exception -> Could not reload the token key: {0}".format(e))
+
+    threading.Thread(target=reload, daemon=True).start()
+
+
+@app.on_event("startup")
+async def install_signal_handlers():
+    """
+    Rotates the token key on SIGHUP if 'rotate_token_key_on_sighup' is set. It is off by default, as servers
+    such as gunicorn use SIGHUP themselves. Signal handlers can only be set from the main thread.
+    """
+
+    if ROTATE_TOKEN_KEY_ON_SIGHUP and hasattr(signal, "SIGHUP") and threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGHUP, rotate_token_key_on_signal)
+
+        logger.info("Rotating the token key on SIGHUP.")
+
+
+@app.on_event("startup")
+async def open_db_connections():
+    """
+    Opens the pooled database connections once for the whole application.
+    """
+
+    client_registry.open()
+    await async_client_registry.open()
+
+
+@app.on_event("shutdown")
+async def close_db_connections():
+    """
+    Closes the pooled database connections.
+    """
+
+    logger.info("Account query stats: {0}".format(accounts.account_query_templates.get_stats()))
+
+    client_registry.close()
+    await async_client_registry.close()
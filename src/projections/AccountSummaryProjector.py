@@ -0,0 +1,216 @@
+import logging as logger # TODO: Need a way to configure logging dynamically.
+import threading
+
+from src.data_models.AccountSummary import AccountSummary
+from src.db_service.DbService import DbService
+from src.exceptions.NoResultsFoundError import NoResultsFoundError
+from src.exceptions.ObjectConflictError import ObjectConflictError
+from src.libs.utils.balance import to_cents
+
+# The account field each summary dimension is taken from.
+DIMENSIONS = {
+    "owner": "account_owner_id",
+    "institution": "account_institution",
+    "type": "account_type"
+}
+
+class AccountSummaryProjector():
+    """
+    Keeps account summaries current by following the change feed of the accounts container.
+
+    Remarks
+    -------
+    Each changed account is compared with what was last applied for it, kept in a source document
+    per account, and only the difference is added to the summaries. Summaries are updated with
+    'incr' patches, so the API's reads never see a total half written. Progress is checkpointed
+    after every page of changes, so a restarted projector resumes where it stopped.
+
+    Only one projector may run against a checkpoint. Projectors sharing a checkpoint each apply
+    every change, and the source document is not updated atomically with the 'incr' patches, so
+    their changes are counted twice.
+
+    A projector stopped between updating the summaries and recording the account's source document
+    applies that change again when it resumes. Call reset() and run again to recompute the summaries.
+
+    Methods
+    -------
+    run_once()
+        Applies every change since the last checkpoint.
+
+    run()
+        Applies changes until stopped.
+
+    reset()
+        Removes the checkpoint so the next run starts from the beginning of the change feed.
+    """
+
+    def __init__(self, accounts_db: DbService, projections_db: DbService, page_size: int = 100, checkpoint_id: str = "change_feed_checkpoint::account_summary"):
+        """
+        Parameters
+        ----------
+        accounts_db: DbService
+            The accounts container whose change feed is followed.
+
+        projections_db: DbService
+            The container holding the summaries, source documents and checkpoint. Partitioned by 'id'.
+
+        page_size: int
+            The maximum number of changes read per round trip. 100 by default.
+
+        checkpoint_id: str
+            The id of the checkpoint document.
+        """
+
+        self.accounts_db = accounts_db
+        self.projections_db = projections_db
+        self.page_size = page_size
+        self.checkpoint_id = checkpoint_id
+
+
+    def run_once(self) -> int:
+        """
+        Applies every change since the last checkpoint.
+
+        Returns
+        -------
+        int
+            The number of accounts applied.
+
+        Raises
+        ------
+        Exception
+            Raised if an unexpected error occurs. Changes up to the last checkpoint are kept.
+        """
+
+        checkpoint = self.projections_db.read(self.checkpoint_id, self.checkpoint_id)
+        continuation_token = None if checkpoint is None else checkpoint["continuation_token"]
+        applied = 0
+
+        for items, continuation_token in self.accounts_db.read_change_feed(continuation_token, self.page_size):
+            for item in items:
+                if self.__apply(item):
+                    applied += 1
+
+            self.projections_db.upsert({ "id": self.checkpoint_id, "continuation_token": continuation_token })
+
+        logger.info("{0} account changes applied to summaries.".format(applied))
+
+        return applied
+
+
+    def run(self, poll_interval_seconds: float, stop: threading.Event) -> None:
+        """
+        Applies changes until stopped, waiting the poll interval whenever every change has been applied.
+
+        Parameters
+        ----------
+        poll_interval_seconds: float
+            The time in seconds waited before reading the change feed again.
+
+        stop: threading.Event
+            Set to stop the projector.
+        """
+
+        while not stop.is_set():
+            try:
+                self.run_once()
+
+            except Exception as e:
+                logger.exception("run exception -> Error applying account changes: {0}".format(e))
+
+            stop.wait(poll_interval_seconds)
+
+
+    def reset(self) -> None:
+        """
+        Removes the checkpoint so the next run starts from the beginning of the change feed.
+
+        Remarks
+        -------
+        Delete the summaries and source documents before running again, or they are counted twice.
+        """
+
+        try:
+            self.projections_db.delete(self.checkpoint_id, self.checkpoint_id)
+
+        except Exception as e:
+            logger.warning("Could not delete checkpoint '{0}': {1}".format(self.checkpoint_id, e))
+
+
+    """
+    Private Methods
+    """
+
+    # Applies the difference between an account and what was last applied for it. 'False' if it was already applied.
+    def __apply(self, account: dict[str, any]) -> bool:
+        if account.get("collection_name") != "account":
+            return False
+
+        source_id = "account_summary_source::{0}".format(account["id"])
+        source = self.projections_db.read(source_id, source_id)
+        lsn = account.get("_lsn", 0)
+
+        if source is not None and source["lsn"] >= lsn:
+            return False
+
+        balance_cents = self.__get_balance_cents(account)
+        deltas = dict[tuple[str, str], list[int]]()
+
+        for dimension, field in DIMENSIONS.items():
+            if source is not None and source.get(field):
+                delta = deltas.setdefault((dimension, source[field]), [0, 0])
+                delta[0] -= 1
+                delta[1] -= source["balance_cents"]
+
+            if account.get(field):
+                delta = deltas.setdefault((dimension, account[field]), [0, 0])
+                delta[0] += 1
+                delta[1] += balance_cents
+
+        for (dimension, value), (count, cents) in deltas.items():
+            if count != 0 or cents != 0:
+                self.__increment(AccountSummary(dimension, value), count, cents)
+
+        self.projections_db.upsert({
+            "id": source_id,
+            "lsn": lsn,
+            "balance_cents": balance_cents,
+            **{ field: account.get(field) for field in DIMENSIONS.values() }
+        })
+
+        return True
+
+
+    # Adds to the count and balance of a summary, creating it if it does not exist.
+    def __increment(self, summary: AccountSummary, count: int, cents: int) -> None:
+        operations = [
+            { "op": "incr", "path": "/count", "value": count },
+            { "op": "incr", "path": "/balance_cents", "value": cents }
+        ]
+
+        try:
+            self.projections_db.patch(summary.id, summary.id, operations)
+
+        except NoResultsFoundError:
+            summary.count = count
+            summary.balance_cents = cents
+
+            try:
+                self.projections_db.create(summary.__dict__)
+
+            except ObjectConflictError:
+                # Created by another projector in between.
+                self.projections_db.patch(summary.id, summary.id, operations)
+
+
+    # Gets the balance of an account in cents, converting it for accounts written before balances were stored in cents.
+    def __get_balance_cents(self, account: dict[str, any]) -> int:
+        if account.get("balance_cents") is not None:
+            return account["balance_cents"]
+
+        try:
+            return to_cents(account.get("balance"))
+
+        except ValueError:
+            logger.warning("Balance '{0}' of '{1}' is not a number. Counting it as 0.00.".format(account.get("balance"), account["id"]))
+            return 0
@@ -0,0 +1,60 @@
+"""
+Runs the projector keeping the account summaries read by GET /accounts/summary current.
+
+Run exactly one alongside the API from the repository root:
+
+    python -m src.projector
+
+Every projector reads the whole change feed from the same checkpoint, so a second projector would apply every change
+again and count it twice.
+
+Pass '--reset' to start again from the beginning of the change feed, after deleting the summaries.
+"""
+
+import argparse
+import logging as logger
+import signal
+import threading
+
+from src.config import Settings
+from src.db_service.DbOptions import DbOptions
+from src.db_service.DbService import DbService
+from src.db_service.CosmosClientRegistry import client_registry
+from src.projections.AccountSummaryProjector import AccountSummaryProjector
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reset", action="store_true", help="Start again from the beginning of the change feed.")
+    args = parser.parse_args()
+
+    settings = Settings()
+
+    accounts_db = DbService(DbOptions(settings.endpoint, settings.key, settings.database_id, settings.accounts_container_id))
+    projections_db = DbService(DbOptions(settings.endpoint, settings.key, settings.database_id, settings.projections_container_id))
+
+    accounts_db.connect()
+    projections_db.connect()
+
+    projector = AccountSummaryProjector(accounts_db, projections_db, settings.projector_page_size)
+
+    if args.reset:
+        projector.reset()
+
+    stop = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+
+    logger.info("Projecting account summaries.")
+
+    try:
+        projector.run(settings.projector_poll_interval_seconds, stop)
+
+    finally:
+        client_registry.close()
+
+    logger.info("Projector stopped.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,45 @@
+import asyncio
+import base64
+import binascii
 import json
 import logging as logger
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Header, Request, Response
+from fastapi.responses import StreamingResponse
 from decimal import Decimal
 
-from src.db_service.DbService import DbService, DbOptions
+from src.db_service.DbOptions import DbOptions
+from src.db_service.AsyncDbService import AsyncDbService
+from src.db_service.CachedDbService import CachedDbService
+from src.db_service.cache.MemoryCacheBackend import MemoryCacheBackend
+from src.db_service.cache.RedisCacheBackend import RedisCacheBackend
 from src.db_service.Query import Query
-from src.dependencies import DbServiceInjector
+from src.db_service.QueryTemplateRegistry import QueryTemplateRegistry
+from src.dependencies import AsyncDbServiceInjector
+from src.exceptions.InsufficientBalanceError import InsufficientBalanceError
 from src.exceptions.InvalidParameterError import InvalidParameterError
 from src.exceptions.NoResultsFoundError import NoResultsFoundError
 from src.exceptions.ObjectConflictError import ObjectConflictError
-from src.libs.api_model_mappers.account_mapper import map_to_account_api_model, map_to_account_api_models, map_to_account_data_model
+from src.exceptions.PreconditionFailedError import PreconditionFailedError
+from src.libs.api_model_mappers.account_mapper import map_to_account_api_fields, map_to_account_api_model, map_to_account_api_result_json, map_to_account_data_model, map_to_account_data_model_fields
 from src.libs.api_model_mappers.api_result_mapper import map_to_api_result
 from src.data_models.User import User
 from src.data_models.Account import Account
+from src.data_models.AccountIdClaim import AccountIdClaim
+from src.data_models.AccountOwnerIndexEntry import AccountOwnerIndexEntry
+from src.data_models.AccountOwnerIndexMarker import AccountOwnerIndexMarker
+from src.data_models.AccountSummary import AccountSummary
 from src.libs.api_models.UpdateAccountModel import UpdateAccountModel
 from src.libs.api_models.AccountModel import AccountModel
+from src.libs.api_models.AccountSummaryModel import AccountSummaryModel
+from src.libs.api_models.AdjustBalanceModel import AdjustBalanceModel
+from src.libs.api_models.BatchGetAccountsModel import BatchGetAccountsModel
+from src.libs.api_models.BatchGetAccountsResultModel import BatchGetAccountsResultModel
 from src.libs.api_models.ApiResult import ApiResult
+from src.libs.api_models.BulkItemResultModel import BulkItemResultModel
 from src.libs.utils.authorize import authorize_access
+from src.libs.utils.balance import from_cents, to_cents
+from src.libs.utils.TtlCache import TtlCache
 from src.authorization.JwtBearer import inject_jwt_bearer
 from src.documentation.docs import *
 from src.config import Settings
@@ -42,9 +64,54 @@ ENDPOINT = settings.endpoint
 KEY = settings.key
 DATABASE_ID = settings.database_id
 ACCOUNTS_CONTAINER_ID = settings.accounts_container_id
+ACCOUNTS_PARTITION_KEY = settings.accounts_partition_key
+PROJECTIONS_CONTAINER_ID = settings.projections_container_id
+OWNER_INDEX_CONTAINER_ID = settings.owner_index_container_id
 MAX_PAGE_SIZE = settings.max_page_size
+EXPORT_PAGE_SIZE = settings.export_page_size
+BULK_MAX_ITEMS = settings.bulk_max_items
+BULK_MAX_CONCURRENCY = settings.bulk_max_concurrency
+BATCH_GET_MAX_ITEMS = settings.batch_get_max_items
+BATCH_GET_MAX_CONCURRENCY = settings.batch_get_max_concurrency
+BALANCE_ADJUST_MAX_RETRIES = settings.balance_adjust_max_retries
+BALANCE_ADJUST_RETRY_AFTER_SECONDS = settings.balance_adjust_retry_after_seconds
+ACCOUNT_CACHE_BACKEND = settings.account_cache_backend
+ACCOUNT_CACHE_TTL_SECONDS = settings.account_cache_ttl_seconds
+ACCOUNT_CACHE_MAX_SIZE = settings.account_cache_max_size
+ACCOUNT_COUNT_CACHE_TTL_SECONDS = settings.account_count_cache_ttl_seconds
+ACCOUNT_COUNT_CACHE_MAX_SIZE = settings.account_count_cache_max_size
+REDIS_URL = settings.redis_url
 ORIGIN_LIST = settings.origins.split(",")
 
+# How account_name is matched. 'contains' scans every account, 'prefix' and 'token' use the index.
+ACCOUNT_NAME_MATCH_MODES = ("contains", "prefix", "token")
+
+# How account searches can be sorted, by 'order_by'. 'balance' sorts by the balance in cents.
+ACCOUNT_SORTS = ("balance", "account_name", "_ts")
+
+ACCOUNT_SORT_ORDERS = ("asc", "desc")
+
+# Fields account search results can be limited to with 'fields'.
+ACCOUNT_FIELDS = tuple(AccountModel.__fields__)
+
+# Fields accounts can be partitioned by. Partitioning by owner makes listing a user's accounts a single partition query.
+ACCOUNTS_PARTITION_KEYS = ("account_id", "account_owner_id")
+
+# Lists an owner's accounts from the owner's partition of the account owner index.
+OWNER_INDEX_QUERY = "SELECT * FROM c WHERE c.account_owner_id = @account_owner_id AND c.collection_name = 'account_owner_index_entry' ORDER BY c.account_id"
+
+if ACCOUNTS_PARTITION_KEY not in ACCOUNTS_PARTITION_KEYS:
+    raise ValueError("accounts_partition_key must be one of: {0}.".format(", ".join(ACCOUNTS_PARTITION_KEYS)))
+
+# Where accounts are cached. 'memory' is only kept current by the writes of its own process, so it is for a single worker.
+ACCOUNT_CACHE_BACKENDS = ("none", "memory", "redis")
+
+if ACCOUNT_CACHE_BACKEND not in ACCOUNT_CACHE_BACKENDS:
+    raise ValueError("account_cache_backend must be one of: {0}.".format(", ".join(ACCOUNT_CACHE_BACKENDS)))
+
+if ACCOUNT_CACHE_BACKEND == "redis" and not REDIS_URL:
+    raise ValueError("redis_url must be defined when account_cache_backend is 'redis'.")
+
 # Setup DB settings to inject.
 db_options = DbOptions(
     ENDPOINT, 
@@ -53,8 +120,86 @@ db_options = DbOptions(
     ACCOUNTS_CONTAINER_ID
 )
 
+# Projections of the accounts, such as the account summaries, are kept in their own container partitioned by 'id'.
+projections_db_options = DbOptions(
+    ENDPOINT,
+    KEY,
+    DATABASE_ID,
+    PROJECTIONS_CONTAINER_ID
+)
+
+# The index of each owner's accounts is kept in its own container partitioned by 'account_owner_id', one item per account.
+owner_index_db_options = DbOptions(
+    ENDPOINT,
+    KEY,
+    DATABASE_ID,
+    OWNER_INDEX_CONTAINER_ID
+)
+
+# Setup the account cache. Point reads are served from it and writes keep it current.
+if ACCOUNT_CACHE_BACKEND == "redis":
+    import redis.asyncio as redis # Only needed when the cache is shared through Redis.
+
+    account_cache = RedisCacheBackend(redis.from_url(REDIS_URL), "{0}:".format(ACCOUNTS_CONTAINER_ID))
+elif ACCOUNT_CACHE_BACKEND == "memory":
+    account_cache = MemoryCacheBackend(ACCOUNT_CACHE_MAX_SIZE)
+else:
+    account_cache = None
+
 # Inject db.
-accounts_db = DbServiceInjector(DbService(db_options))
+if account_cache is None:
+    accounts_db = AsyncDbServiceInjector(AsyncDbService(db_options))
+else:
+    accounts_db = AsyncDbServiceInjector(CachedDbService(AsyncDbService(db_options), account_cache, ACCOUNT_CACHE_TTL_SECONDS, ACCOUNTS_PARTITION_KEY))
+
+projections_db = AsyncDbServiceInjector(AsyncDbService(projections_db_options))
+owner_index_db = AsyncDbServiceInjector(AsyncDbService(owner_index_db_options))
+
+# Precompile the account search queries, so searches of the same shape reuse the same query plan.
+account_query_templates = QueryTemplateRegistry(
+    "SELECT * FROM {0}".format(ACCOUNTS_CONTAINER_ID),
+    {
+        "account_name": "{0}.account_name LIKE @account_name".format(ACCOUNTS_CONTAINER_ID),
+        "account_name_prefix": "STARTSWITH({0}.account_name, @account_name_prefix)".format(ACCOUNTS_CONTAINER_ID),
+        "account_name_token": "ARRAY_CONTAINS({0}.account_name_tokens, @account_name_token)".format(ACCOUNTS_CONTAINER_ID),
+        "account_type": "{0}.account_type=@account_type".format(ACCOUNTS_CONTAINER_ID),
+        "account_institution": "{0}.account_institution=@account_institution".format(ACCOUNTS_CONTAINER_ID),
+        "account_owner_id": "{0}.account_owner_id=@account_owner_id".format(ACCOUNTS_CONTAINER_ID),
+        "balance": "{0}.balance_cents=@balance".format(ACCOUNTS_CONTAINER_ID),
+        "min_balance": "{0}.balance_cents >= @min_balance".format(ACCOUNTS_CONTAINER_ID),
+        "max_balance": "{0}.balance_cents <= @max_balance".format(ACCOUNTS_CONTAINER_ID)
+    },
+    "account_owner_id" if ACCOUNTS_PARTITION_KEY == "account_owner_id" else None,
+    # Each sort is combined with filters on its field, or with one equality filter through the composite index of the
+    # filter's field and the sorted field. The composite indexes are in deploy/accounts-indexing-policy.json.
+    {
+        "balance": ("{0}.balance_cents".format(ACCOUNTS_CONTAINER_ID), {
+            "account_type": "{0}.account_type".format(ACCOUNTS_CONTAINER_ID),
+            "account_institution": "{0}.account_institution".format(ACCOUNTS_CONTAINER_ID),
+            "account_owner_id": "{0}.account_owner_id".format(ACCOUNTS_CONTAINER_ID),
+            "balance": None,
+            "min_balance": None,
+            "max_balance": None
+        }),
+        "account_name": ("{0}.account_name".format(ACCOUNTS_CONTAINER_ID), {
+            "account_name_prefix": None,
+            "account_type": "{0}.account_type".format(ACCOUNTS_CONTAINER_ID),
+            "account_institution": "{0}.account_institution".format(ACCOUNTS_CONTAINER_ID),
+            "account_owner_id": "{0}.account_owner_id".format(ACCOUNTS_CONTAINER_ID),
+            "balance": "{0}.balance_cents".format(ACCOUNTS_CONTAINER_ID)
+        }),
+        "_ts": ("{0}._ts".format(ACCOUNTS_CONTAINER_ID), {
+            "account_type": "{0}.account_type".format(ACCOUNTS_CONTAINER_ID),
+            "account_institution": "{0}.account_institution".format(ACCOUNTS_CONTAINER_ID),
+            "account_owner_id": "{0}.account_owner_id".format(ACCOUNTS_CONTAINER_ID),
+            "balance": "{0}.balance_cents".format(ACCOUNTS_CONTAINER_ID)
+        })
+    },
+    "SELECT VALUE COUNT(1) FROM {0}".format(ACCOUNTS_CONTAINER_ID)
+)
+
+# Totals of account searches by query and filter values, so paging through a search counts its results once.
+account_count_cache = TtlCache(ACCOUNT_COUNT_CACHE_MAX_SIZE, ACCOUNT_COUNT_CACHE_TTL_SECONDS)
 
 # End of services setup.
 
@@ -63,19 +208,52 @@ accounts_db = DbServiceInjector(DbService(db_options))
 GET Account(s)
 """
 @router.get("/", status_code=200, responses=get_accounts_responses, response_model=ApiResult, tags=["accounts"])
-def get(id: str = "",
+async def get(id: str = "",
     account_id: str = "",
     account_name: str = "",
+    account_name_match: str = "contains",
     account_type: str = "",
     account_institution: str = "",
     account_owner_id: str = "",
     balance: Decimal = None,
+    min_balance: Decimal = None,
+    max_balance: Decimal = None,
+    order_by: str = "",
+    order: str = "asc",
     page: int = 1,
     results_per_page: int = 10,
-    accounts_db: DbService = Depends(accounts_db), 
+    cursor: bool = False,
+    continuation_token: str = "",
+    include_total: bool = False,
+    fields: str = "",
+    if_none_match: str = Header(None),
+    accounts_db: AsyncDbService = Depends(accounts_db), 
     user: str = Depends(authorize_access)):
     """
     Gets accounts based on search parameters. Searching by 'id' or 'account_name' will always return one result.
+
+    'account_name_match' sets how 'account_name' is matched: 'contains' (default) matches the name anywhere but scans every
+    account, 'prefix' matches names starting with it and 'token' matches names containing it as a whole word, ignoring case.
+    'prefix' and 'token' use the index, so they cost the same however many accounts there are.
+
+    'min_balance' and 'max_balance' return accounts whose balance is at least or at most the amount given.
+
+    'order_by' sorts results by 'balance', 'account_name' or '_ts' (last modified), in 'order' 'asc' (default) or 'desc'.
+    Sorted results can be filtered by range on the sorted field and by at most one of 'account_type', 'account_institution',
+    'account_owner_id' or 'balance', which are served by the index. Other combinations would read every account and are rejected.
+    Accounts without the sorted field, such as accounts not yet backfilled with balance cents, are left out of sorted results.
+
+    Results by 'id' or 'account_id' carry the account's etag in the 'ETag' header. Pass it back in the 'If-None-Match'
+    header and a 304 with no body is returned while the account has not changed.
+
+    Set 'cursor' to page with continuation tokens instead of 'page'. The result's 'continuation_token' is passed back
+    as 'continuation_token' to get the next page, which costs the same as getting the first page.
+
+    Set 'include_total' to get the number of accounts matching the search across every page as 'total'. It is counted
+    alongside the page and reused for a few seconds, so paging through a search does not count it again.
+
+    Set 'fields' to a comma separated list of account fields, such as 'account_id,balance', to only return those fields.
+    Searches then only read those fields from the database, which costs less and returns less for list views.
     """
 
     try:
@@ -83,57 +261,288 @@ def get(id: str = "",
         .format(user, id, account_id, account_name, account_type, account_institution, account_owner_id, balance, page, results_per_page))
         logger.debug("Validating parameters passed are valid.")
 
-        __validate_get_accounts_param(id, account_id, account_name, account_type, account_institution, account_owner_id, balance, page, results_per_page)
+        __validate_get_accounts_param(id, account_id, account_name, account_name_match, account_type, account_institution, account_owner_id, balance, min_balance, max_balance, order_by, order, page, results_per_page)
+
+        selected_fields = __parse_fields(fields)
 
         logger.debug("Parameters are valid.")
 
-        queried = False
-        results = None
+        use_cursor = cursor or continuation_token != ""
 
-        # Get by key.
-        if id != "":
-            results = accounts_db.get(id, id.split("::")[1])
-            
-        elif account_id != "":
-            key = Account(account_id).create_id(account_id)
-            results = accounts_db.get(key, account_id)
+        # Get by key. This is a point read that returns the document serialized once, without building models.
+        if id != "" or account_id != "":
+            if id != "":
+                key, partition_key = id, __get_partition_key(id.split("::")[1], user)
+                
+            else:
+                key, partition_key = Account(account_id).create_id(account_id), __get_partition_key(account_id, user)
+
+            # A cached etag answers an unchanged account without reading or serializing it.
+            if if_none_match is not None:
+                etag = await accounts_db.get_etag(key, partition_key)
+
+                if __etag_matches(if_none_match, etag):
+                    logger.info("Account not modified.")
+
+                    return Response(status_code=304, headers={ "ETag": etag })
+
+            item = await accounts_db.read(key, partition_key)
+
+            if item == None:
+                raise NoResultsFoundError("No accounts found based on search parameters.")
+
+            logger.info("1 result found.")
+
+            etag = __get_entity_tag(item)
+
+            if etag is None:
+                return Response(content=map_to_account_api_result_json(item, page, selected_fields), media_type="application/json")
+
+            if if_none_match is not None and __etag_matches(if_none_match, etag):
+                logger.info("Account not modified.")
+
+                return Response(status_code=304, headers={ "ETag": etag })
+
+            return Response(content=map_to_account_api_result_json(item, page, selected_fields), media_type="application/json", headers={ "ETag": etag })
             
         # If no key defined--query.
+        logger.debug("Building query.")
+
+        query = __build_get_query(account_name, account_name_match, account_type, account_institution, account_owner_id, balance, min_balance, max_balance, order_by, order, page, results_per_page, not use_cursor, selected_fields)
+
+        logger.debug("Query built: '{0}'".format(query.query_str))
+        logger.info("Querying accounts by 'accountName': '{0}', 'account_type': '{1}', 'account_institution': '{2}', 'account_owner_id': {3}, 'balance': '{4}', 'page': '{5}', 'results_per_page': '{6}'"
+        .format(account_name, account_type, account_institution, account_owner_id, balance, page, results_per_page))
+
+        decoded_continuation_token = __decode_continuation_token(continuation_token) if use_cursor else None
+        total = None
+
+        if include_total:
+            # The total is counted while the page is read.
+            count_query = __build_count_query(account_name, account_name_match, account_type, account_institution, account_owner_id, balance, min_balance, max_balance)
+            (accounts, next_continuation_token), total = await asyncio.gather(
+                __query_accounts(query, use_cursor, results_per_page, decoded_continuation_token, selected_fields, accounts_db),
+                __count_accounts(count_query, accounts_db))
+
+        else:
+            accounts, next_continuation_token = await __query_accounts(query, use_cursor, results_per_page, decoded_continuation_token, selected_fields, accounts_db)
+
+        # A query across partitions can return an empty page that still has more pages after it.
+        if len(accounts) == 0 and next_continuation_token is None:
+            raise NoResultsFoundError("No accounts found based on search parameters.")
+
+        logger.info("{0} results found.".format(len(accounts)))
+
+        return map_to_api_result(accounts, len(accounts), page, __encode_continuation_token(next_continuation_token), total)
+    
+    except Exception as e:
+        logger.exception("GET exception on 'get' -> {0}".format(e))
+
+        if type(e) == InvalidParameterError:
+            raise HTTPException(status_code=400, detail=e.message)
+
+        elif type(e) == NoResultsFoundError:
+            raise HTTPException(status_code=404, detail="No results found based on search parameters given.")
+
         else:
-            queried = True
+            raise HTTPException(status_code=500, detail="An unexpected error occurred.")
 
-            logger.debug("Building query.")
 
-            query = __build_get_query(account_name, account_type, account_institution, account_owner_id, balance, page, results_per_page)
+"""
+GET My Accounts
+"""
+@router.get("/mine", status_code=200, responses=get_my_accounts_responses, response_model=ApiResult, tags=["accounts"])
+async def mine(results_per_page: int = 10,
+    continuation_token: str = "",
+    accounts_db: AsyncDbService = Depends(accounts_db),
+    owner_index_db: AsyncDbService = Depends(owner_index_db),
+    user: str = Depends(authorize_access)):
+    """
+    Gets the accounts owned by the user. They are read from an index of the user's accounts that is kept up to date
+    as accounts are written. The index is partitioned by owner, so a page costs the same however many accounts there are.
 
-            logger.debug("Query built: '{0}'".format(query.query_str))
-            logger.info("Querying accounts by 'accountName': '{0}', 'account_type': '{1}', 'account_institution': '{2}', 'account_owner_id': {3}, 'balance': '{4}', 'page': '{5}', 'results_per_page': '{6}'"
-            .format(account_name, account_type, account_institution, account_owner_id, balance, page, results_per_page))
+    The result's 'continuation_token' is passed back as 'continuation_token' to get the next page.
+    """
 
-            results = accounts_db.query(query)
+    try:
+        logger.debug("User {0} getting their accounts.".format(user))
 
-        if results != None:
-            if queried:
-                accounts = map_to_account_api_models(json.loads(results))
-                response = map_to_api_result(accounts, len(accounts), page)
+        if results_per_page <= 0 or results_per_page > MAX_PAGE_SIZE:
+            raise InvalidParameterError("results_per_page must be between 1 to 100 inclusive.")
 
-                logger.info("{0} results found.".format(len(accounts)))
+        account_owner_id = User(user, "_").create_id(user)
+        decoded_continuation_token = __decode_continuation_token(continuation_token)
 
-            else:
-                accounts = map_to_account_api_model(json.loads(results))
-                response = map_to_api_result(accounts, 1, page)
+        query = Query(OWNER_INDEX_QUERY, { "@account_owner_id": account_owner_id }, partition_key=account_owner_id)
 
-                logger.info("1 result found.")
+        if decoded_continuation_token is None:
+            # Accounts written before the index existed are indexed the first time their owner asks for them.
+            marker = AccountOwnerIndexMarker(account_owner_id)
+            (entries, next_continuation_token), indexed = await asyncio.gather(
+                owner_index_db.query_page(query, results_per_page),
+                owner_index_db.read(marker.id, account_owner_id))
 
-            logger.debug("Results: {0}".format(results))
+            if indexed is None:
+                logger.info("Indexing accounts of '{0}'.".format(account_owner_id))
 
-            return response
+                await __rebuild_owner_index(account_owner_id, accounts_db, owner_index_db)
+                entries, next_continuation_token = await owner_index_db.query_page(query, results_per_page)
 
         else:
+            entries, next_continuation_token = await owner_index_db.query_page(query, results_per_page, decoded_continuation_token)
+
+        if len(entries) == 0 and next_continuation_token is None:
+            raise NoResultsFoundError("User '{0}' has no accounts.".format(user))
+
+        accounts = [AccountModel(**entry["account"]) for entry in entries]
+
+        logger.info("{0} results found.".format(len(accounts)))
+
+        return map_to_api_result(accounts, len(accounts), 1, __encode_continuation_token(next_continuation_token))
+
+    except Exception as e:
+        logger.exception("GET exception on 'mine' -> {0}".format(e))
+
+        if type(e) == InvalidParameterError:
+            raise HTTPException(status_code=400, detail=e.message)
+
+        elif type(e) == NoResultsFoundError:
+            raise HTTPException(status_code=404, detail="You have no accounts.")
+
+        else:
+            raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+
+"""
+GET Accounts Summary
+"""
+@router.get("/summary", status_code=200, responses=get_accounts_summary_responses, response_model=ApiResult, tags=["accounts"])
+async def summary(by: str = "owner",
+    value: str = "",
+    projections_db: AsyncDbService = Depends(projections_db),
+    user: str = Depends(authorize_access)):
+    """
+    Gets the number of accounts and their total balance by 'owner' (your accounts), 'institution' or 'type'. Pass the institution
+    or account type as 'value'. Totals are kept up to date as accounts change, so this is one read however many accounts there are,
+    but changes take a few seconds to be counted.
+    """
+
+    try:
+        logger.debug("User {0} getting accounts summary by '{1}': '{2}'".format(user, by, value))
+        logger.debug("Validating parameters passed are valid.")
+
+        __validate_summary_param(by, value)
+
+        logger.debug("Parameters are valid.")
+
+        # Users only get the totals of their own accounts.
+        if by == "owner":
+            value = User(user, "_").create_id(user)
+
+        summary_id = AccountSummary(by, value).id
+        document = await projections_db.read(summary_id, summary_id)
+
+        if document == None or document["count"] <= 0:
+            raise NoResultsFoundError("No accounts found for '{0}': '{1}'.".format(by, value))
+
+        result = AccountSummaryModel(
+            dimension=by,
+            value=document["value"],
+            count=document["count"],
+            balance=from_cents(document["balance_cents"]))
+
+        logger.info("Summary found: {0}".format(str(result)))
+
+        return map_to_api_result(result, 1, 0)
+
+    except Exception as e:
+        logger.exception("GET exception on 'summary' -> {0}".format(e))
+
+        if type(e) == InvalidParameterError:
+            raise HTTPException(status_code=400, detail=e.message)
+
+        elif type(e) == NoResultsFoundError:
+            raise HTTPException(status_code=404, detail="No accounts found based on parameters given.")
+
+        else:
+            raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+
+"""
+GET Account Query Stats
+"""
+@router.get("/query-stats", status_code=200, responses=get_account_query_stats_responses, response_model=ApiResult, tags=["accounts"])
+async def query_stats(user: str = Depends(authorize_access)):
+    """
+    Gets how account searches use the query templates: the number of templates compiled, the number of searches and
+    the share of searches of each shape. Searches of the same shape reuse the same query plan in the database.
+    """
+
+    try:
+        logger.debug("User {0} getting account query stats.".format(user))
+
+        stats = account_query_templates.get_stats()
+
+        logger.info("Account query stats: {0}".format(stats))
+
+        return map_to_api_result(stats, len(stats["shapes"]), 1)
+
+    except Exception as e:
+        logger.exception("GET exception on 'query_stats' -> {0}".format(e))
+        raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+
+"""
+GET Accounts Export
+"""
+@router.get("/export", status_code=200, responses=export_accounts_responses, response_class=StreamingResponse, tags=["accounts"])
+async def export(account_name: str = "",
+    account_name_match: str = "contains",
+    account_type: str = "",
+    account_institution: str = "",
+    account_owner_id: str = "",
+    balance: Decimal = None,
+    min_balance: Decimal = None,
+    max_balance: Decimal = None,
+    order_by: str = "",
+    order: str = "asc",
+    accounts_db: AsyncDbService = Depends(accounts_db), 
+    user: str = Depends(authorize_access)):
+    """
+    Exports every account matching the search parameters as newline-delimited JSON (one account per line).
+    Accounts are streamed as they are read from the database, so there is no page size limit.
+    Exports are sorted with 'order_by' and 'order' the same way searches are.
+    """
+
+    try:
+        logger.debug("User {0} exporting accounts by 'accountName': '{1}', 'account_type': '{2}', 'account_institution': '{3}', 'account_owner_id': '{4}', 'balance': '{5}'"
+        .format(user, account_name, account_type, account_institution, account_owner_id, balance))
+        logger.debug("Validating parameters passed are valid.")
+
+        __validate_account_filters(account_name, account_name_match, account_type, account_institution, account_owner_id, balance, min_balance, max_balance)
+        __validate_sort(order_by, order)
+
+        logger.debug("Parameters are valid.")
+
+        query = __build_get_query(account_name, account_name_match, account_type, account_institution, account_owner_id, balance, min_balance, max_balance, order_by, order, 1, EXPORT_PAGE_SIZE, False)
+
+        logger.debug("Query built: '{0}'".format(query.query_str))
+
+        items = accounts_db.query_items(query, EXPORT_PAGE_SIZE).__aiter__()
+
+        # Read the first account before streaming so an empty export can still return a 404.
+        try:
+            first_item = await items.__anext__()
+
+        except StopAsyncIteration:
             raise NoResultsFoundError("No accounts found based on search parameters.")
-    
+
+        logger.info("Exporting accounts.")
+
+        return StreamingResponse(__stream_accounts(first_item, items), media_type="application/x-ndjson")
+
     except Exception as e:
-        logger.exception("GET exception on 'get' -> {0}".format(e))
+        logger.exception("GET exception on 'export' -> {0}".format(e))
 
         if type(e) == InvalidParameterError:
             raise HTTPException(status_code=400, detail=e.message)
@@ -149,35 +558,15 @@ def get(id: str = "",
 POST Account
 """
 @router.post("/", status_code=201, responses=post_account_responses, response_model=ApiResult, tags=["accounts"])
-def post(account: AccountModel,  accounts_db: DbService = Depends(accounts_db), user: str = Depends(authorize_access)):
+async def post(account: AccountModel,  accounts_db: AsyncDbService = Depends(accounts_db), projections_db: AsyncDbService = Depends(projections_db), owner_index_db: AsyncDbService = Depends(owner_index_db), user: str = Depends(authorize_access)):
     """
     Creates a new account.
     """
 
     try:
         logger.debug("User {0} creating account.".format(user))
-        logger.debug("Validating account model.")
-
-        __validate_account(account)
-
-        logger.debug("Account model is valid.")
-        logger.debug("Checking if account '{0}' already exists.".format(account.account_id))
-
-        # Check if account already exists.
-        account_data_model = map_to_account_data_model(account)
-        account_data_model.account_owner_id = User(user, "_").create_id(user) # Add user in token as account owner.
-        if accounts_db.get(account_data_model.id, account_data_model.account_id) != None:
-            raise ObjectConflictError("Account '{0}' already exists.".format(account_data_model.account_id))
-        
-        # Create account.
-        logger.debug("Account '{0}' does not exist.".format(account_data_model.account_id))
-        logger.info("Creating account.")
-
-        accounts_db.upsert(account_data_model.__dict__)
-        
-        logger.info("Account '{0}' created.".format(account_data_model.account_id))
-        logger.debug("User {0} created account: {1}".format(user, str(account_data_model)))
 
+        account_data_model = await __create_account(account, user, accounts_db, projections_db, owner_index_db)
         account = map_to_account_api_model(account_data_model.__dict__)
 
         return map_to_api_result(account, 1, 0)
@@ -195,14 +584,104 @@ def post(account: AccountModel,  accounts_db: DbService = Depends(accounts_db),
             raise HTTPException(status_code=500, detail="An unexpected error occurred.")
 
 
+"""
+POST Accounts Bulk
+"""
+@router.post("/bulk", status_code=200, responses=post_accounts_bulk_responses, response_model=ApiResult, tags=["accounts"], openapi_extra=post_accounts_bulk_request)
+async def bulk(request: Request, accounts_db: AsyncDbService = Depends(accounts_db), projections_db: AsyncDbService = Depends(projections_db), owner_index_db: AsyncDbService = Depends(owner_index_db), user: str = Depends(authorize_access)):
+    """
+    Creates many accounts in one call. The body is either a JSON array of accounts or newline-delimited JSON
+    (Content-Type 'application/x-ndjson') with one account per line.
+
+    Accounts are written concurrently and each one succeeds or fails on its own. The result lists the status of every
+    account in the order given, using the status code the account would have had from POST /accounts.
+    """
+
+    try:
+        logger.debug("User {0} creating accounts in bulk.".format(user))
+        logger.debug("Reading accounts from the request body.")
+
+        payloads = await __read_bulk_payloads(request)
+
+        logger.debug("{0} accounts read.".format(len(payloads)))
+        logger.info("Creating {0} accounts.".format(len(payloads)))
+
+        semaphore = asyncio.Semaphore(BULK_MAX_CONCURRENCY)
+        results = await asyncio.gather(*[__create_bulk_account(i, payload, user, accounts_db, projections_db, owner_index_db, semaphore) for i, payload in enumerate(payloads)])
+
+        created = len([result for result in results if result.status_code == 201])
+
+        logger.info("{0} of {1} accounts created.".format(created, len(results)))
+
+        return map_to_api_result(results, len(results), 0)
+
+    except Exception as e:
+        logger.exception("POST exception on 'bulk' -> {0}".format(e))
+
+        if type(e) == InvalidParameterError:
+            raise HTTPException(status_code=400, detail=e.message)
+
+        else:
+            raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+
+"""
+POST Accounts Batch Get
+"""
+@router.post("/batch-get", status_code=200, responses=batch_get_accounts_responses, response_model=ApiResult, tags=["accounts"])
+async def batch_get(batch: BatchGetAccountsModel, accounts_db: AsyncDbService = Depends(accounts_db), user: str = Depends(authorize_access)):
+    """
+    Gets many accounts by account id in one call. The accounts are read by key concurrently, so getting them costs the
+    same as getting each one by 'account_id', without a request per account.
+
+    The result's content lists the accounts found, in the order their account ids were given, and the account ids of
+    the accounts not found. 'results' is the number of accounts found.
+    """
+
+    try:
+        logger.debug("User {0} getting accounts in a batch: {1}".format(user, batch.__str__()))
+        logger.debug("Validating parameters passed are valid.")
+
+        __validate_batch_get(batch)
+
+        logger.debug("Parameters are valid.")
+
+        # Each account is only read once, however often its id is given.
+        account_ids = list(dict.fromkeys(batch.account_ids))
+
+        logger.info("Getting {0} accounts.".format(len(account_ids)))
+
+        semaphore = asyncio.Semaphore(BATCH_GET_MAX_CONCURRENCY)
+        items = await asyncio.gather(*[__read_batch_account(account_id, user, accounts_db, semaphore) for account_id in account_ids])
+
+        found = [map_to_account_api_model(item) for item in items if item is not None]
+        missing = [account_id for account_id, item in zip(account_ids, items) if item is None]
+
+        logger.info("{0} of {1} accounts found.".format(len(found), len(account_ids)))
+
+        return map_to_api_result(BatchGetAccountsResultModel(found=found, missing=missing), len(found), 0)
+
+    except Exception as e:
+        logger.exception("POST exception on 'batch_get' -> {0}".format(e))
+
+        if type(e) == InvalidParameterError:
+            raise HTTPException(status_code=400, detail=e.message)
+
+        else:
+            raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+
 """
 PUT Account
 """
 @router.put("/", status_code=200, responses=put_account_responses, response_model=ApiResult, tags=["accounts"])
-def put(account_to_update: UpdateAccountModel, accounts_db: DbService = Depends(accounts_db), user: str = Depends(authorize_access)):
+async def put(account_to_update: UpdateAccountModel, response: Response, if_match: str = Header(None), accounts_db: AsyncDbService = Depends(accounts_db), owner_index_db: AsyncDbService = Depends(owner_index_db), user: str = Depends(authorize_access)):
     """
     Updates an account's name and/or balance. You must specify the account_id, but you can omit any other fields you do not want
     to update. You must specify at least one field besides the account_id.
+
+    To only update the account if it has not changed since you read it, pass its etag in the 'If-Match' header or as 'etag'.
+    A 412 is returned if the account changed in between. The new etag is returned in the 'ETag' header.
     """
     try:
         logger.debug("User {0} updating account.".format(user))
@@ -211,33 +690,41 @@ def put(account_to_update: UpdateAccountModel, accounts_db: DbService = Depends(
         __validate_update_account(account_to_update)
 
         logger.debug("Account update model is valid.")
-        logger.debug("Getting account '{0}' to update.".format(account_to_update.account_id))
-        
-        key = Account(account_to_update.account_id).create_id(account_to_update.account_id)
-        account_json = accounts_db.get(key, account_to_update.account_id)
-        
-        # Check if account exists.
-        if account_json == None:
-            raise NoResultsFoundError("Could not find an account with id '{0}'".format(account_to_update.account_id))
-
-        logger.debug("Account '{0}' found".format(account_to_update.account_id))
-        logger.info("Updating account.")
+        logger.info("Updating account '{0}'.".format(account_to_update.account_id))
 
-        # Update account.
-        account : dict[str, any] = json.loads(account_json)
+        # Update only the fields given, in one conditional round trip.
+        operations = list()
         if account_to_update.account_name != None:
-            account["account_name"] = account_to_update.account_name
+            operations.append({ "op": "set", "path": "/account_name", "value": account_to_update.account_name })
+            operations.append({ "op": "set", "path": "/account_name_tokens", "value": Account(account_to_update.account_id).create_name_tokens(account_to_update.account_name) })
 
         if account_to_update.balance != None:
-            account["balance"] = account_to_update.balance
+            operations.append({ "op": "set", "path": "/balance", "value": account_to_update.balance })
+            operations.append({ "op": "set", "path": "/balance_cents", "value": to_cents(account_to_update.balance) })
+
+        etag = if_match if if_match is not None else account_to_update.etag
+        key = Account(account_to_update.account_id).create_id(account_to_update.account_id)
+
+        try:
+            updated_account_json = await accounts_db.patch(key, __get_partition_key(account_to_update.account_id, user), operations, etag)
+
+        except NoResultsFoundError:
+            raise NoResultsFoundError("Could not find an account with id '{0}'".format(account_to_update.account_id))
 
-        updated_account_json = accounts_db.upsert(account)
+        except PreconditionFailedError:
+            raise PreconditionFailedError("Account '{0}' was changed since it was read. Get the account and try again.".format(account_to_update.account_id))
 
         logger.debug("User {0} updated account: {1}".format(user, updated_account_json))
 
+        account : dict[str, any] = json.loads(updated_account_json)
         updated_account = map_to_account_api_model(account)
         result = map_to_api_result(updated_account, 1, 0)
 
+        await __index_account(account, owner_index_db)
+
+        if account.get("_etag"):
+            response.headers["ETag"] = account["_etag"]
+
         logger.info("Account '{0}' updated.".format(updated_account.account_id))
 
         return result
@@ -251,6 +738,113 @@ def put(account_to_update: UpdateAccountModel, accounts_db: DbService = Depends(
         elif type(e) == NoResultsFoundError:
             raise HTTPException(status_code=404, detail=e.message)
 
+        elif type(e) == PreconditionFailedError:
+            raise HTTPException(status_code=412, detail=e.message)
+
+        else:
+            raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+
+"""
+POST Account Balance Adjustment
+"""
+@router.post("/{account_id}/adjust", status_code=200, responses=adjust_account_balance_responses, response_model=ApiResult, tags=["accounts"])
+async def adjust(account_id: str, adjustment: AdjustBalanceModel, response: Response, accounts_db: AsyncDbService = Depends(accounts_db), owner_index_db: AsyncDbService = Depends(owner_index_db), user: str = Depends(authorize_access)):
+    """
+    Adds an amount to an account's balance (negative amounts subtract). Unless 'allow_negative' is set, a 409 is returned
+    if the balance would go below 0.00. Concurrent adjustments are all applied; none are lost.
+
+    If the account keeps changing while it is adjusted, a 503 with a 'Retry-After' header is returned. The adjustment was
+    not applied and can be retried.
+    """
+
+    try:
+        logger.debug("User {0} adjusting balance of account '{1}' by: {2}".format(user, account_id, str(adjustment)))
+        logger.debug("Validating adjustment.")
+
+        __validate_adjustment(account_id, adjustment)
+
+        logger.debug("Adjustment is valid.")
+
+        amount_cents = to_cents(adjustment.amount)
+        key = Account(account_id).create_id(account_id)
+        partition_key = __get_partition_key(account_id, user)
+
+        # The balance is incremented by the database in one round trip. Unless a negative balance is allowed, the
+        # increment is conditioned on the balance covering it.
+        condition = "FROM c WHERE IS_DEFINED(c.balance_cents)"
+
+        if amount_cents < 0 and not adjustment.allow_negative:
+            condition += " AND c.balance_cents >= {0}".format(-amount_cents)
+
+        for attempt in range(BALANCE_ADJUST_MAX_RETRIES):
+            try:
+                updated_account_json = await accounts_db.patch(key, partition_key, [{ "op": "incr", "path": "/balance_cents", "value": amount_cents }], None, condition)
+                break
+
+            except PreconditionFailedError:
+                pass
+
+            # The condition failed. Read the account to tell why.
+            account_json = await accounts_db.get(key, partition_key)
+
+            if account_json == None:
+                raise NoResultsFoundError("Could not find an account with id '{0}'".format(account_id))
+
+            account : dict[str, any] = json.loads(account_json)
+
+            if account.get("balance_cents") is None:
+                # Written before balances were stored in cents, so the cents are set from the balance.
+                balance_cents = to_cents(account["balance"]) + amount_cents
+
+                if balance_cents < 0 and not adjustment.allow_negative:
+                    raise InsufficientBalanceError("Account '{0}' balance of {1} is not enough to apply {2}.".format(account_id, account["balance"], adjustment.amount))
+
+                try:
+                    updated_account_json = await accounts_db.patch(key, partition_key, [{ "op": "set", "path": "/balance_cents", "value": balance_cents }], account["_etag"])
+                    break
+
+                except PreconditionFailedError:
+                    pass
+
+            elif account["balance_cents"] + amount_cents < 0 and not adjustment.allow_negative:
+                raise InsufficientBalanceError("Account '{0}' balance of {1} is not enough to apply {2}.".format(account_id, map_to_account_api_model(account).balance, adjustment.amount))
+
+            logger.info("Account '{0}' changed during adjustment (attempt {1} of {2}). Retrying.".format(account_id, attempt + 1, BALANCE_ADJUST_MAX_RETRIES))
+
+        else:
+            raise PreconditionFailedError("Account '{0}' is being changed too often to adjust. Try again.".format(account_id))
+
+        logger.debug("User {0} adjusted account: {1}".format(user, updated_account_json))
+
+        account = json.loads(updated_account_json)
+        result = map_to_api_result(map_to_account_api_model(account), 1, 0)
+
+        await __index_account(account, owner_index_db)
+
+        if account.get("_etag"):
+            response.headers["ETag"] = account["_etag"]
+
+        logger.info("Account '{0}' balance adjusted by {1}.".format(account_id, adjustment.amount))
+
+        return result
+
+    except Exception as e:
+        logger.exception("POST exception on 'adjust' -> {0}".format(e))
+
+        if type(e) == InvalidParameterError:
+            raise HTTPException(status_code=400, detail=e.message)
+
+        elif type(e) == NoResultsFoundError:
+            raise HTTPException(status_code=404, detail=e.message)
+
+        elif type(e) == InsufficientBalanceError:
+            raise HTTPException(status_code=409, detail=e.message)
+
+        elif type(e) == PreconditionFailedError:
+            # Retries ran out while the account was changing, so the adjustment can be tried again shortly.
+            raise HTTPException(status_code=503, detail=e.message, headers={ "Retry-After": str(BALANCE_ADJUST_RETRY_AFTER_SECONDS) })
+
         else:
             raise HTTPException(status_code=500, detail="An unexpected error occurred.")
 
@@ -259,7 +853,7 @@ def put(account_to_update: UpdateAccountModel, accounts_db: DbService = Depends(
 Private Methods
 """
 # Validates parameters for the GET operation.
-def __validate_get_accounts_param(id: str, account_id: str, account_name: str, account_type: str, account_institution: str, account_owner_id: str, balance: Decimal, page: int, results_per_page: int):
+def __validate_get_accounts_param(id: str, account_id: str, account_name: str, account_name_match: str, account_type: str, account_institution: str, account_owner_id: str, balance: Decimal, min_balance: Decimal, max_balance: Decimal, order_by: str, order: str, page: int, results_per_page: int):
         if id != "" and id.isspace():
              raise InvalidParameterError("id is invalid (did you pass only spaces?).")
 
@@ -269,9 +863,36 @@ def __validate_get_accounts_param(id: str, account_id: str, account_name: str, a
         if account_id != "" and account_id.isspace():
             raise InvalidParameterError("account_id is invalid (did you pass only spaces?).")
 
+        __validate_account_filters(account_name, account_name_match, account_type, account_institution, account_owner_id, balance, min_balance, max_balance)
+        __validate_sort(order_by, order)
+
+        if page <= 0:
+            raise InvalidParameterError("page must be greater than 1.")
+
+        if results_per_page <= 0 or results_per_page > MAX_PAGE_SIZE:
+            raise InvalidParameterError("results_per_page must be between 1 to 100 inclusive.")
+
+
+# Validates what the accounts summary is by.
+def __validate_summary_param(by: str, value: str):
+        if by not in ("owner", "institution", "type"):
+            raise InvalidParameterError("by must be one of: owner, institution, type.")
+
+        if by != "owner" and (value == "" or value.isspace()):
+            raise InvalidParameterError("value must be defined when getting a summary by '{0}'.".format(by))
+
+
+# Validates the search filters shared by the GET and export operations.
+def __validate_account_filters(account_name: str, account_name_match: str, account_type: str, account_institution: str, account_owner_id: str, balance: Decimal, min_balance: Decimal, max_balance: Decimal):
         if account_name != "" and account_name.isspace():
             raise InvalidParameterError("account_name is invalid (did you pass only spaces?).")
 
+        if account_name_match not in ACCOUNT_NAME_MATCH_MODES:
+            raise InvalidParameterError("account_name_match must be one of: {0}.".format(", ".join(ACCOUNT_NAME_MATCH_MODES)))
+
+        if account_name != "" and account_name_match == "token" and len(Account("_").create_name_tokens(account_name)) != 1:
+            raise InvalidParameterError("account_name must be a single word when account_name_match is 'token'.")
+
         if account_type != "" and account_type.isspace():
             raise InvalidParameterError("account_type is invalid (did you pass only spaces?).")
 
@@ -284,69 +905,367 @@ def __validate_get_accounts_param(id: str, account_id: str, account_name: str, a
         if balance != None:
             __validate_balance(balance)
 
-        if page <= 0:
-            raise InvalidParameterError("page must be greater than 1.")
+        if min_balance != None:
+            __validate_balance(min_balance)
 
-        if results_per_page <= 0 or results_per_page > MAX_PAGE_SIZE:
-            raise InvalidParameterError("results_per_page must be between 1 to 100 inclusive.")
+        if max_balance != None:
+            __validate_balance(max_balance)
+
+        if min_balance != None and max_balance != None and min_balance > max_balance:
+            raise InvalidParameterError("min_balance must not be greater than max_balance.")
+
+
+# Validates how searches are sorted. Whether the sort can be combined with the filters is checked when the query is built.
+def __validate_sort(order_by: str, order: str):
+        if order_by != "" and order_by not in ACCOUNT_SORTS:
+            raise InvalidParameterError("order_by must be one of: {0}.".format(", ".join(ACCOUNT_SORTS)))
+
+        if order not in ACCOUNT_SORT_ORDERS:
+            raise InvalidParameterError("order must be one of: {0}.".format(", ".join(ACCOUNT_SORT_ORDERS)))
+
+
+# Parses the account fields results are limited to, in the order of the account model. 'None' if not limited.
+def __parse_fields(fields: str) -> list[str]:
+        if fields == "":
+            return None
+
+        names = [name.strip() for name in fields.split(",")]
+        unknown = [name for name in names if name not in ACCOUNT_FIELDS]
+
+        if len(unknown) > 0:
+            raise InvalidParameterError("fields must be a comma separated list of: {0}. Unknown: '{1}'.".format(", ".join(ACCOUNT_FIELDS), ", ".join(unknown)))
+
+        return [name for name in ACCOUNT_FIELDS if name in names]
+
+
+# Builds a search query from its precompiled template. The query is paged with OFFSET/LIMIT unless use_offset is 'False'.
+def __build_get_query(account_name: str, account_name_match: str, account_type: str, account_institution: str, account_owner_id: str, balance: Decimal, min_balance: Decimal, max_balance: Decimal, order_by: str, order: str, page: int, results_per_page: int, use_offset: bool = True, fields: list[str] = None) -> Query:
+    filters = __get_query_filters(account_name, account_name_match, account_type, account_institution, account_owner_id, balance, min_balance, max_balance)
+    sort = None if order_by == "" else order_by
+    select_str = None
+
+    # Only read the fields the selected fields are mapped from.
+    if fields is not None:
+        select_str = "SELECT {0} FROM {1}".format(", ".join("{0}.{1}".format(ACCOUNTS_CONTAINER_ID, field) for field in map_to_account_data_model_fields(fields)), ACCOUNTS_CONTAINER_ID)
+
+    if not use_offset:
+        return account_query_templates.build(filters, order_by=sort, descending=order == "desc", select_str=select_str)
+
+    return account_query_templates.build(filters, (page - 1) * results_per_page, results_per_page, sort, order == "desc", select_str)
 
 
-# Builds a search query.
-def __build_get_query(account_name: str, account_type: str, account_institution: str, account_owner_id: str, balance: Decimal, page: int, results_per_page: int) -> Query:
-    query_str = "SELECT * FROM {0} WHERE ".format(ACCOUNTS_CONTAINER_ID)
-    where_params = dict[str, any]()
-    params = list()
+# Builds a query counting every account a search matches.
+def __build_count_query(account_name: str, account_name_match: str, account_type: str, account_institution: str, account_owner_id: str, balance: Decimal, min_balance: Decimal, max_balance: Decimal) -> Query:
+    return account_query_templates.build_count(__get_query_filters(account_name, account_name_match, account_type, account_institution, account_owner_id, balance, min_balance, max_balance))
+
+
+# Gets the value of each search filter by filter name. Filters not searched by are 'None'.
+def __get_query_filters(account_name: str, account_name_match: str, account_type: str, account_institution: str, account_owner_id: str, balance: Decimal, min_balance: Decimal, max_balance: Decimal) -> dict[str, any]:
+    return {
+        "account_name": None if account_name == "" or account_name_match != "contains" else "%" + account_name + "%",
+        "account_name_prefix": None if account_name == "" or account_name_match != "prefix" else account_name,
+        "account_name_token": None if account_name == "" or account_name_match != "token" else Account("_").create_name_tokens(account_name)[0],
+        "account_type": None if account_type == "" else account_type,
+        "account_institution": None if account_institution == "" else account_institution,
+        "account_owner_id": None if account_owner_id == "" else User(account_owner_id, "_").create_id(account_owner_id),
+        "balance": None if balance == None else to_cents(balance),
+        "min_balance": None if min_balance == None else to_cents(min_balance),
+        "max_balance": None if max_balance == None else to_cents(max_balance)
+    }
+
+
+# Queries a page of accounts, with a continuation token if use_cursor is 'True'. Accounts are limited to the fields given, if any.
+async def __query_accounts(query: Query, use_cursor: bool, results_per_page: int, continuation_token: str, fields: list[str], accounts_db: AsyncDbService) -> tuple[list[any], str]:
+    map_account = map_to_account_api_model if fields is None else lambda item: map_to_account_api_fields(item, fields)
+
+    if use_cursor:
+        items, next_continuation_token = await accounts_db.query_page(query, results_per_page, continuation_token)
+
+        return [map_account(item) for item in items], next_continuation_token
+
+    # Items are mapped as they are streamed from the database.
+    return [map_account(item) async for item in accounts_db.query_items(query)], None
+
+
+# Counts the accounts a count query matches, reusing a recent count of the same query and values.
+async def __count_accounts(query: Query, accounts_db: AsyncDbService) -> int:
+    key = (query.query_str, query.partition_key, tuple(sorted(query.where_params.items())))
+    total = account_count_cache.get(key)
+
+    if total is None:
+        total = await accounts_db.count(query)
+        account_count_cache.set(key, total)
+
+    return total
+
+
+# Streams accounts as newline-delimited JSON.
+async def __stream_accounts(first_item: dict[str, any], items):
+    count = 1
+    yield map_to_account_api_model(first_item).json() + "\n"
+
+    try:
+        async for item in items:
+            count += 1
+            yield map_to_account_api_model(item).json() + "\n"
+
+    except Exception as e:
+        # The status code has already been sent, so the export ends early.
+        logger.exception("GET exception on 'export' -> Export stopped after {0} accounts: {1}".format(count, e))
+        raise
+
+    logger.info("{0} accounts exported.".format(count))
+
+
+# Makes the database continuation token opaque to clients.
+def __encode_continuation_token(continuation_token: str) -> str:
+    if continuation_token is None:
+        return None
+
+    return base64.urlsafe_b64encode(continuation_token.encode("utf-8")).decode("ascii")
+
+
+# Reads a continuation token given by a client back into the database continuation token.
+def __decode_continuation_token(continuation_token: str) -> str:
+    if continuation_token == "":
+        return None
+
+    try:
+        # Validated, as characters outside the alphabet would otherwise be dropped and a garbled token restart from page one.
+        decoded_continuation_token = base64.b64decode(continuation_token.encode("ascii"), altchars=b"-_", validate=True).decode("utf-8")
+
+    except (binascii.Error, UnicodeError, ValueError):
+        decoded_continuation_token = ""
+
+    if decoded_continuation_token == "":
+        raise InvalidParameterError("continuation_token is invalid. Pass the 'continuation_token' returned by the previous page.")
+
+    return decoded_continuation_token
+
+
+# Gets the partition key of an account. Accounts partitioned by owner can only be reached in the user's own partition.
+def __get_partition_key(account_id: str, user: str) -> str:
+    if ACCOUNTS_PARTITION_KEY == "account_owner_id":
+        return User(user, "_").create_id(user)
+
+    return account_id
+
+
+# Gets the entity tag of an account from its database etag, or its last modified time if it has none.
+def __get_entity_tag(item: dict[str, any]) -> str:
+    if item.get("_etag"):
+        return item["_etag"]
+
+    if item.get("_ts") is not None:
+        return '"{0}"'.format(item["_ts"])
+
+    return None
+
+
+# Whether an 'If-None-Match' header matches the entity tag. Tags are compared weakly as per RFC 7232.
+def __etag_matches(if_none_match: str, etag: str) -> bool:
+    if etag is None:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    etag = etag.removeprefix("W/")
+
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+# Validates and creates an account owned by the user.
+async def __create_account(account: AccountModel, user: str, accounts_db: AsyncDbService, projections_db: AsyncDbService, owner_index_db: AsyncDbService) -> Account:
+    logger.debug("Validating account model.")
+
+    __validate_account(account)
+
+    logger.debug("Account model is valid.")
+
+    account_data_model = map_to_account_data_model(account)
+    account_data_model.account_owner_id = User(user, "_").create_id(user) # Add user in token as account owner.
     
-    # Determine limit and offset.
-    limit = results_per_page
+    # Accounts partitioned by owner only conflict within the owner's partition, so the id is claimed across owners first.
+    if ACCOUNTS_PARTITION_KEY == "account_owner_id":
+        await __claim_account_id(account_data_model.account_id, account_data_model.account_owner_id, projections_db)
 
-    if page > 1:
-        offset = ((page - 1) * MAX_PAGE_SIZE)
+    # Create account. The database rejects the create if the account already exists.
+    logger.info("Creating account.")
+
+    try:
+        await accounts_db.create(account_data_model.__dict__)
+
+    except ObjectConflictError:
+        raise ObjectConflictError("Account '{0}' already exists.".format(account_data_model.account_id))
     
+    logger.info("Account '{0}' created.".format(account_data_model.account_id))
+    logger.debug("User {0} created account: {1}".format(user, str(account_data_model)))
+
+    await __index_account(account_data_model.__dict__, owner_index_db)
+
+    return account_data_model
+
+
+# Claims an account id for its owner. An id claimed by another owner is a conflict. An id already claimed by the
+# same owner is left to the account create, which conflicts if the account exists.
+async def __claim_account_id(account_id: str, account_owner_id: str, projections_db: AsyncDbService) -> None:
+    claim = AccountIdClaim(account_id, account_owner_id)
+
+    try:
+        await projections_db.create(claim.__dict__)
+
+    except ObjectConflictError:
+        existing = await projections_db.read(claim.id, claim.id)
+
+        if existing is None or existing["account_owner_id"] != account_owner_id:
+            raise ObjectConflictError("Account '{0}' already exists.".format(account_id))
+
+
+# Keeps the account index of the account's owner up to date with the account written. The account was written,
+# so errors are logged instead of raised. deploy/reset_owner_index.py has accounts that fell behind indexed again.
+async def __index_account(account: dict[str, any], owner_index_db: AsyncDbService) -> None:
+    account_owner_id = account.get("account_owner_id")
+
+    if not account_owner_id:
+        return
+
+    entry = AccountOwnerIndexEntry(account_owner_id, account["account_id"], map_to_account_api_model(account).dict(), account.get("_ts", 0))
+    operations = [{ "op": "set", "path": "/account", "value": entry.account }, { "op": "set", "path": "/account_ts", "value": entry.account_ts }]
+
+    # Only replaces the entry with the same or a newer version of the account.
+    filter_predicate = "FROM c WHERE c.account_ts <= {0}".format(entry.account_ts)
+
+    try:
+        try:
+            await owner_index_db.patch(entry.id, account_owner_id, operations, filter_predicate=filter_predicate)
+
+        except NoResultsFoundError:
+            try:
+                await owner_index_db.create(entry.__dict__)
+
+            except ObjectConflictError:
+                # Indexed by another write in the meantime.
+                await owner_index_db.patch(entry.id, account_owner_id, operations, filter_predicate=filter_predicate)
+
+    except PreconditionFailedError:
+        logger.debug("A newer version of account '{0}' is already indexed.".format(account["account_id"]))
+
+    except Exception as e:
+        logger.exception("index exception -> Error indexing account '{0}' of '{1}': {2}".format(account["account_id"], account_owner_id, e))
+
+
+# Indexes every account of an owner, then marks the owner as indexed so their accounts are not read again.
+async def __rebuild_owner_index(account_owner_id: str, accounts_db: AsyncDbService, owner_index_db: AsyncDbService) -> None:
+    query = account_query_templates.build({ "account_owner_id": account_owner_id })
+    marker = AccountOwnerIndexMarker(account_owner_id)
+
+    async for item in accounts_db.query_items(query):
+        await __index_account(item, owner_index_db)
+        marker.accounts += 1
+
+    try:
+        await owner_index_db.create(marker.__dict__)
+
+    except ObjectConflictError:
+        # Indexed by another request in the meantime.
+        pass
+
+
+# Reads the accounts of a bulk request from a JSON array or newline-delimited JSON body.
+async def __read_bulk_payloads(request: Request) -> list[any]:
+    body = await request.body()
+
+    if request.headers.get("content-type", "").startswith("application/x-ndjson"):
+        payloads = list()
+
+        for line in body.decode("utf-8").splitlines():
+            if line.strip() == "":
+                continue
+
+            try:
+                payloads.append(json.loads(line))
+
+            except ValueError as e:
+                payloads.append(InvalidParameterError("Line is not valid JSON: {0}".format(e)))
+
     else:
-        offset = 0
+        try:
+            payloads = json.loads(body)
 
-    if account_name != "":
-        account_name_param = "{0}.account_name LIKE @account_name".format(ACCOUNTS_CONTAINER_ID)
-        params.append(account_name_param)
+        except ValueError:
+            raise InvalidParameterError("The body must be a JSON array of accounts.")
 
-        where_params["@account_name"] = "%" + account_name + "%"
+        if type(payloads) != list:
+            raise InvalidParameterError("The body must be a JSON array of accounts.")
 
-    if account_type != "":
-        account_type_param = "{0}.account_type=@account_type".format(ACCOUNTS_CONTAINER_ID)
-        params.append(account_type_param)
+    if len(payloads) == 0:
+        raise InvalidParameterError("At least one account must be given.")
 
-        where_params["@account_type"] = account_type
+    if len(payloads) > BULK_MAX_ITEMS:
+        raise InvalidParameterError("At most {0} accounts can be created at once. You gave: {1}.".format(BULK_MAX_ITEMS, len(payloads)))
 
-    if account_institution != "":
-        account_institution_param = "{0}.account_institution=@account_institution".format(ACCOUNTS_CONTAINER_ID)
-        params.append(account_institution_param)
+    return payloads
 
-        where_params["@account_institution"] = account_institution
 
-    if account_owner_id != "":
-        account_owner_id_param = "{0}.account_owner_id=@account_owner_id".format(ACCOUNTS_CONTAINER_ID)
-        params.append(account_owner_id_param)
+# Creates one account of a bulk request, returning its status instead of raising.
+async def __create_bulk_account(index: int, payload: any, user: str, accounts_db: AsyncDbService, projections_db: AsyncDbService, owner_index_db: AsyncDbService, semaphore: asyncio.Semaphore) -> BulkItemResultModel:
+    result = BulkItemResultModel(index=index)
 
-        where_params["@account_owner_id"] = User(account_owner_id, "_").create_id(account_owner_id)
+    try:
+        if isinstance(payload, Exception):
+            raise payload
 
-    if balance != None:
-        balance_param = "{0}.balance=@balance".format(ACCOUNTS_CONTAINER_ID)
-        params.append(balance_param)
+        if type(payload) != dict:
+            raise InvalidParameterError("The account must be a JSON object.")
 
-        where_params["@balance"] = str(balance)
+        result.account_id = payload.get("account_id")
 
-    # Build query with gathered parameters.
-    for i in range(len(params)):
-        if (i == len(params) - 1):
-            query_str += params[i]
+        try:
+            account = AccountModel(**payload)
 
-        else:
-            query_str += "{0} AND ".format(params[i])
+        except ValueError as e:
+            raise InvalidParameterError("The account is invalid: {0}".format(e))
+
+        async with semaphore:
+            await __create_account(account, user, accounts_db, projections_db, owner_index_db)
+
+        result.status_code = 201
+
+    except InvalidParameterError as e:
+        result.status_code = 400
+        result.detail = e.message
+
+    except ObjectConflictError as e:
+        result.status_code = 409
+        result.detail = e.message
+
+    except Exception as e:
+        logger.exception("POST exception on 'bulk' -> Error creating account at index {0}: {1}".format(index, e))
 
-    query_str += " OFFSET {0} LIMIT {1}".format(offset, limit)
+        result.status_code = 500
+        result.detail = "An unexpected error occurred."
 
-    return Query(query_str, where_params)
+    return result
+
+
+# Validates the account ids of a batch get.
+def __validate_batch_get(batch: BatchGetAccountsModel):
+    if batch.account_ids is None or len(batch.account_ids) == 0:
+        raise InvalidParameterError("account_ids must have at least 1 account id.")
+
+    if len(batch.account_ids) > BATCH_GET_MAX_ITEMS:
+        raise InvalidParameterError("account_ids must have at most {0} account ids.".format(BATCH_GET_MAX_ITEMS))
+
+    for account_id in batch.account_ids:
+        if account_id == "" or account_id.isspace():
+            raise InvalidParameterError("account_ids must not have empty account ids (did you pass only spaces?).")
+
+
+# Reads one account of a batch get by key, waiting for the semaphore first. 'None' if it does not exist.
+async def __read_batch_account(account_id: str, user: str, accounts_db: AsyncDbService, semaphore: asyncio.Semaphore) -> dict[str, any]:
+    async with semaphore:
+        return await accounts_db.read(Account(account_id).create_id(account_id), __get_partition_key(account_id, user))
 
 
 # Validates the account is valid.
@@ -390,6 +1309,20 @@ def __validate_update_account(account: UpdateAccountModel):
         __validate_balance(account.balance)
 
 
+# Validates the balance adjustment is valid.
+def __validate_adjustment(account_id: str, adjustment: AdjustBalanceModel):
+    if not account_id or account_id.isspace():
+        raise InvalidParameterError("account_id must be defined.")
+
+    if not adjustment.amount or adjustment.amount.isspace():
+        raise InvalidParameterError("amount must be defined.")
+
+    __validate_balance(adjustment.amount)
+
+    if Decimal(adjustment.amount) == 0:
+        raise InvalidParameterError("amount cannot be 0.00.")
+
+
 # Validate the balance is in a decimal format and has exactly 2 decimal places.
 def __validate_balance(balance: any):
     formatError = "balance must be defined as a monetary value with exactly 2 decimal places. Example: '1000.00'. You put: '{0}'".format(str(balance))
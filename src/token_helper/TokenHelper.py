@@ -1,16 +1,20 @@
+import calendar
+import hashlib
 import logging as logger
 
 from datetime import datetime, timedelta
-from jose import jwt
+from jose import jwk, jwt
+from jose.constants import ALGORITHMS
 from jose.exceptions import JWTError, JWTClaimsError, ExpiredSignatureError
 from src.token_helper.exceptions.CredentialNotInJwtError import CredentialNotInJwtError
+from src.libs.utils.TtlCache import TtlCache
 
 class TokenHelper():
     """
     Helps generate and authorize tokens.
     """
 
-    def __init__(self, secret_key: str, algo: str, access_token_expire_minutes: int=30):
+    def __init__(self, secret_key: str, algo: str, access_token_expire_minutes: int=30, token_cache: TtlCache=None):
         """
         Parameters
         ----------
@@ -23,10 +27,23 @@ class TokenHelper():
         access_token_expire_minutes: int
             Time in minutes the token expires. Default is 30 minutes.
 
+        token_cache: TtlCache
+            Cache of verified token digests to their (username, exp) claims. Tokens found in
+            the cache skip signature verification until they expire. 'None' by default, which
+            verifies every token.
+
         Raises
         ------
         ValueError
             Raised if the secret key or algorithm are undefined.
+
+        JWKError
+            Raised if the key for an asymmetric algorithm cannot be parsed.
+
+        Remarks
+        -------
+        For asymmetric algorithms (RSA/EC) the secret key is the PEM private key. It is parsed
+        once here, along with its public key, instead of on every encode and decode.
         """
 
         if secret_key is None or secret_key.isspace():
@@ -38,6 +55,13 @@ class TokenHelper():
         self.secret_key = secret_key
         self.algo = algo
         self.access_token_expire_minutes = access_token_expire_minutes
+        self.token_cache = token_cache
+        self.signing_key = secret_key
+        self.verifying_key = secret_key
+
+        if algo in ALGORITHMS.RSA or algo in ALGORITHMS.EC:
+            self.signing_key = jwk.construct(secret_key, algo)
+            self.verifying_key = self.signing_key.public_key()
 
 
     def create_access_token(self, data: dict, expires: bool=True) -> str:
@@ -83,7 +107,7 @@ class TokenHelper():
 
             logger.debug("Encoding token.")
 
-            encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algo)
+            encoded_jwt = jwt.encode(to_encode, self.signing_key, algorithm=self.algo)
 
             logger.debug("Token encoded.")
 
@@ -124,11 +148,21 @@ class TokenHelper():
         str:
             The username in the token.
         """
+
+        digest = None
+
+        if self.token_cache is not None:
+            digest = hashlib.sha256(token.encode("utf-8")).hexdigest()
+            username = self.__get_cached_username(digest)
+
+            if username is not None:
+                logger.debug("Token found in the verified token cache.")
+                return username
         
         try:
             logger.debug("Decoding token: '{0}'".format(token))
 
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algo])
+            payload = jwt.decode(token, self.verifying_key, algorithms=[self.algo])
 
             logger.debug("Token decoded. Retrieving username payload.")
 
@@ -154,8 +188,64 @@ class TokenHelper():
             raise
         
         logger.debug("username extracted from token.")
+
+        if digest is not None:
+            self.__cache_username(digest, username, payload.get("exp"))
         
         return username
-    
-    
-    
\ No newline at end of file
+
+
+    def get_cache_stats(self) -> dict[str, int]:
+        """
+        Gets the hit and miss counters of the verified token cache.
+
+        Returns
+        -------
+        dict[str, int]
+            The 'hits', 'misses' and 'size' of the cache. All 0 if the cache is disabled.
+        """
+
+        if self.token_cache is None:
+            return { "hits": 0, "misses": 0, "size": 0 }
+
+        return { "hits": self.token_cache.hits, "misses": self.token_cache.misses, "size": len(self.token_cache) }
+
+
+    """
+    Private Methods
+    """
+
+    # Gets the username of a verified token from the cache if it has not expired.
+    def __get_cached_username(self, digest: str) -> str:
+        cached = self.token_cache.get(digest)
+
+        if cached is None:
+            return None
+
+        username, exp = cached
+
+        # Same check jose makes, so an expired token is decoded again and raises as before.
+        if exp is not None and exp < self.__now():
+            self.token_cache.delete(digest)
+            return None
+
+        return username
+
+
+    # Caches the username of a verified token until the token expires.
+    def __cache_username(self, digest: str, username: str, exp: any) -> None:
+        ttl_seconds = None
+
+        if exp is not None:
+            exp = int(exp)
+            ttl_seconds = exp - self.__now() + 1
+
+            if ttl_seconds <= 0:
+                return
+
+        self.token_cache.set(digest, (username, exp), ttl_seconds)
+
+
+    # The current UTC time in seconds since the epoch.
+    def __now(self) -> int:
+        return calendar.timegm(datetime.utcnow().utctimetuple())
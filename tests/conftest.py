@@ -0,0 +1,18 @@
+import os
+
+# Settings are read when the app is imported, so the test settings are set before any test module imports it.
+# Settings already in the environment are kept.
+_test_settings = {
+    "ORIGINS": "http://localhost",
+    "SECRET_KEY": "test_secret",
+    "ALGORITHM": "HS256",
+    "ENDPOINT": "https://localhost:8081",
+    "KEY": "dGVzdGtleQ==",
+    "DATABASE_ID": "db",
+    "USERS_CONTAINER_ID": "users",
+    "ACCOUNTS_CONTAINER_ID": "accounts",
+    "MAX_PAGE_SIZE": "100"
+}
+
+for name, value in _test_settings.items():
+    os.environ.setdefault(name, value)
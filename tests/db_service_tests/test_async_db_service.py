@@ -0,0 +1,172 @@
+import json
+import unittest
+
+from unittest.mock import AsyncMock, MagicMock
+from azure.core import MatchConditions
+from azure.cosmos.exceptions import CosmosAccessConditionFailedError, CosmosResourceExistsError, CosmosResourceNotFoundError
+from src.db_service.AsyncCosmosClientRegistry import AsyncCosmosClientRegistry
+from src.db_service.AsyncDbService import AsyncDbService
+from src.db_service.DbOptions import DbOptions
+from src.db_service.Query import Query
+from src.exceptions.NoResultsFoundError import NoResultsFoundError
+from src.exceptions.ObjectConflictError import ObjectConflictError
+from src.exceptions.PreconditionFailedError import PreconditionFailedError
+
+# Async iterator standing in for the paged results of query_items.
+class AsyncItems:
+    def __init__(self, items: list):
+        self.iterator = iter(items)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self.iterator)
+
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def init_db_service(container) -> AsyncDbService:
+    db_service = AsyncDbService(DbOptions("some_endpoint", "some_key", "some_db", "accounts"), AsyncCosmosClientRegistry())
+    db_service.container = container
+
+    return db_service
+
+
+class AsyncDbServiceTests(unittest.IsolatedAsyncioTestCase):
+    # Assert that get returns the JSON document of the item.
+    async def test_get_returns_item(self):
+        container = AsyncMock()
+        container.read_item.return_value = { "id": "account::1234" }
+
+        result = await init_db_service(container).get("account::1234", "1234")
+
+        self.assertEqual({ "id": "account::1234" }, json.loads(result))
+        container.read_item.assert_awaited_once_with(item="account::1234", partition_key="1234")
+
+
+    # Assert that get returns None if the item does not exist.
+    async def test_get_returns_none(self):
+        container = AsyncMock()
+        container.read_item.side_effect = CosmosResourceNotFoundError()
+
+        result = await init_db_service(container).get("account::1234", "1234")
+
+        self.assertIsNone(result)
+
+
+    # Assert that query collects every item from the async pages.
+    async def test_query_returns_items(self):
+        container = MagicMock()
+        container.query_items.return_value = AsyncItems([{ "id": "1" }, { "id": "2" }])
+
+        result = await init_db_service(container).query(Query("SELECT * FROM accounts"))
+
+        self.assertEqual(2, len(json.loads(result)))
+
+
+    # Assert that query_items yields every item across the pages of results.
+    async def test_query_items_yields_items(self):
+        container = MagicMock()
+        container.query_items.return_value.by_page.return_value = AsyncItems([AsyncItems([{ "id": "1" }, { "id": "2" }]), AsyncItems([{ "id": "3" }])])
+
+        result = [item async for item in init_db_service(container).query_items(Query("SELECT * FROM accounts"), 2)]
+
+        self.assertEqual(["1", "2", "3"], [item["id"] for item in result])
+        self.assertEqual(2, container.query_items.call_args.kwargs["max_item_count"])
+
+
+    # Assert that a query scoped to a partition is only sent to that partition.
+    async def test_query_items_scoped_to_partition(self):
+        container = MagicMock()
+        container.query_items.return_value.by_page.return_value = AsyncItems([AsyncItems([{ "id": "1" }])])
+
+        query = Query("SELECT * FROM accounts WHERE accounts.account_owner_id=@account_owner_id", { "@account_owner_id": "user::some_user" }, partition_key="user::some_user")
+        result = [item async for item in init_db_service(container).query_items(query)]
+
+        self.assertEqual(1, len(result))
+        self.assertEqual("user::some_user", container.query_items.call_args.kwargs["partition_key"])
+        self.assertNotIn("enable_cross_partition_query", container.query_items.call_args.kwargs)
+
+
+    # Assert that query_page returns the items of one page and the continuation token.
+    async def test_query_page_returns_page_and_token(self):
+        container = MagicMock()
+        pages = AsyncItems([AsyncItems([{ "id": "1" }]), AsyncItems([{ "id": "2" }])])
+        pages.continuation_token = "some_token"
+        container.query_items.return_value.by_page.return_value = pages
+
+        items, continuation_token = await init_db_service(container).query_page(Query("SELECT * FROM accounts"), 1, "previous_token")
+
+        self.assertEqual([{ "id": "1" }], items)
+        self.assertEqual("some_token", continuation_token)
+        container.query_items.return_value.by_page.assert_called_once_with("previous_token")
+
+
+    # Assert that count adds up the partial counts returned.
+    async def test_count_returns_total(self):
+        container = MagicMock()
+        container.query_items.return_value = AsyncItems([3, 4])
+
+        result = await init_db_service(container).count(Query("SELECT VALUE COUNT(1) FROM accounts"))
+
+        self.assertEqual(7, result)
+
+
+    # Assert that create returns the JSON document of the item created.
+    async def test_create_returns_item(self):
+        container = AsyncMock()
+        container.create_item.return_value = { "id": "account::1234" }
+
+        result = await init_db_service(container).create({ "id": "account::1234" })
+
+        self.assertEqual({ "id": "account::1234" }, json.loads(result))
+
+
+    # Assert that an ObjectConflictError is raised if the item already exists.
+    async def test_create_raises_object_conflict_error(self):
+        container = AsyncMock()
+        container.create_item.side_effect = CosmosResourceExistsError()
+
+        with self.assertRaises(ObjectConflictError):
+            await init_db_service(container).create({ "id": "account::1234" })
+
+
+    # Assert that patch sends the operations conditioned on the etag.
+    async def test_patch_sends_etag_condition(self):
+        container = AsyncMock()
+        container.patch_item.return_value = { "id": "account::1234", "_etag": "new_etag" }
+        operations = [{ "op": "set", "path": "/balance", "value": "1.00" }]
+
+        result = await init_db_service(container).patch("account::1234", "1234", operations, "old_etag")
+
+        self.assertEqual("new_etag", json.loads(result)["_etag"])
+        self.assertEqual("old_etag", container.patch_item.call_args.kwargs["etag"])
+        self.assertEqual(MatchConditions.IfNotModified, container.patch_item.call_args.kwargs["match_condition"])
+
+
+    # Assert that patch raises a PreconditionFailedError if the etag does not match.
+    async def test_patch_raises_precondition_failed_error(self):
+        container = AsyncMock()
+        container.patch_item.side_effect = CosmosAccessConditionFailedError()
+
+        with self.assertRaises(PreconditionFailedError):
+            await init_db_service(container).patch("account::1234", "1234", [{ "op": "remove", "path": "/x" }], "old_etag")
+
+
+    # Assert that patch raises a NoResultsFoundError if the item does not exist.
+    async def test_patch_raises_no_results_found_error(self):
+        container = AsyncMock()
+        container.patch_item.side_effect = CosmosResourceNotFoundError()
+
+        with self.assertRaises(NoResultsFoundError):
+            await init_db_service(container).patch("account::1234", "1234", [{ "op": "remove", "path": "/x" }])
+
+
+    # Assert that a ValueError is raised if the id is not defined.
+    async def test_delete_raises_value_error(self):
+        with self.assertLogs(level="ERROR"):
+            with self.assertRaises(ValueError):
+                await init_db_service(AsyncMock()).delete(" ", "1234")
@@ -0,0 +1,176 @@
+import json
+import unittest
+
+from fakeredis import aioredis
+from unittest.mock import AsyncMock, MagicMock
+from src.db_service.CachedDbService import CachedDbService
+from src.db_service.DbOptions import DbOptions
+from src.db_service.cache.CacheBackend import CacheBackend
+from src.db_service.cache.MemoryCacheBackend import MemoryCacheBackend
+from src.db_service.cache.RedisCacheBackend import RedisCacheBackend
+from src.exceptions.PreconditionFailedError import PreconditionFailedError
+
+def init_db_service() -> AsyncMock:
+    db_service = AsyncMock()
+    db_service.db_options = DbOptions("some_endpoint", "some_key", "some_db", "accounts")
+
+    return db_service
+
+
+def init_document(ts: int = 1, etag: str = "etag-1") -> dict:
+    return { "id": "account::1234", "account_id": "1234", "balance": "10.00", "_etag": etag, "_ts": ts }
+
+
+class CachedDbServiceTests():
+    """
+    Tests run against every cache backend.
+    """
+
+    def init_cache(self) -> CacheBackend:
+        raise NotImplementedError()
+
+
+    def init_cached_db_service(self, db_service: AsyncMock) -> CachedDbService:
+        return CachedDbService(db_service, self.init_cache(), 30, "account_id")
+
+
+    # Assert that a second read is served from the cache.
+    async def test_read_is_cached(self):
+        db_service = init_db_service()
+        db_service.read.return_value = init_document()
+        cached_db_service = self.init_cached_db_service(db_service)
+
+        first = await cached_db_service.read("account::1234", "1234")
+        second = await cached_db_service.read("account::1234", "1234")
+
+        self.assertEqual(first, second)
+        db_service.read.assert_awaited_once_with("account::1234", "1234")
+
+
+    # Assert that items which do not exist are not cached.
+    async def test_read_does_not_cache_missing_items(self):
+        db_service = init_db_service()
+        db_service.read.return_value = None
+        cached_db_service = self.init_cached_db_service(db_service)
+
+        self.assertIsNone(await cached_db_service.get("account::1234", "1234"))
+        self.assertIsNone(await cached_db_service.get("account::1234", "1234"))
+        self.assertEqual(2, db_service.read.await_count)
+
+
+    # Assert that get_etag returns the etag of the cached item.
+    async def test_get_etag(self):
+        db_service = init_db_service()
+        db_service.read.return_value = init_document()
+        cached_db_service = self.init_cached_db_service(db_service)
+
+        self.assertIsNone(await cached_db_service.get_etag("account::1234", "1234"))
+
+        await cached_db_service.read("account::1234", "1234")
+
+        self.assertEqual("etag-1", await cached_db_service.get_etag("account::1234", "1234"))
+
+
+    # Assert that a patch replaces the cached item with the patched item.
+    async def test_patch_updates_cache(self):
+        db_service = init_db_service()
+        db_service.read.return_value = init_document()
+        db_service.patch.return_value = json.dumps(init_document(2, "etag-2"))
+        cached_db_service = self.init_cached_db_service(db_service)
+
+        await cached_db_service.read("account::1234", "1234")
+        await cached_db_service.patch("account::1234", "1234", [], "etag-1")
+        result = json.loads(await cached_db_service.get("account::1234", "1234"))
+
+        self.assertEqual("etag-2", result["_etag"])
+        db_service.read.assert_awaited_once()
+
+
+    # Assert that an older write does not replace a newer cached item.
+    async def test_older_write_does_not_replace_newer_item(self):
+        db_service = init_db_service()
+        db_service.read.return_value = init_document(5, "etag-5")
+        db_service.upsert.return_value = json.dumps(init_document(4, "etag-4"))
+        cached_db_service = self.init_cached_db_service(db_service)
+
+        await cached_db_service.read("account::1234", "1234")
+        await cached_db_service.upsert(init_document())
+
+        self.assertEqual("etag-5", await cached_db_service.get_etag("account::1234", "1234"))
+
+
+    # Assert that a read finishing after a write in the same second does not replace the written item.
+    async def test_stale_read_does_not_replace_written_item(self):
+        db_service = init_db_service()
+        db_service.patch.return_value = json.dumps(init_document(5, "etag-written"))
+        cached_db_service = self.init_cached_db_service(db_service)
+
+        async def read_before_patch(id, partition_key):
+            await cached_db_service.patch("account::1234", "1234", [])
+            return init_document(5, "etag-read")
+
+        db_service.read.side_effect = read_before_patch
+
+        await cached_db_service.read("account::1234", "1234")
+
+        self.assertEqual("etag-written", await cached_db_service.get_etag("account::1234", "1234"))
+
+        # A write in the same second replaces the cached item.
+        db_service.upsert.return_value = json.dumps(init_document(5, "etag-upserted"))
+        await cached_db_service.upsert(init_document())
+
+        self.assertEqual("etag-upserted", await cached_db_service.get_etag("account::1234", "1234"))
+
+
+    # Assert that a failed conditional patch evicts the stale cached item.
+    async def test_precondition_failed_evicts(self):
+        db_service = init_db_service()
+        db_service.read.return_value = init_document()
+        db_service.patch.side_effect = PreconditionFailedError("changed")
+        cached_db_service = self.init_cached_db_service(db_service)
+
+        await cached_db_service.read("account::1234", "1234")
+
+        with self.assertRaises(PreconditionFailedError):
+            await cached_db_service.patch("account::1234", "1234", [], "etag-1")
+
+        self.assertIsNone(await cached_db_service.get_etag("account::1234", "1234"))
+
+
+    # Assert that a delete evicts the cached item.
+    async def test_delete_evicts(self):
+        db_service = init_db_service()
+        db_service.read.return_value = init_document()
+        cached_db_service = self.init_cached_db_service(db_service)
+
+        await cached_db_service.read("account::1234", "1234")
+        await cached_db_service.delete("account::1234", "1234")
+        await cached_db_service.read("account::1234", "1234")
+
+        self.assertEqual(2, db_service.read.await_count)
+        db_service.delete.assert_awaited_once_with("account::1234", "1234")
+
+
+class MemoryCachedDbServiceTests(CachedDbServiceTests, unittest.IsolatedAsyncioTestCase):
+    def init_cache(self) -> CacheBackend:
+        return MemoryCacheBackend(100)
+
+
+class RedisCachedDbServiceTests(CachedDbServiceTests, unittest.IsolatedAsyncioTestCase):
+    def init_cache(self) -> CacheBackend:
+        return RedisCacheBackend(aioredis.FakeRedis())
+
+
+class CachedDbServiceFailureTests(unittest.IsolatedAsyncioTestCase):
+    # Assert that reads fall through to the database when the cache fails.
+    async def test_cache_failure_falls_through(self):
+        cache = MagicMock(CacheBackend)
+        cache.get = AsyncMock(side_effect=ConnectionError("cache down"))
+        cache.set = AsyncMock(side_effect=ConnectionError("cache down"))
+        db_service = init_db_service()
+        db_service.read.return_value = init_document()
+        cached_db_service = CachedDbService(db_service, cache, 30, "account_id")
+
+        result = await cached_db_service.read("account::1234", "1234")
+
+        self.assertEqual("1234", result["account_id"])
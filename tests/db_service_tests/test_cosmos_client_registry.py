@@ -0,0 +1,61 @@
+import unittest
+
+from unittest.mock import patch
+from src.db_service.CosmosClientRegistry import CosmosClientRegistry
+from src.db_service.DbOptions import DbOptions
+from src.db_service.DbService import DbService
+
+class CosmosClientRegistryTests(unittest.TestCase):
+    # Assert that containers sharing an endpoint reuse one client and each container is opened once.
+    @patch("src.db_service.CosmosClientRegistry.CosmosClient")
+    def test_get_container_reuses_clients(self, cosmos_client_mock):
+        registry = CosmosClientRegistry()
+        accounts_options = DbOptions("some_endpoint", "some_key", "some_db", "accounts")
+        users_options = DbOptions("some_endpoint", "some_key", "some_db", "users")
+
+        first = registry.get_container(accounts_options)
+        second = registry.get_container(accounts_options)
+        registry.get_container(users_options)
+
+        self.assertIs(first, second)
+        self.assertEqual(1, cosmos_client_mock.call_count)
+        self.assertEqual(2, cosmos_client_mock.return_value.get_database_client.call_count)
+
+
+    # Assert that registered options are opened on startup and reused by DbService.connect.
+    @patch("src.db_service.CosmosClientRegistry.CosmosClient")
+    def test_open_connects_registered_services(self, cosmos_client_mock):
+        registry = CosmosClientRegistry()
+        db_service = DbService(DbOptions("some_endpoint", "some_key", "some_db", "accounts"), registry)
+
+        registry.open()
+        db_service.connect()
+        db_service.connect()
+
+        self.assertEqual(1, cosmos_client_mock.call_count)
+        self.assertEqual(1, cosmos_client_mock.return_value.get_database_client.call_count)
+        self.assertIsNotNone(db_service.container)
+
+
+    # Assert that close closes every client and a new client is opened afterwards.
+    @patch("src.db_service.CosmosClientRegistry.CosmosClient")
+    def test_close_closes_clients(self, cosmos_client_mock):
+        registry = CosmosClientRegistry()
+        db_options = DbOptions("some_endpoint", "some_key", "some_db", "accounts")
+
+        registry.get_container(db_options)
+        registry.close()
+
+        cosmos_client_mock.return_value.close.assert_called_once()
+
+        registry.get_container(db_options)
+
+        self.assertEqual(2, cosmos_client_mock.call_count)
+
+
+    # Assert that a TypeError is raised if the options registered are None.
+    def test_register_raises_type_error(self):
+        registry = CosmosClientRegistry()
+
+        with self.assertRaises(TypeError):
+            registry.register(None)
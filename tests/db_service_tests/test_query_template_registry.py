@@ -0,0 +1,172 @@
+import unittest
+
+from src.db_service.QueryTemplateRegistry import QueryTemplateRegistry
+from src.exceptions.InvalidParameterError import InvalidParameterError
+
+def init_registry() -> QueryTemplateRegistry:
+    return QueryTemplateRegistry("SELECT * FROM accounts", {
+        "account_name": "accounts.account_name LIKE @account_name",
+        "account_type": "accounts.account_type=@account_type",
+        "balance": "accounts.balance=@balance"
+    })
+
+
+def init_sorted_registry() -> QueryTemplateRegistry:
+    return QueryTemplateRegistry("SELECT * FROM accounts", {
+        "account_name": "accounts.account_name LIKE @account_name",
+        "account_type": "accounts.account_type=@account_type",
+        "account_owner_id": "accounts.account_owner_id=@account_owner_id",
+        "min_balance": "accounts.balance >= @min_balance"
+    }, sorts={
+        "balance": ("accounts.balance", {
+            "account_type": "accounts.account_type",
+            "account_owner_id": "accounts.account_owner_id",
+            "min_balance": None
+        })
+    })
+
+
+class QueryTemplateRegistryTests(unittest.TestCase):
+    # Assert that a shape is compiled when first used and only once.
+    def test_compiles_shapes_when_used(self):
+        registry = init_registry()
+
+        self.assertEqual(0, len(registry))
+
+        registry.build({ "account_type": "checking" })
+        registry.build({ "account_type": "savings" })
+        registry.build({ "account_type": "savings" }, 0, 10)
+
+        self.assertEqual(2, len(registry))
+
+
+    # Assert that queries of the same shape share the same query text.
+    def test_same_shape_same_text(self):
+        registry = init_registry()
+
+        first = registry.build({ "account_type": "checking", "balance": None }, 0, 10)
+        second = registry.build({ "account_type": "savings" }, 20, 5)
+
+        self.assertIs(first.query_str, second.query_str)
+        self.assertEqual("SELECT * FROM accounts WHERE accounts.account_type=@account_type OFFSET @offset LIMIT @limit", first.query_str)
+        self.assertEqual({ "@account_type": "savings", "@offset": 20, "@limit": 5 }, second.where_params)
+
+
+    # Assert that conditions are joined in the canonical order whatever order they are given in.
+    def test_canonical_order(self):
+        query = init_registry().build({ "balance": "10.00", "account_name": "%a%" })
+
+        self.assertEqual("SELECT * FROM accounts WHERE accounts.account_name LIKE @account_name AND accounts.balance=@balance", query.query_str)
+
+
+    # Assert that a query without filters has no WHERE clause.
+    def test_no_filters(self):
+        query = init_registry().build({})
+
+        self.assertEqual("SELECT * FROM accounts", query.query_str)
+        self.assertIsNone(query.build_where_params())
+
+
+    # Assert that unknown filters are rejected.
+    def test_unknown_filter_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            init_registry().build({ "owner": "someone" })
+
+
+    # Assert that the share of queries built by each shape is reported.
+    def test_get_stats(self):
+        registry = init_registry()
+
+        registry.build({ "account_type": "checking" }, 0, 10)
+        registry.build({ "account_type": "savings" }, 0, 10)
+        registry.build({}, 0, 10)
+        registry.build({})
+
+        stats = registry.get_stats()
+
+        self.assertEqual(3, stats["templates"])
+        self.assertEqual(4, stats["queries"])
+        self.assertEqual({ "account_type:paged": 0.5, "none:paged": 0.25, "none": 0.25 }, stats["shapes"])
+
+
+    # Assert that queries filtering on the partition key are scoped to its partition.
+    def test_partition_key_filter_scopes_query(self):
+        registry = QueryTemplateRegistry("SELECT * FROM accounts", {
+            "account_type": "accounts.account_type=@account_type",
+            "account_owner_id": "accounts.account_owner_id=@account_owner_id"
+        }, "account_owner_id")
+
+        scoped = registry.build({ "account_owner_id": "user::some_user", "account_type": "checking" })
+        spanning = registry.build({ "account_type": "checking" })
+
+        self.assertEqual({ "partition_key": "user::some_user" }, scoped.build_partition_options())
+        self.assertEqual({ "enable_cross_partition_query": True }, spanning.build_partition_options())
+
+
+    # Assert that the partition key filter must be one of the filters.
+    def test_unknown_partition_key_filter_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            QueryTemplateRegistry("SELECT * FROM accounts", { "account_type": "accounts.account_type=@account_type" }, "account_owner_id")
+
+
+    # Assert that a sort is combined with filters on its field and one equality filter ordered by first.
+    def test_sorted_shapes(self):
+        registry = init_sorted_registry()
+
+        ranged = registry.build({ "min_balance": 100 }, 0, 10, "balance", True)
+        filtered = registry.build({ "account_type": "checking", "min_balance": 100 }, order_by="balance")
+
+        self.assertEqual("SELECT * FROM accounts WHERE accounts.balance >= @min_balance ORDER BY accounts.balance DESC OFFSET @offset LIMIT @limit", ranged.query_str)
+        self.assertEqual("SELECT * FROM accounts WHERE accounts.account_type=@account_type AND accounts.balance >= @min_balance ORDER BY accounts.account_type ASC, accounts.balance ASC", filtered.query_str)
+        self.assertIs(filtered.query_str, registry.build({ "account_type": "savings", "min_balance": 5 }, order_by="balance").query_str)
+        self.assertEqual(2, len(registry))
+        self.assertEqual({ "min_balance:paged:balance desc": 1 / 3, "account_type+min_balance:balance asc": 2 / 3 }, registry.get_stats()["shapes"])
+
+
+    # Assert that sorted shapes no index can serve are rejected.
+    def test_unsupported_sorted_shape_raises_invalid_parameter_error(self):
+        registry = init_sorted_registry()
+
+        with self.assertRaises(InvalidParameterError):
+            registry.build({ "account_name": "%a%" }, order_by="balance")
+
+        with self.assertRaises(InvalidParameterError):
+            registry.build({ "account_type": "checking", "account_owner_id": "user::some_user" }, order_by="balance")
+
+        with self.assertRaises(ValueError):
+            registry.build({}, order_by="account_id")
+
+
+    # Assert that every pair of fields sorted queries order by is reported.
+    def test_get_composite_indexes(self):
+        self.assertEqual([("accounts.account_type", "accounts.balance"), ("accounts.account_owner_id", "accounts.balance")], init_sorted_registry().get_composite_indexes())
+
+
+    # Assert that a count query has the same filters and parameters as the template's query.
+    def test_build_count(self):
+        registry = QueryTemplateRegistry("SELECT * FROM accounts", {
+            "account_type": "accounts.account_type=@account_type",
+            "account_owner_id": "accounts.account_owner_id=@account_owner_id"
+        }, "account_owner_id", count_str="SELECT VALUE COUNT(1) FROM accounts")
+
+        query = registry.build_count({ "account_owner_id": "user::some_user", "account_type": "checking" })
+
+        self.assertEqual("SELECT VALUE COUNT(1) FROM accounts WHERE accounts.account_type=@account_type AND accounts.account_owner_id=@account_owner_id", query.query_str)
+        self.assertEqual({ "@account_type": "checking", "@account_owner_id": "user::some_user" }, query.where_params)
+        self.assertEqual({ "partition_key": "user::some_user" }, query.build_partition_options())
+
+        with self.assertRaises(ValueError):
+            init_registry().build_count({})
+
+
+    # Assert that a projected query keeps the filters of its shape and is compiled once.
+    def test_projected_shape(self):
+        registry = init_registry()
+
+        first = registry.build({ "account_type": "checking" }, select_str="SELECT accounts.account_id FROM accounts")
+        second = registry.build({ "account_type": "savings" }, select_str="SELECT accounts.account_id FROM accounts")
+
+        self.assertEqual("SELECT accounts.account_id FROM accounts WHERE accounts.account_type=@account_type", first.query_str)
+        self.assertIs(first.query_str, second.query_str)
+        self.assertEqual(1, len(registry))
+        self.assertEqual({ "account_type:projected": 1.0 }, registry.get_stats()["shapes"])
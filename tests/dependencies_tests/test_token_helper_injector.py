@@ -0,0 +1,56 @@
+import unittest
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from src.dependencies import TokenHelperInjector
+from src.token_helper.TokenHelper import JWTError
+
+def init_rsa_private_key() -> str:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    return private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption()).decode("utf-8")
+
+
+class TokenHelperInjectorTests(unittest.TestCase):
+    # Assert that the same token helper is returned on every call.
+    def test_call_returns_shared_token_helper(self):
+        injector = TokenHelperInjector("some_secret", "HS256", 30, 10)
+
+        self.assertIs(injector(), injector())
+
+
+    # Assert that tokens are signed and verified with a pre-parsed asymmetric key.
+    def test_call_returns_token_helper_with_parsed_rsa_key(self):
+        token_helper = TokenHelperInjector(init_rsa_private_key(), "RS256", 30)()
+        token = token_helper.create_access_token({ "sub": "some_user" })
+
+        self.assertNotIsInstance(token_helper.signing_key, str)
+        self.assertEqual("some_user", token_helper.decode_access_token(token))
+
+
+    # Assert that rotating the key swaps the token helper and rejects tokens signed with the old key.
+    def test_rotate_key_replaces_token_helper(self):
+        injector = TokenHelperInjector("some_secret", "HS256", 30, 10)
+        old_token_helper = injector()
+        token = old_token_helper.create_access_token({ "sub": "some_user" })
+        old_token_helper.decode_access_token(token)
+
+        injector.rotate_key("other_secret")
+
+        self.assertIsNot(old_token_helper, injector())
+        self.assertEqual("HS256", injector().algo)
+
+        with self.assertLogs(level="ERROR"):
+            with self.assertRaises(JWTError):
+                injector().decode_access_token(token)
+
+
+    # Assert that a ValueError is raised if the rotated key is undefined.
+    def test_rotate_key_raises_value_error(self):
+        injector = TokenHelperInjector("some_secret", "HS256", 30)
+
+        with self.assertRaises(ValueError):
+            injector.rotate_key(" ")
@@ -0,0 +1,24 @@
+import unittest
+
+from src.libs.api_model_mappers.account_mapper import map_to_account_api_fields, map_to_account_data_model_fields
+
+class MapToAccountApiFieldsTests(unittest.TestCase):
+    # Assert that a projected account maps to only the fields given.
+    def test_map_to_account_api_fields_maps(self):
+        payload = { "account_id": "1234", "balance": "1000.00", "balance_cents": 97500 }
+
+        result = map_to_account_api_fields(payload, ["account_id", "balance"])
+
+        self.assertEqual({ "account_id": "1234", "balance": "975.00" }, result)
+
+
+    # Assert that the balance is read from both the balance and its cents.
+    def test_map_to_account_data_model_fields_maps(self):
+        self.assertEqual(["account_id", "balance", "balance_cents"], map_to_account_data_model_fields(["account_id", "balance"]))
+
+
+    # Assert that a TypeError is raised if the payload is None.
+    def test_map_to_account_api_fields_raises_type_error(self):
+        with self.assertLogs(level="ERROR"):
+            with self.assertRaises(TypeError):
+                map_to_account_api_fields(None, ["account_id"])
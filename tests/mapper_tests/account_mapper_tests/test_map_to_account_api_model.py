@@ -18,7 +18,7 @@ class MapToAccountApiModelTests(unittest.TestCase):
         self.assertEqual("some_account_name", result.account_name)
         self.assertEqual("some_account_type", result.account_type)
         self.assertEqual("some_bank", result.account_institution)
-        self.assertEqual(Decimal("1000.00"), result.balance)
+        self.assertEqual("1000.00", result.balance)
 
 
     # Assert that a TypeError is raised if the payload is None.
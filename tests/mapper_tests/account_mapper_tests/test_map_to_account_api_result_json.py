@@ -0,0 +1,32 @@
+import json
+import unittest
+
+from src.libs.api_model_mappers.account_mapper import map_to_account_api_model, map_to_account_api_result_json
+from src.libs.api_model_mappers.api_result_mapper import map_to_api_result
+from src.data_models.Account import Account
+
+class MapToAccountApiResultJsonTests(unittest.TestCase):
+    # Assert that the JSON matches the API result built from the account API model.
+    def test_map_to_account_api_result_json_maps(self):
+        payload = Account("1234", "some_account_name", "some_account_type", "some_bank", "some_owner", "1000.00").__dict__
+
+        result = json.loads(map_to_account_api_result_json(payload, 2))
+        expected = json.loads(map_to_api_result(map_to_account_api_model(payload), 1, 2).json())
+
+        self.assertEqual(expected, result)
+
+
+    # Assert that fields missing from the payload use the API model defaults.
+    def test_map_to_account_api_result_json_uses_defaults(self):
+        result = json.loads(map_to_account_api_result_json({ "account_id": "1234" }, 1))
+
+        self.assertEqual("1234", result["content"]["account_id"])
+        self.assertIsNone(result["content"]["account_name"])
+        self.assertEqual("0.00", result["content"]["balance"])
+
+
+    # Assert that a TypeError is raised if the payload is None.
+    def test_map_to_account_api_result_json_raises_type_error(self):
+        with self.assertLogs(level="ERROR"):
+            with self.assertRaises(TypeError):
+                map_to_account_api_result_json(None, 1)
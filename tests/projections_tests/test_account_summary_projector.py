@@ -0,0 +1,124 @@
+import json
+import unittest
+
+from unittest.mock import MagicMock
+from src.data_models.Account import Account
+from src.data_models.AccountSummary import AccountSummary
+from src.exceptions.NoResultsFoundError import NoResultsFoundError
+from src.exceptions.ObjectConflictError import ObjectConflictError
+from src.projections.AccountSummaryProjector import AccountSummaryProjector
+
+# Projections container kept in memory.
+class ProjectionsDb:
+    def __init__(self):
+        self.items = dict[str, dict]()
+
+    def read(self, id: str, partition_key: str) -> dict:
+        return self.items.get(id)
+
+    def upsert(self, item: dict) -> str:
+        self.items[item["id"]] = dict(item)
+        return json.dumps(item)
+
+    def create(self, item: dict) -> str:
+        if item["id"] in self.items:
+            raise ObjectConflictError("exists")
+
+        return self.upsert(item)
+
+    def patch(self, id: str, partition_key: str, operations: list) -> str:
+        if id not in self.items:
+            raise NoResultsFoundError("missing")
+
+        for operation in operations:
+            self.items[id][operation["path"][1:]] += operation["value"]
+
+        return json.dumps(self.items[id])
+
+    def delete(self, id: str, partition_key: str) -> None:
+        self.items.pop(id, None)
+
+
+def init_account(account_id: str, institution: str, balance: str, lsn: int) -> dict:
+    account = Account(account_id, "some_account_name", "checking", institution, "user::some_user", balance).__dict__
+    account["_lsn"] = lsn
+
+    return account
+
+
+def init_accounts_db(*pages: list) -> MagicMock:
+    accounts_db = MagicMock()
+    accounts_db.read_change_feed.return_value = iter([(page, "token{0}".format(i)) for i, page in enumerate(pages)])
+
+    return accounts_db
+
+
+def summary_id(dimension: str, value: str) -> str:
+    return AccountSummary(dimension, value).id
+
+
+class AccountSummaryProjectorTests(unittest.TestCase):
+    # Assert that new accounts are added to every summary.
+    def test_run_once_adds_accounts(self):
+        projections_db = ProjectionsDb()
+        accounts_db = init_accounts_db([init_account("1", "Some Bank", "10.50", 1), init_account("2", "Other Bank", "5.25", 2)])
+
+        applied = AccountSummaryProjector(accounts_db, projections_db).run_once()
+
+        self.assertEqual(2, applied)
+        self.assertEqual(2, projections_db.items[summary_id("owner", "user::some_user")]["count"])
+        self.assertEqual(1575, projections_db.items[summary_id("owner", "user::some_user")]["balance_cents"])
+        self.assertEqual(2, projections_db.items[summary_id("type", "checking")]["count"])
+        self.assertEqual(1050, projections_db.items[summary_id("institution", "Some Bank")]["balance_cents"])
+        self.assertEqual("token0", projections_db.items["change_feed_checkpoint::account_summary"]["continuation_token"])
+
+
+    # Assert that a changed account only adds its difference.
+    def test_run_once_applies_difference(self):
+        projections_db = ProjectionsDb()
+        AccountSummaryProjector(init_accounts_db([init_account("1", "Some Bank", "10.00", 1)]), projections_db).run_once()
+
+        accounts_db = init_accounts_db([init_account("1", "Other Bank", "4.00", 2)])
+        AccountSummaryProjector(accounts_db, projections_db).run_once()
+
+        self.assertEqual(1, projections_db.items[summary_id("owner", "user::some_user")]["count"])
+        self.assertEqual(400, projections_db.items[summary_id("owner", "user::some_user")]["balance_cents"])
+        self.assertEqual(0, projections_db.items[summary_id("institution", "Some Bank")]["count"])
+        self.assertEqual(1, projections_db.items[summary_id("institution", "Other Bank")]["count"])
+        accounts_db.read_change_feed.assert_called_once_with("token0", 100)
+
+
+    # Assert that changes already applied are skipped when replayed.
+    def test_run_once_skips_applied_changes(self):
+        projections_db = ProjectionsDb()
+        account = init_account("1", "Some Bank", "10.00", 1)
+
+        AccountSummaryProjector(init_accounts_db([account]), projections_db).run_once()
+        applied = AccountSummaryProjector(init_accounts_db([account]), projections_db).run_once()
+
+        self.assertEqual(0, applied)
+        self.assertEqual(1, projections_db.items[summary_id("owner", "user::some_user")]["count"])
+
+
+    # Assert that the checkpoint is removed on reset.
+    def test_reset_removes_checkpoint(self):
+        projections_db = ProjectionsDb()
+        projector = AccountSummaryProjector(init_accounts_db([init_account("1", "Some Bank", "10.00", 1)]), projections_db)
+
+        projector.run_once()
+        projector.reset()
+
+        self.assertNotIn("change_feed_checkpoint::account_summary", projections_db.items)
+
+
+
+    # Assert that values differing only in case or spacing are summarized apart.
+    def test_run_once_keeps_exact_values_apart(self):
+        projections_db = ProjectionsDb()
+        accounts_db = init_accounts_db([init_account("1", "Some Bank", "10.00", 1), init_account("2", "somebank", "5.00", 2)])
+
+        AccountSummaryProjector(accounts_db, projections_db).run_once()
+
+        self.assertEqual("Some Bank", projections_db.items[summary_id("institution", "Some Bank")]["value"])
+        self.assertEqual(1000, projections_db.items[summary_id("institution", "Some Bank")]["balance_cents"])
+        self.assertEqual(500, projections_db.items[summary_id("institution", "somebank")]["balance_cents"])
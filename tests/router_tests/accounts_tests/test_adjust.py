@@ -0,0 +1,192 @@
+import json
+
+from fastapi.testclient import TestClient
+from src.libs.api_models.AccountModel import AccountModel
+from src.main import app
+from src.routers.accounts import authorize_access, accounts_db, inject_jwt_bearer, owner_index_db
+from src.data_models.Account import Account
+from src.exceptions.PreconditionFailedError import PreconditionFailedError
+from unittest.mock import AsyncMock
+
+# Setup
+def init_inject_jwt_bearer_authenticates():
+    return "some_token"
+
+
+def init_authorize_access_returns_user():
+    return "some_user"
+
+
+def init_account(balance: str, etag: str, legacy: bool = False) -> str:
+    account = Account("1234", "some_account_name", "some_account_type", "some_bank", "some_owner", balance)
+    account._etag = etag
+
+    if legacy:
+        del account.balance_cents # Written before balances were stored in cents.
+
+    return json.dumps(account.__dict__)
+
+
+def init_accounts_db_adjusts_balance():
+    accounts_db_mock = AsyncMock()
+    accounts_db_mock.patch.return_value = init_account("975.00", "some_new_etag")
+
+    return accounts_db_mock
+
+
+def init_accounts_db_adjusts_legacy_balance():
+    accounts_db_mock = AsyncMock()
+    accounts_db_mock.get.return_value = init_account("1000.00", "some_etag", True)
+    accounts_db_mock.patch.side_effect = [PreconditionFailedError(), init_account("975.00", "some_new_etag")]
+
+    return accounts_db_mock
+
+
+def init_accounts_db_balance_too_low():
+    accounts_db_mock = AsyncMock()
+    accounts_db_mock.get.return_value = init_account("1000.00", "some_etag")
+    accounts_db_mock.patch.side_effect = PreconditionFailedError()
+
+    return accounts_db_mock
+
+
+def init_accounts_db_keeps_changing():
+    accounts_db_mock = AsyncMock()
+    accounts_db_mock.get.return_value = init_account("1000.00", "some_etag")
+    accounts_db_mock.patch.side_effect = PreconditionFailedError()
+
+    return accounts_db_mock
+
+
+def init_accounts_db_get_returns_none():
+    accounts_db_mock = AsyncMock()
+    accounts_db_mock.patch.side_effect = PreconditionFailedError()
+    accounts_db_mock.get.return_value = None
+
+    return accounts_db_mock
+
+
+def init_accounts_db_patch_raises_exception():
+    accounts_db_mock = AsyncMock()
+    accounts_db_mock.patch.side_effect = Exception()
+
+    return accounts_db_mock
+
+
+def init_owner_index_db():
+    return AsyncMock()
+
+
+client = TestClient(app)
+
+# Test
+# Asserts a 200 status code is returned with the adjusted balance.
+def test_adjust_returns_200():
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
+    accounts_db_mock = init_accounts_db_adjusts_balance()
+    app.dependency_overrides[accounts_db] = lambda: accounts_db_mock
+    app.dependency_overrides[owner_index_db] = init_owner_index_db
+
+    response = client.post("/accounts/1234/adjust", json={ "amount": "-25.00" })
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] == "some_new_etag"
+
+    account = AccountModel(**response.json()["content"])
+
+    assert account.balance == "975.00"
+
+    id, partition_key, operations, etag, condition = accounts_db_mock.patch.call_args.args
+
+    assert operations == [{ "op": "incr", "path": "/balance_cents", "value": -2500 }]
+    assert etag is None
+    assert condition == "FROM c WHERE IS_DEFINED(c.balance_cents) AND c.balance_cents >= 2500"
+    accounts_db_mock.get.assert_not_awaited()
+
+
+# Asserts an account written before balances were stored in cents has its cents set from its balance.
+def test_adjust_sets_legacy_balance():
+    accounts_db_mock = init_accounts_db_adjusts_legacy_balance()
+    app.dependency_overrides[accounts_db] = lambda: accounts_db_mock
+    app.dependency_overrides[owner_index_db] = init_owner_index_db
+
+    response = client.post("/accounts/1234/adjust", json={ "amount": "-25.00" })
+
+    assert response.status_code == 200
+    assert accounts_db_mock.patch.await_count == 2
+
+    id, partition_key, operations, etag = accounts_db_mock.patch.call_args.args
+
+    assert operations == [{ "op": "set", "path": "/balance_cents", "value": 97500 }]
+    assert etag == "some_etag"
+
+
+# Asserts a 400 status code is returned.
+def test_adjust_returns_400():
+    app.dependency_overrides[accounts_db] = init_accounts_db_adjusts_balance
+    app.dependency_overrides[owner_index_db] = init_owner_index_db
+
+    # Case 1: not 2 decimal places.
+    response = client.post("/accounts/1234/adjust", json={ "amount": "25" })
+
+    assert response.status_code == 400
+
+    # Case 2: zero.
+    response = client.post("/accounts/1234/adjust", json={ "amount": "0.00" })
+
+    assert response.status_code == 400
+
+
+# Asserts a 404 status code is returned.
+def test_adjust_returns_404():
+    app.dependency_overrides[accounts_db] = init_accounts_db_get_returns_none
+    app.dependency_overrides[owner_index_db] = init_owner_index_db
+
+    response = client.post("/accounts/1234/adjust", json={ "amount": "25.00" })
+
+    assert response.status_code == 404
+
+
+# Asserts a 409 status code is returned if the balance would go negative.
+def test_adjust_returns_409():
+    accounts_db_mock = init_accounts_db_balance_too_low()
+    app.dependency_overrides[accounts_db] = lambda: accounts_db_mock
+    app.dependency_overrides[owner_index_db] = init_owner_index_db
+
+    response = client.post("/accounts/1234/adjust", json={ "amount": "-1000.01" })
+
+    assert response.status_code == 409
+    assert accounts_db_mock.patch.await_count == 1
+
+    # Allowed when negative balances are allowed.
+    accounts_db_mock = init_accounts_db_adjusts_balance()
+    app.dependency_overrides[accounts_db] = lambda: accounts_db_mock
+
+    response = client.post("/accounts/1234/adjust", json={ "amount": "-1000.01", "allow_negative": True })
+
+    assert response.status_code == 200
+    assert accounts_db_mock.patch.call_args.args[4] == "FROM c WHERE IS_DEFINED(c.balance_cents)"
+
+
+# Asserts a 503 status code is returned if the account keeps changing until the retries run out.
+def test_adjust_returns_503():
+    accounts_db_mock = init_accounts_db_keeps_changing()
+    app.dependency_overrides[accounts_db] = lambda: accounts_db_mock
+    app.dependency_overrides[owner_index_db] = init_owner_index_db
+
+    response = client.post("/accounts/1234/adjust", json={ "amount": "-25.00" })
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert accounts_db_mock.patch.await_count == 5
+
+
+# Asserts a 500 status code is returned.
+def test_adjust_returns_500():
+    app.dependency_overrides[accounts_db] = init_accounts_db_patch_raises_exception
+    app.dependency_overrides[owner_index_db] = init_owner_index_db
+
+    response = client.post("/accounts/1234/adjust", json={ "amount": "25.00" })
+
+    assert response.status_code == 500
@@ -0,0 +1,86 @@
+from fastapi.testclient import TestClient
+from src.main import app
+from src.routers.accounts import authorize_access, accounts_db, inject_jwt_bearer
+from src.data_models.Account import Account
+from unittest.mock import AsyncMock
+
+# Setup
+def init_inject_jwt_bearer_authenticates():
+    return "some_token"
+
+
+def init_authorize_access_returns_user():
+    return "some_user"
+
+
+def init_accounts_db_reads_accounts():
+    accounts = {
+        "account::1": Account("1", "some_account_name", "some_account_type", "some_bank", "some_owner", "1000.00").__dict__,
+        "account::3": Account("3", "some_other_account_name", "some_account_type", "some_bank", "some_owner", "25.00").__dict__
+    }
+
+    async def read(id, partition_key):
+        return accounts.get(id)
+
+    accounts_db_mock = AsyncMock()
+    accounts_db_mock.read.side_effect = read
+
+    return accounts_db_mock
+
+
+def init_accounts_db_read_raises_exception():
+    accounts_db_mock = AsyncMock()
+    accounts_db_mock.read.side_effect = Exception()
+
+    return accounts_db_mock
+
+
+client = TestClient(app)
+
+# Test
+# Asserts a 200 status code is returned with the accounts found and the account ids missing.
+def test_batch_get_returns_200():
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
+    accounts_db_mock = init_accounts_db_reads_accounts()
+    app.dependency_overrides[accounts_db] = lambda: accounts_db_mock
+
+    response = client.post("/accounts/batch-get", json={ "account_ids": ["3", "2", "1", "3"] })
+
+    assert response.status_code == 200
+    assert response.json()["results"] == 2
+
+    content = response.json()["content"]
+
+    assert [account["account_id"] for account in content["found"]] == ["3", "1"]
+    assert content["missing"] == ["2"]
+    assert accounts_db_mock.read.await_count == 3
+
+
+# Asserts a 400 status code is returned.
+def test_batch_get_returns_400():
+    app.dependency_overrides[accounts_db] = init_accounts_db_reads_accounts
+
+    # Case 1: no account ids.
+    response = client.post("/accounts/batch-get", json={ "account_ids": [] })
+
+    assert response.status_code == 400
+
+    # Case 2: too many account ids.
+    response = client.post("/accounts/batch-get", json={ "account_ids": [str(i) for i in range(101)] })
+
+    assert response.status_code == 400
+
+    # Case 3: empty account id.
+    response = client.post("/accounts/batch-get", json={ "account_ids": ["1", " "] })
+
+    assert response.status_code == 400
+
+
+# Asserts a 500 status code is returned.
+def test_batch_get_returns_500():
+    app.dependency_overrides[accounts_db] = init_accounts_db_read_raises_exception
+
+    response = client.post("/accounts/batch-get", json={ "account_ids": ["1"] })
+
+    assert response.status_code == 500
@@ -0,0 +1,126 @@
+import json
+
+from fastapi.testclient import TestClient
+from src.main import app
+from src.routers.accounts import authorize_access, accounts_db, inject_jwt_bearer, owner_index_db, projections_db
+from src.exceptions.ObjectConflictError import ObjectConflictError
+from unittest.mock import AsyncMock
+
+# Setup
+def init_inject_jwt_bearer_authenticates():
+    return "some_token"
+
+
+def init_authorize_access_returns_user():
+    return "some_user"
+
+
+def init_accounts_db_creates_accounts():
+    accounts_db_mock = AsyncMock()
+
+    # Account '2' already exists.
+    async def create(item):
+        if item["account_id"] == "2":
+            raise ObjectConflictError("Item '{0}' already exists.".format(item["id"]))
+
+        return json.dumps(item)
+
+    accounts_db_mock.create.side_effect = create
+
+    return accounts_db_mock
+
+
+def init_accounts_db_create_raises_exception():
+    accounts_db_mock = AsyncMock()
+    accounts_db_mock.create.side_effect = Exception()
+
+    return accounts_db_mock
+
+
+def init_account(account_id: str) -> dict:
+    return {
+        "account_id": account_id,
+        "account_name": "some_name",
+        "account_type": "some_type",
+        "account_institution": "some_bank",
+        "balance": "1000.00"
+    }
+
+
+def init_projections_db():
+    return AsyncMock()
+
+
+def init_owner_index_db():
+    return AsyncMock()
+
+
+client = TestClient(app)
+
+# Test
+# Asserts a 200 status code is returned with the status of each account.
+def test_bulk_returns_200():
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
+    accounts_db_mock = init_accounts_db_creates_accounts()
+    app.dependency_overrides[accounts_db] = lambda: accounts_db_mock
+    app.dependency_overrides[projections_db] = init_projections_db
+    app.dependency_overrides[owner_index_db] = init_owner_index_db
+
+    invalid_account = init_account("3")
+    invalid_account["balance"] = "1000"
+
+    response = client.post("/accounts/bulk", json=[init_account("1"), init_account("2"), invalid_account])
+
+    assert response.status_code == 200
+
+    content = response.json()
+
+    assert content["results"] == 3
+    assert [result["status_code"] for result in content["content"]] == [201, 409, 400]
+    assert content["content"][1]["account_id"] == "2"
+    assert accounts_db_mock.create.await_count == 2
+
+
+# Asserts newline-delimited JSON bodies are accepted.
+def test_bulk_ndjson_returns_200():
+    accounts_db_mock = init_accounts_db_creates_accounts()
+    app.dependency_overrides[accounts_db] = lambda: accounts_db_mock
+    app.dependency_overrides[projections_db] = init_projections_db
+    app.dependency_overrides[owner_index_db] = init_owner_index_db
+
+    body = "\n".join([json.dumps(init_account("1")), "not json", json.dumps(init_account("4"))])
+
+    response = client.post("/accounts/bulk", data=body, headers={ "Content-Type": "application/x-ndjson" })
+
+    assert response.status_code == 200
+    assert [result["status_code"] for result in response.json()["content"]] == [201, 400, 201]
+
+
+# Asserts an unexpected error on one account is reported without failing the others.
+def test_bulk_reports_500_per_account():
+    app.dependency_overrides[accounts_db] = init_accounts_db_create_raises_exception
+    app.dependency_overrides[projections_db] = init_projections_db
+    app.dependency_overrides[owner_index_db] = init_owner_index_db
+
+    response = client.post("/accounts/bulk", json=[init_account("1")])
+
+    assert response.status_code == 200
+    assert response.json()["content"][0]["status_code"] == 500
+
+
+# Asserts a 400 status code is returned.
+def test_bulk_returns_400():
+    app.dependency_overrides[accounts_db] = init_accounts_db_creates_accounts
+    app.dependency_overrides[projections_db] = init_projections_db
+    app.dependency_overrides[owner_index_db] = init_owner_index_db
+
+    # Case 1: empty list.
+    response = client.post("/accounts/bulk", json=[])
+
+    assert response.status_code == 400
+
+    # Case 2: not a list.
+    response = client.post("/accounts/bulk", json=init_account("1"))
+
+    assert response.status_code == 400
@@ -0,0 +1,88 @@
+import json
+
+from fastapi.testclient import TestClient
+from src.libs.api_models.AccountModel import AccountModel
+from src.main import app
+from src.routers.accounts import authorize_access, accounts_db, inject_jwt_bearer
+from src.data_models.Account import Account
+from unittest.mock import AsyncMock
+
+# Setup
+def init_inject_jwt_bearer_authenticates():
+    return "some_token"
+
+
+def init_authorize_access_returns_user():
+    return "some_user"
+
+
+def init_accounts_db_queries_accounts(count: int):
+    accounts_db_mock = AsyncMock()
+
+    async def query_items(query, page_size):
+        for i in range(count):
+            yield Account(i.__str__(), "some_account_name", "some_account_type", "some_bank", "some_owner", "1000.00").__dict__
+
+    accounts_db_mock.query_items = query_items
+
+    return accounts_db_mock
+
+
+def init_accounts_db_query_raises_exception():
+    accounts_db_mock = AsyncMock()
+
+    async def query_items(query, page_size):
+        raise Exception()
+        yield
+
+    accounts_db_mock.query_items = query_items
+
+    return accounts_db_mock
+
+
+client = TestClient(app)
+
+# Test
+# Asserts a 200 status code is returned with one account per line.
+def test_export_returns_200():
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
+    app.dependency_overrides[accounts_db] = lambda: init_accounts_db_queries_accounts(3)
+
+    response = client.get("/accounts/export?account_institution={0}".format("some_bank"))
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = response.text.splitlines()
+
+    assert len(lines) == 3
+
+    account = AccountModel(**json.loads(lines[2]))
+
+    assert account.account_id == "2"
+
+
+# Asserts a 400 status code is returned.
+def test_export_returns_400():
+    response = client.get("/accounts/export?account_owner_id={0}".format(" "))
+
+    assert response.status_code == 400
+
+
+# Asserts a 404 status code is returned.
+def test_export_returns_404():
+    app.dependency_overrides[accounts_db] = lambda: init_accounts_db_queries_accounts(0)
+
+    response = client.get("/accounts/export?account_institution={0}".format("some_bank"))
+
+    assert response.status_code == 404
+
+
+# Asserts a 500 status code is returned.
+def test_export_returns_500():
+    app.dependency_overrides[accounts_db] = init_accounts_db_query_raises_exception
+
+    response = client.get("/accounts/export?account_institution={0}".format("some_bank"))
+
+    assert response.status_code == 500
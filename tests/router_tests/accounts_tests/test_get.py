@@ -5,7 +5,7 @@ from src.libs.api_models.AccountModel import AccountModel
 from src.main import app
 from src.routers.accounts import authorize_access, accounts_db, inject_jwt_bearer
 from src.data_models.Account import Account
-from unittest.mock import Mock
+from unittest.mock import AsyncMock
 
 # Setup
 def init_inject_jwt_bearer_authenticates():
@@ -17,35 +17,71 @@ def init_authorize_access_returns_user():
 
 
 def init_accounts_db_gets_account():
-    accounts_db_mock = Mock()
-    accounts_db_mock.get.return_value = json.dumps(Account("1234", "some_account_name", "some_account_type", "some_bank", "some_owner", "1000.00").__dict__)
+    accounts_db_mock = AsyncMock()
+    accounts_db_mock.read.return_value = Account("1234", "some_account_name", "some_account_type", "some_bank", "some_owner", "1000.00").__dict__
+
+    return accounts_db_mock
+
+
+def init_accounts_db_gets_account_with_etag():
+    account = Account("1234", "some_account_name", "some_account_type", "some_bank", "some_owner", "1000.00").__dict__
+    account["_etag"] = '"some_etag"'
+
+    accounts_db_mock = AsyncMock()
+    accounts_db_mock.get_etag.return_value = None
+    accounts_db_mock.read.return_value = account
+
+    return accounts_db_mock
+
+
+def init_accounts_db_gets_cached_etag():
+    accounts_db_mock = AsyncMock()
+    accounts_db_mock.get_etag.return_value = '"some_etag"'
 
     return accounts_db_mock
 
 
 def init_accounts_db_gets_account_returns_none():
-    accounts_db_mock = Mock()
-    accounts_db_mock.get.return_value = None
+    accounts_db_mock = AsyncMock()
+    accounts_db_mock.read.return_value = None
 
     return accounts_db_mock
 
 
 def init_accounts_db_gets_account_raises_exception():
-    accounts_db_mock = Mock()
-    accounts_db_mock.get.side_effect = Exception()
+    accounts_db_mock = AsyncMock()
+    accounts_db_mock.read.side_effect = Exception()
 
     return accounts_db_mock
 
 
 def init_accounts_db_queries_accounts():
-    accounts_db_mock = Mock()
+    accounts_db_mock = AsyncMock()
 
     accounts = list()
     
     for i in range(2):
         accounts.append(Account(i.__str__(), "some_account_name", "some_account_type", "some_bank", "some_owner", "1000.00").__dict__)
 
-    accounts_db_mock.query.return_value = json.dumps(accounts)
+    async def query_items(query):
+        for account in accounts:
+            yield account
+
+    accounts_db_mock.query_items = query_items
+
+    return accounts_db_mock
+
+
+def init_accounts_db_queries_accounts_page():
+    accounts_db_mock = AsyncMock()
+
+    accounts = list()
+    
+    for i in range(2):
+        accounts.append(Account(i.__str__(), "some_account_name", "some_account_type", "some_bank", "some_owner", "1000.00").__dict__)
+
+    accounts_db_mock.query_page.return_value = (accounts, '{"token": "some_token"}')
+    accounts_db_mock.count.return_value = 25
 
     return accounts_db_mock
 
@@ -69,6 +105,15 @@ def test_get_account_returns_200():
 
     assert type(account) == AccountModel
     assert account.account_id == "1234"
+    assert content["content"] == AccountModel(account_id="1234", account_name="some_account_name", account_type="some_account_type", account_institution="some_bank", balance="1000.00").dict()
+    assert content["results"] == 1
+    assert content["page"] == 1
+
+    # Test get by account_id.
+    response = client.get("/accounts?account_id={0}".format("1234"))
+
+    assert response.status_code == 200
+    assert response.json()["content"]["account_id"] == "1234"
 
     # Test get by query.
     app.dependency_overrides[accounts_db] = init_accounts_db_queries_accounts
@@ -89,12 +134,289 @@ def test_get_account_returns_200():
     assert account.account_id == "0"
 
 
+# Asserts the account's etag is returned in the 'ETag' header.
+def test_get_account_returns_etag():
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[accounts_db] = init_accounts_db_gets_account_with_etag
+    app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
+
+    response = client.get("/accounts?account_id={0}".format("1234"))
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] == '"some_etag"'
+
+    # A different etag returns the account.
+    response = client.get("/accounts?account_id={0}".format("1234"), headers={ "If-None-Match": '"other_etag"' })
+
+    assert response.status_code == 200
+    assert response.json()["content"]["account_id"] == "1234"
+
+
+# Asserts a 304 status code is returned.
+def test_get_account_returns_304():
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[accounts_db] = init_accounts_db_gets_account_with_etag
+    app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
+
+    # Test the etag of the account read.
+    response = client.get("/accounts?account_id={0}".format("1234"), headers={ "If-None-Match": 'W/"some_etag"' })
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == '"some_etag"'
+    assert response.content == b""
+
+    # Test the cached etag, which does not read the account.
+    accounts_db_mock = init_accounts_db_gets_cached_etag()
+    app.dependency_overrides[accounts_db] = lambda: accounts_db_mock
+
+    response = client.get("/accounts?id={0}".format("account::1234"), headers={ "If-None-Match": '"other_etag", "some_etag"' })
+
+    assert response.status_code == 304
+    accounts_db_mock.read.assert_not_awaited()
+
+
+# Asserts accounts partitioned by owner are read from the user's partition.
+def test_get_account_partitioned_by_owner_returns_200(monkeypatch):
+    monkeypatch.setattr("src.routers.accounts.ACCOUNTS_PARTITION_KEY", "account_owner_id")
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
+    accounts_db_mock = init_accounts_db_gets_account()
+    app.dependency_overrides[accounts_db] = lambda: accounts_db_mock
+
+    response = client.get("/accounts?account_id={0}".format("1234"))
+
+    assert response.status_code == 200
+    accounts_db_mock.read.assert_awaited_once_with("account::1234", "user::some_user")
+
+
+# Asserts a page is returned with an opaque continuation token that resumes the query.
+def test_get_accounts_with_cursor_returns_200():
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
+    accounts_db_mock = init_accounts_db_queries_accounts_page()
+    app.dependency_overrides[accounts_db] = lambda: accounts_db_mock
+
+    response = client.get("/accounts?account_name={0}&cursor=true&results_per_page=2".format("some_account_name"))
+
+    assert response.status_code == 200
+
+    content = response.json()
+    continuation_token = content["continuation_token"]
+
+    assert len(content["content"]) == 2
+    assert continuation_token is not None
+    assert continuation_token != '{"token": "some_token"}'
+
+    query, page_size, db_continuation_token = accounts_db_mock.query_page.call_args.args
+
+    assert "OFFSET" not in query.query_str
+    assert page_size == 2
+    assert db_continuation_token is None
+
+    # Resume from the continuation token.
+    response = client.get("/accounts?account_name={0}&continuation_token={1}".format("some_account_name", continuation_token))
+
+    assert response.status_code == 200
+    assert accounts_db_mock.query_page.call_args.args[2] == '{"token": "some_token"}'
+
+
+# Asserts account_name is searched with the index when matched by prefix or token.
+def test_get_accounts_by_name_match_returns_200():
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
+    accounts_db_mock = init_accounts_db_queries_accounts_page()
+    app.dependency_overrides[accounts_db] = lambda: accounts_db_mock
+
+    # Test prefix.
+    response = client.get("/accounts?account_name={0}&account_name_match=prefix&cursor=true".format("Every"))
+
+    assert response.status_code == 200
+
+    query = accounts_db_mock.query_page.call_args.args[0]
+
+    assert "STARTSWITH" in query.query_str
+    assert "LIKE" not in query.query_str
+    assert query.where_params["@account_name_prefix"] == "Every"
+
+    # Test token.
+    response = client.get("/accounts?account_name={0}&account_name_match=token&cursor=true".format("Checking"))
+
+    assert response.status_code == 200
+
+    query = accounts_db_mock.query_page.call_args.args[0]
+
+    assert "ARRAY_CONTAINS" in query.query_str
+    assert query.where_params["@account_name_token"] == "checking"
+
+
+# Asserts balances are searched by their cents.
+def test_get_accounts_by_balance_range_returns_200():
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
+    accounts_db_mock = init_accounts_db_queries_accounts_page()
+    app.dependency_overrides[accounts_db] = lambda: accounts_db_mock
+
+    response = client.get("/accounts?min_balance=100.00&max_balance=1000.50&cursor=true")
+
+    assert response.status_code == 200
+
+    query = accounts_db_mock.query_page.call_args.args[0]
+
+    assert "balance_cents >= @min_balance" in query.query_str
+    assert "balance_cents <= @max_balance" in query.query_str
+    assert query.where_params["@min_balance"] == 10000
+    assert query.where_params["@max_balance"] == 100050
+
+
+# Asserts an empty page that has more pages after it returns its continuation token.
+def test_get_accounts_with_cursor_returns_empty_page():
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
+    accounts_db_mock = AsyncMock()
+    accounts_db_mock.query_page.return_value = (list(), '{"token": "some_token"}')
+    app.dependency_overrides[accounts_db] = lambda: accounts_db_mock
+
+    response = client.get("/accounts?account_type=some_account_type&cursor=true")
+
+    assert response.status_code == 200
+    assert response.json()["content"] == []
+    assert response.json()["continuation_token"] is not None
+
+    # No accounts and no more pages.
+    accounts_db_mock.query_page.return_value = (list(), None)
+
+    response = client.get("/accounts?account_type=some_account_type&cursor=true")
+
+    assert response.status_code == 404
+
+
+# Asserts the total is counted with the same filters and reused when paging.
+def test_get_accounts_with_total_returns_200():
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
+    accounts_db_mock = init_accounts_db_queries_accounts_page()
+    app.dependency_overrides[accounts_db] = lambda: accounts_db_mock
+
+    response = client.get("/accounts?account_institution=counted_bank&include_total=true&cursor=true")
+
+    assert response.status_code == 200
+    assert response.json()["total"] == 25
+    assert response.json()["results"] == 2
+
+    query = accounts_db_mock.count.call_args.args[0]
+
+    assert query.query_str == "SELECT VALUE COUNT(1) FROM accounts WHERE accounts.account_institution=@account_institution"
+    assert query.where_params == { "@account_institution": "counted_bank" }
+
+    # Getting it again reuses the count.
+    response = client.get("/accounts?account_institution=counted_bank&include_total=true&cursor=true")
+
+    assert response.status_code == 200
+    assert response.json()["total"] == 25
+    accounts_db_mock.count.assert_awaited_once()
+
+
+# Asserts searches limited to some fields only read and return those fields.
+def test_get_accounts_with_fields_returns_200():
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
+    accounts_db_mock = init_accounts_db_queries_accounts_page()
+    app.dependency_overrides[accounts_db] = lambda: accounts_db_mock
+
+    response = client.get("/accounts?account_type=checking&fields=balance,%20account_id&cursor=true")
+
+    assert response.status_code == 200
+    assert response.json()["content"][0] == { "account_id": "0", "balance": "1000.00" }
+
+    query = accounts_db_mock.query_page.call_args.args[0]
+
+    assert query.query_str == "SELECT accounts.account_id, accounts.balance, accounts.balance_cents FROM accounts WHERE accounts.account_type=@account_type"
+
+    # Reading by key.
+    app.dependency_overrides[accounts_db] = init_accounts_db_gets_account
+
+    response = client.get("/accounts?account_id=1234&fields=account_name")
+
+    assert response.status_code == 200
+    assert response.json()["content"] == { "account_name": "some_account_name" }
+
+
+# Asserts sorted searches order by an equality filter's field ahead of the sorted field.
+def test_get_accounts_sorted_returns_200():
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
+    accounts_db_mock = init_accounts_db_queries_accounts_page()
+    app.dependency_overrides[accounts_db] = lambda: accounts_db_mock
+
+    response = client.get("/accounts?account_type=checking&min_balance=100.00&order_by=balance&order=desc&cursor=true")
+
+    assert response.status_code == 200
+
+    query = accounts_db_mock.query_page.call_args.args[0]
+
+    assert query.query_str.endswith("ORDER BY accounts.account_type DESC, accounts.balance_cents DESC")
+
+
 # Asserts a 400 status code is returned.
 def test_get_returns_400():
     response = client.get("/accounts?id={0}".format(" "))
 
     assert response.status_code == 400
 
+    # Invalid continuation token.
+    app.dependency_overrides[accounts_db] = init_accounts_db_queries_accounts_page
+
+    response = client.get("/accounts?account_name={0}&continuation_token={1}".format("some_account_name", "not-a-token"))
+
+    assert response.status_code == 400
+
+    # Continuation token with characters outside the alphabet, which would decode to nothing.
+    response = client.get("/accounts", params={ "account_name": "some_account_name", "continuation_token": "%%%" })
+
+    assert response.status_code == 400
+
+    # min_balance greater than max_balance.
+    response = client.get("/accounts?min_balance=100.00&max_balance=10.00")
+
+    assert response.status_code == 400
+
+    # Invalid account_name_match.
+    response = client.get("/accounts?account_name={0}&account_name_match={1}".format("some_account_name", "fuzzy"))
+
+    assert response.status_code == 400
+
+    # More than one word matched by token.
+    response = client.get("/accounts?account_name={0}&account_name_match=token".format("Everyday Checking"))
+
+    assert response.status_code == 400
+
+    # Unknown field.
+    response = client.get("/accounts?fields=account_id,_rid")
+
+    assert response.status_code == 400
+
+    # Invalid order_by and order.
+    response = client.get("/accounts?order_by=account_owner_id")
+
+    assert response.status_code == 400
+
+    response = client.get("/accounts?order_by=balance&order=up")
+
+    assert response.status_code == 400
+
+    # Sorted shapes that would read every account.
+    response = client.get("/accounts?account_name={0}&order_by=balance".format("some_account_name"))
+
+    assert response.status_code == 400
+
+    response = client.get("/accounts?min_balance=100.00&order_by=account_name")
+
+    assert response.status_code == 400
+
+    response = client.get("/accounts?account_type=checking&account_institution=some_bank&order_by=_ts")
+
+    assert response.status_code == 400
+
 
 # Asserts a 403 status code is returned.
 def test_get_returns_403():
@@ -0,0 +1,33 @@
+import json
+import os
+
+from src.routers.accounts import account_query_templates, ACCOUNTS_CONTAINER_ID
+
+# Setup
+def init_indexing_policy() -> dict[str, any]:
+    with open(os.path.join(os.path.dirname(__file__), "..", "..", "..", "deploy", "accounts-indexing-policy.json")) as policy:
+        return json.load(policy)
+
+
+def init_path(field: str) -> str:
+    return "/" + field.removeprefix(ACCOUNTS_CONTAINER_ID + ".")
+
+
+# Test
+# Asserts every sorted search shape has the composite index it needs.
+def test_sorted_shapes_have_composite_indexes():
+    composite_indexes = [
+        tuple((path["path"], path["order"]) for path in composite_index)
+        for composite_index in init_indexing_policy()["compositeIndexes"]
+    ]
+
+    for ahead, field in account_query_templates.get_composite_indexes():
+        assert ((init_path(ahead), "ascending"), (init_path(field), "ascending")) in composite_indexes
+
+
+# Asserts every sorted field is indexed.
+def test_sorted_fields_are_indexed():
+    included_paths = [path["path"] for path in init_indexing_policy()["includedPaths"]]
+
+    for field, _ in account_query_templates.sorts.values():
+        assert init_path(field) + "/?" in included_paths
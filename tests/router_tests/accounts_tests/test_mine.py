@@ -0,0 +1,230 @@
+from fastapi.testclient import TestClient
+from src.data_models.Account import Account
+from src.data_models.AccountOwnerIndexEntry import AccountOwnerIndexEntry
+from src.data_models.AccountOwnerIndexMarker import AccountOwnerIndexMarker
+from src.libs.api_models.AccountModel import AccountModel
+from src.main import app
+from src.exceptions.NoResultsFoundError import NoResultsFoundError
+from src.routers.accounts import authorize_access, accounts_db, inject_jwt_bearer, owner_index_db
+from unittest.mock import AsyncMock
+
+# Setup
+def init_inject_jwt_bearer_authenticates():
+    return "some_token"
+
+
+def init_authorize_access_returns_user():
+    return "some_user"
+
+
+def init_account(account_id: str) -> dict:
+    account = Account(account_id, "some_account_name", "some_account_type", "some_bank", "user::some_user", "1000.00")
+
+    return account.__dict__
+
+
+def init_index_entry(account_id: str) -> dict:
+    account = AccountModel(account_id=account_id, account_name="some_account_name", balance="1000.00").dict()
+
+    return AccountOwnerIndexEntry("user::some_user", account_id, account).__dict__
+
+
+def init_accounts_db_queries_accounts():
+    accounts_db_mock = AsyncMock()
+
+    async def query_items(query):
+        for account_id in ("2", "1"):
+            yield init_account(account_id)
+
+    accounts_db_mock.query_items = query_items
+
+    return accounts_db_mock
+
+
+def init_accounts_db_queries_no_accounts():
+    accounts_db_mock = AsyncMock()
+    accounts_db_mock.queries = 0
+
+    async def query_items(query):
+        accounts_db_mock.queries += 1
+        return
+        yield
+
+    accounts_db_mock.query_items = query_items
+
+    return accounts_db_mock
+
+
+def init_owner_index_db_queries_index():
+    owner_index_db_mock = AsyncMock()
+    owner_index_db_mock.query_page.return_value = ([init_index_entry("1"), init_index_entry("2")], "some_continuation_token")
+    owner_index_db_mock.read.return_value = AccountOwnerIndexMarker("user::some_user", 2).__dict__
+
+    return owner_index_db_mock
+
+
+def init_owner_index_db_queries_empty_index():
+    owner_index_db_mock = AsyncMock()
+    owner_index_db_mock.query_page.return_value = ([], None)
+    owner_index_db_mock.read.return_value = AccountOwnerIndexMarker("user::some_user").__dict__
+
+    return owner_index_db_mock
+
+
+def init_owner_index_db_query_raises_exception():
+    owner_index_db_mock = AsyncMock()
+    owner_index_db_mock.query_page.side_effect = Exception()
+
+    return owner_index_db_mock
+
+
+client = TestClient(app)
+
+# Test
+# Asserts a 200 status code is returned.
+def test_mine_returns_200():
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
+    accounts_db_mock = AsyncMock()
+    owner_index_db_mock = init_owner_index_db_queries_index()
+    app.dependency_overrides[accounts_db] = lambda: accounts_db_mock
+    app.dependency_overrides[owner_index_db] = lambda: owner_index_db_mock
+
+    response = client.get("/accounts/mine?results_per_page=2")
+
+    assert response.status_code == 200
+
+    content = response.json()
+
+    assert content["results"] == 2
+    assert [account["account_id"] for account in content["content"]] == ["1", "2"]
+    assert content["continuation_token"] is not None
+
+    query, page_size = owner_index_db_mock.query_page.call_args.args
+
+    assert query.partition_key == "user::some_user"
+    assert query.where_params == { "@account_owner_id": "user::some_user" }
+    assert page_size == 2
+    owner_index_db_mock.read.assert_awaited_once_with("account_owner_index_marker::user::some_user", "user::some_user")
+    accounts_db_mock.query_items.assert_not_called()
+
+
+# Asserts the next page is read with the continuation token returned.
+def test_mine_next_page_returns_200():
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
+    owner_index_db_mock = init_owner_index_db_queries_index()
+    app.dependency_overrides[accounts_db] = init_accounts_db_queries_accounts
+    app.dependency_overrides[owner_index_db] = lambda: owner_index_db_mock
+
+    continuation_token = client.get("/accounts/mine").json()["continuation_token"]
+    response = client.get("/accounts/mine", params={ "continuation_token": continuation_token })
+
+    assert response.status_code == 200
+    assert owner_index_db_mock.query_page.call_args.args[2] == "some_continuation_token"
+    assert owner_index_db_mock.read.await_count == 1
+
+
+# Asserts the owner's accounts are indexed one item at a time if they are not indexed yet.
+def test_mine_indexes_accounts_returns_200():
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
+    owner_index_db_mock = AsyncMock()
+    owner_index_db_mock.query_page.side_effect = [([], None), ([init_index_entry("1"), init_index_entry("2")], None)]
+    owner_index_db_mock.read.return_value = None
+    owner_index_db_mock.patch.side_effect = NoResultsFoundError("Item does not exist.")
+    app.dependency_overrides[accounts_db] = init_accounts_db_queries_accounts
+    app.dependency_overrides[owner_index_db] = lambda: owner_index_db_mock
+
+    response = client.get("/accounts/mine")
+
+    assert response.status_code == 200
+    assert [account["account_id"] for account in response.json()["content"]] == ["1", "2"]
+
+    *entries, marker = [call.args[0] for call in owner_index_db_mock.create.call_args_list]
+
+    assert sorted(entry["id"] for entry in entries) == ["account_owner_index_entry::1", "account_owner_index_entry::2"]
+    assert all(entry["account_owner_id"] == "user::some_user" for entry in entries)
+    assert marker["id"] == "account_owner_index_marker::user::some_user"
+    assert marker["accounts"] == 2
+    owner_index_db_mock.upsert.assert_not_awaited()
+
+
+# Asserts the accounts of an owner with no accounts are only looked up the first time they list them.
+def test_mine_indexes_owner_without_accounts_once():
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
+    accounts_db_mock = init_accounts_db_queries_no_accounts()
+    owner_index_db_mock = init_owner_index_db_queries_empty_index()
+    owner_index_db_mock.read.side_effect = [None, AccountOwnerIndexMarker("user::some_user").__dict__, AccountOwnerIndexMarker("user::some_user").__dict__]
+    app.dependency_overrides[accounts_db] = lambda: accounts_db_mock
+    app.dependency_overrides[owner_index_db] = lambda: owner_index_db_mock
+
+    for _ in range(3):
+        assert client.get("/accounts/mine").status_code == 404
+
+    assert accounts_db_mock.queries == 1
+    assert owner_index_db_mock.create.call_args.args[0]["id"] == "account_owner_index_marker::user::some_user"
+
+
+# Asserts the accounts cannot be indexed again on request.
+def test_mine_ignores_refresh():
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
+    accounts_db_mock = init_accounts_db_queries_no_accounts()
+    app.dependency_overrides[accounts_db] = lambda: accounts_db_mock
+    app.dependency_overrides[owner_index_db] = init_owner_index_db_queries_index
+
+    response = client.get("/accounts/mine?refresh=true")
+
+    assert response.status_code == 200
+    assert accounts_db_mock.queries == 0
+
+
+# Asserts a 400 status code is returned.
+def test_mine_returns_400():
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
+    app.dependency_overrides[accounts_db] = init_accounts_db_queries_accounts
+    app.dependency_overrides[owner_index_db] = init_owner_index_db_queries_index
+
+    response = client.get("/accounts/mine?results_per_page=0")
+
+    assert response.status_code == 400
+
+    response = client.get("/accounts/mine", params={ "continuation_token": "%%%" })
+
+    assert response.status_code == 400
+
+
+# Asserts a 403 status code is returned.
+def test_mine_returns_403():
+    app.dependency_overrides = {}
+
+    response = client.get("/accounts/mine")
+
+    assert response.status_code == 403
+
+
+# Asserts a 404 status code is returned.
+def test_mine_returns_404():
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
+    app.dependency_overrides[accounts_db] = init_accounts_db_queries_no_accounts
+    app.dependency_overrides[owner_index_db] = init_owner_index_db_queries_empty_index
+
+    response = client.get("/accounts/mine")
+
+    assert response.status_code == 404
+
+
+# Asserts a 500 status code is returned.
+def test_mine_returns_500():
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
+    app.dependency_overrides[accounts_db] = init_accounts_db_queries_accounts
+    app.dependency_overrides[owner_index_db] = init_owner_index_db_query_raises_exception
+
+    response = client.get("/accounts/mine")
+
+    assert response.status_code == 500
@@ -3,9 +3,11 @@ import json
 from fastapi.testclient import TestClient
 from src.libs.api_models.AccountModel import AccountModel
 from src.main import app
-from src.routers.accounts import authorize_access, accounts_db, inject_jwt_bearer
+from src.routers.accounts import authorize_access, accounts_db, inject_jwt_bearer, owner_index_db, projections_db
 from src.data_models.Account import Account
-from unittest.mock import Mock
+from src.data_models.AccountIdClaim import AccountIdClaim
+from src.exceptions.ObjectConflictError import ObjectConflictError
+from unittest.mock import Mock, AsyncMock
 
 # Setup
 def init_inject_jwt_bearer_authenticates():
@@ -19,35 +21,63 @@ def init_authorize_access_returns_user():
     return "some_user"
 
 
-def init_accounts_db_get_returns_account():
-    accounts_db_mock = Mock()
-    accounts_db_mock.get.return_value = json.dumps(Account("1234", "some_account_name", "some_account_type", "some_bank", "some_owner", "1000.00").__dict__)
+def init_accounts_db_create_raises_conflict():
+    accounts_db_mock = AsyncMock()
+    accounts_db_mock.create.side_effect = ObjectConflictError("Item 'account::1234' already exists.")
 
     return accounts_db_mock
 
 
-def init_accounts_db_upserts_account():
-    accounts_db_mock = Mock()
-    accounts_db_mock.get.return_value = None
-    accounts_db_mock.upsert.return_value = json.dumps(Account("1234", "some_account_name", "some_account_type", "some_bank", "some_owner", "1000.00").__dict__)
+def init_accounts_db_creates_account():
+    accounts_db_mock = AsyncMock()
+    accounts_db_mock.create.return_value = json.dumps(Account("1234", "some_account_name", "some_account_type", "some_bank", "some_owner", "1000.00").__dict__)
 
     return accounts_db_mock
 
 
-def init_accounts_db_get_raises_exception():
-    accounts_db_mock = Mock()
-    accounts_db_mock.get.side_effect = Exception()
+def init_accounts_db_create_raises_exception():
+    accounts_db_mock = AsyncMock()
+    accounts_db_mock.create.side_effect = Exception()
 
     return accounts_db_mock
 
 
+def init_projections_db():
+    return AsyncMock()
+
+
+def init_projections_db_claim_held_by(account_owner_id: str):
+    projections_db_mock = AsyncMock()
+    projections_db_mock.create.side_effect = ObjectConflictError("Item 'account_id_claim::1234' already exists.")
+    projections_db_mock.read.return_value = AccountIdClaim("1234", account_owner_id).__dict__
+
+    return projections_db_mock
+
+
+def init_account() -> dict:
+    account = AccountModel()
+    account.account_id = "1234"
+    account.account_name = "some_name"
+    account.account_type = "some_type"
+    account.account_institution = "some_bank"
+    account.balance = "1000.00"
+
+    return json.loads(json.dumps(account.__dict__))
+
+
+def init_owner_index_db():
+    return AsyncMock()
+
+
 client = TestClient(app)
 
 # Test
 # Assert post returns a 201 status code.
 def test_post_returns_201():
     app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
-    app.dependency_overrides[accounts_db] = init_accounts_db_upserts_account
+    app.dependency_overrides[accounts_db] = init_accounts_db_creates_account
+    app.dependency_overrides[projections_db] = init_projections_db
+    app.dependency_overrides[owner_index_db] = init_owner_index_db
     app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
 
     account = AccountModel()
@@ -89,7 +119,9 @@ def test_post_returns_400():
 
 # Asserts a 409 status code is returned.
 def test_post_returns_409():
-    app.dependency_overrides[accounts_db] = init_accounts_db_get_returns_account
+    app.dependency_overrides[accounts_db] = init_accounts_db_create_raises_conflict
+    app.dependency_overrides[projections_db] = init_projections_db
+    app.dependency_overrides[owner_index_db] = init_owner_index_db
 
     account = AccountModel()
     account.account_id = "1234"
@@ -105,8 +137,57 @@ def test_post_returns_409():
     assert response.status_code == 409
 
 
+# Asserts the account id is claimed across owners when accounts are partitioned by owner.
+def test_post_partitioned_by_owner_claims_account_id(monkeypatch):
+    monkeypatch.setattr("src.routers.accounts.ACCOUNTS_PARTITION_KEY", "account_owner_id")
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[accounts_db] = init_accounts_db_creates_account
+    projections_db_mock = init_projections_db()
+    app.dependency_overrides[projections_db] = lambda: projections_db_mock
+    app.dependency_overrides[owner_index_db] = init_owner_index_db
+
+    response = client.post("/accounts/", json=init_account())
+
+    assert response.status_code == 201
+
+    claim = projections_db_mock.create.call_args.args[0]
+
+    assert claim["id"] == "account_id_claim::1234"
+    assert claim["account_owner_id"] == "user::some_user"
+
+
+# Asserts a 409 status code is returned if another owner holds the account id when accounts are partitioned by owner.
+def test_post_partitioned_by_owner_returns_409(monkeypatch):
+    monkeypatch.setattr("src.routers.accounts.ACCOUNTS_PARTITION_KEY", "account_owner_id")
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    accounts_db_mock = init_accounts_db_creates_account()
+    app.dependency_overrides[accounts_db] = lambda: accounts_db_mock
+    app.dependency_overrides[projections_db] = lambda: init_projections_db_claim_held_by("user::another_user")
+    app.dependency_overrides[owner_index_db] = init_owner_index_db
+
+    response = client.post("/accounts/", json=init_account())
+
+    assert response.status_code == 409
+    accounts_db_mock.create.assert_not_awaited()
+
+
+# Asserts an account id the owner already claimed can be created, such as after a create that failed.
+def test_post_partitioned_by_owner_claimed_by_owner_returns_201(monkeypatch):
+    monkeypatch.setattr("src.routers.accounts.ACCOUNTS_PARTITION_KEY", "account_owner_id")
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[accounts_db] = init_accounts_db_creates_account
+    app.dependency_overrides[projections_db] = lambda: init_projections_db_claim_held_by("user::some_user")
+    app.dependency_overrides[owner_index_db] = init_owner_index_db
+
+    response = client.post("/accounts/", json=init_account())
+
+    assert response.status_code == 201
+
+
 def test_post_returns_500():
-    app.dependency_overrides[accounts_db] = init_accounts_db_get_raises_exception
+    app.dependency_overrides[accounts_db] = init_accounts_db_create_raises_exception
+    app.dependency_overrides[projections_db] = init_projections_db
+    app.dependency_overrides[owner_index_db] = init_owner_index_db
 
     account = AccountModel()
     account.account_id = "1234"
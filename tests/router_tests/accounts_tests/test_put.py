@@ -4,9 +4,12 @@ from fastapi.testclient import TestClient
 from src.libs.api_models.AccountModel import AccountModel
 from src.libs.api_models.UpdateAccountModel import UpdateAccountModel
 from src.main import app
-from src.routers.accounts import authorize_access, accounts_db, inject_jwt_bearer
+from src.routers.accounts import authorize_access, accounts_db, inject_jwt_bearer, owner_index_db
 from src.data_models.Account import Account
-from unittest.mock import Mock
+from src.exceptions.NoResultsFoundError import NoResultsFoundError
+from src.exceptions.ObjectConflictError import ObjectConflictError
+from src.exceptions.PreconditionFailedError import PreconditionFailedError
+from unittest.mock import AsyncMock
 
 # Setup.
 def init_inject_jwt_bearer_authenticates():
@@ -17,35 +20,57 @@ def init_authorize_access_returns_user():
     return "user"
 
 
-def init_accounts_db_get_returns_none():
-    accounts_db_mock = Mock()
-    accounts_db_mock.get.return_value = None
+def init_accounts_db_patch_raises_not_found():
+    accounts_db_mock = AsyncMock()
+    accounts_db_mock.patch.side_effect = NoResultsFoundError("Item 'account::1234' does not exist.")
 
     return accounts_db_mock
 
 
-def init_accounts_db_upserts_account():
-    accounts_db_mock = Mock()
-    accounts_db_mock.get.return_value = json.dumps(Account("1234", "some_account_name", "some_account_type", "some_bank", "some_owner", "1000.00").__dict__)
-    accounts_db_mock.upsert.return_value = json.dumps(Account("1234", "some_account_name", "some_account_type", "some_bank", "some_owner", "2000.00").__dict__)
+def init_accounts_db_patches_account():
+    account = Account("1234", "some_account_name", "some_account_type", "some_bank", "some_owner", "2000.00")
+    account._etag = "some_new_etag"
+
+    accounts_db_mock = AsyncMock()
+    accounts_db_mock.patch.return_value = json.dumps(account.__dict__)
+
+    return accounts_db_mock
+
+
+def init_accounts_db_patch_raises_precondition_failed():
+    accounts_db_mock = AsyncMock()
+    accounts_db_mock.patch.side_effect = PreconditionFailedError("Item 'account::1234' was changed or does not meet the condition of the update.")
 
     return accounts_db_mock
 
 
-def init_accounts_db_get_raises_exception():
-    accounts_db_mock = Mock()
-    accounts_db_mock.get.side_effect = Exception()
+def init_accounts_db_patch_raises_exception():
+    accounts_db_mock = AsyncMock()
+    accounts_db_mock.patch.side_effect = Exception()
 
     return accounts_db_mock
 
 
+def init_owner_index_db():
+    return AsyncMock()
+
+
+def init_account_to_update() -> dict[str, any]:
+    account_to_update = UpdateAccountModel()
+    account_to_update.account_id = "1234"
+    account_to_update.balance = "2000.00"
+
+    return json.loads(json.dumps(account_to_update.__dict__))
+
+
 client = TestClient(app)
 
 # Test
 # Assert a 200 status code is returned.
 def test_put_returns_200():
     app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
-    app.dependency_overrides[accounts_db] = init_accounts_db_upserts_account
+    app.dependency_overrides[accounts_db] = init_accounts_db_patches_account
+    app.dependency_overrides[owner_index_db] = init_owner_index_db
     app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
 
     account_to_update = UpdateAccountModel()
@@ -66,6 +91,130 @@ def test_put_returns_200():
 
     assert type(account) == AccountModel
     assert account.balance == "2000.00"
+    assert response.headers["ETag"] == "some_new_etag"
+
+
+# Assert the update is sent as one patch conditioned on the etag given.
+def test_put_patches_with_etag():
+    accounts_db_mock = init_accounts_db_patches_account()
+    app.dependency_overrides[accounts_db] = lambda: accounts_db_mock
+    app.dependency_overrides[owner_index_db] = init_owner_index_db
+
+    account_to_update = UpdateAccountModel()
+    account_to_update.account_id = "1234"
+    account_to_update.balance = "2000.00"
+
+    payload = json.dumps(account_to_update.__dict__)
+
+    response = client.put("/accounts/", json=json.loads(payload), headers={ "If-Match": "some_etag" })
+
+    assert response.status_code == 200
+
+    id, partition_key, operations, etag = accounts_db_mock.patch.call_args.args
+
+    assert id == "account::1234"
+    assert partition_key == "1234"
+    assert operations == [
+        { "op": "set", "path": "/balance", "value": "2000.00" },
+        { "op": "set", "path": "/balance_cents", "value": 200000 }
+    ]
+    assert etag == "some_etag"
+
+
+# Assert the account name's search tokens are updated with the name.
+def test_put_updates_name_tokens():
+    accounts_db_mock = init_accounts_db_patches_account()
+    app.dependency_overrides[accounts_db] = lambda: accounts_db_mock
+    app.dependency_overrides[owner_index_db] = init_owner_index_db
+
+    account_to_update = UpdateAccountModel()
+    account_to_update.account_id = "1234"
+    account_to_update.account_name = "Joint Checking - joint"
+
+    payload = json.dumps(account_to_update.__dict__)
+
+    response = client.put("/accounts/", json=json.loads(payload))
+
+    assert response.status_code == 200
+
+    operations = accounts_db_mock.patch.call_args.args[2]
+
+    assert operations == [
+        { "op": "set", "path": "/account_name", "value": "Joint Checking - joint" },
+        { "op": "set", "path": "/account_name_tokens", "value": ["joint", "checking"] }
+    ]
+
+
+# Assert the owner's account index is updated with the account.
+def test_put_updates_owner_index():
+    accounts_db_mock = init_accounts_db_patches_account()
+    owner_index_db_mock = AsyncMock()
+    app.dependency_overrides[accounts_db] = lambda: accounts_db_mock
+    app.dependency_overrides[owner_index_db] = lambda: owner_index_db_mock
+
+    response = client.put("/accounts/", json=init_account_to_update())
+
+    assert response.status_code == 200
+
+    id, partition_key, operations = owner_index_db_mock.patch.call_args.args
+
+    assert id == "account_owner_index_entry::1234"
+    assert partition_key == "some_owner"
+    assert operations[0]["path"] == "/account"
+    assert operations[0]["value"]["balance"] == "2000.00"
+    assert owner_index_db_mock.patch.call_args.kwargs["filter_predicate"] == "FROM c WHERE c.account_ts <= 0"
+    owner_index_db_mock.create.assert_not_awaited()
+
+
+# Asserts an account not yet indexed is added to the owner index without indexing the owner's other accounts.
+def test_put_creates_owner_index_entry():
+    accounts_db_mock = init_accounts_db_patches_account()
+    owner_index_db_mock = AsyncMock()
+    owner_index_db_mock.patch.side_effect = NoResultsFoundError("Item 'account_owner_index_entry::1234' does not exist.")
+    app.dependency_overrides[accounts_db] = lambda: accounts_db_mock
+    app.dependency_overrides[owner_index_db] = lambda: owner_index_db_mock
+
+    response = client.put("/accounts/", json=init_account_to_update())
+
+    assert response.status_code == 200
+
+    entry = owner_index_db_mock.create.call_args.args[0]
+
+    assert entry["id"] == "account_owner_index_entry::1234"
+    assert entry["account_owner_id"] == "some_owner"
+    assert entry["account"]["balance"] == "2000.00"
+    owner_index_db_mock.upsert.assert_not_awaited()
+    accounts_db_mock.query_items.assert_not_called()
+
+
+# Asserts the owner index entry is patched if another write created it first.
+def test_put_patches_owner_index_entry_created_concurrently():
+    accounts_db_mock = init_accounts_db_patches_account()
+    owner_index_db_mock = AsyncMock()
+    owner_index_db_mock.patch.side_effect = [NoResultsFoundError("Item 'account_owner_index_entry::1234' does not exist."), json.dumps({})]
+    owner_index_db_mock.create.side_effect = ObjectConflictError("Item 'account_owner_index_entry::1234' already exists.")
+    app.dependency_overrides[accounts_db] = lambda: accounts_db_mock
+    app.dependency_overrides[owner_index_db] = lambda: owner_index_db_mock
+
+    response = client.put("/accounts/", json=init_account_to_update())
+
+    assert response.status_code == 200
+    assert owner_index_db_mock.patch.await_count == 2
+    owner_index_db_mock.upsert.assert_not_awaited()
+
+
+# Asserts the write succeeds when a newer version of the account is already indexed.
+def test_put_skips_stale_owner_index_entry():
+    accounts_db_mock = init_accounts_db_patches_account()
+    owner_index_db_mock = AsyncMock()
+    owner_index_db_mock.patch.side_effect = PreconditionFailedError("Item 'account_owner_index_entry::1234' was changed or does not meet the condition of the update.")
+    app.dependency_overrides[accounts_db] = lambda: accounts_db_mock
+    app.dependency_overrides[owner_index_db] = lambda: owner_index_db_mock
+
+    response = client.put("/accounts/", json=init_account_to_update())
+
+    assert response.status_code == 200
+    owner_index_db_mock.create.assert_not_awaited()
 
 
 # Asserts a 400 status code is returned.
@@ -84,7 +233,8 @@ def test_put_returns_400():
 
 # Asserts a 404 status code is returned.
 def test_put_returns_404():
-    app.dependency_overrides[accounts_db] = init_accounts_db_get_returns_none
+    app.dependency_overrides[accounts_db] = init_accounts_db_patch_raises_not_found
+    app.dependency_overrides[owner_index_db] = init_owner_index_db
 
     account_to_update = UpdateAccountModel()
     account_to_update.account_id = "1234"
@@ -98,9 +248,27 @@ def test_put_returns_404():
     assert response.status_code == 404
     
 
+# Asserts a 412 status code is returned.
+def test_put_returns_412():
+    app.dependency_overrides[accounts_db] = init_accounts_db_patch_raises_precondition_failed
+    app.dependency_overrides[owner_index_db] = init_owner_index_db
+
+    account_to_update = UpdateAccountModel()
+    account_to_update.account_id = "1234"
+    account_to_update.balance = "2000.00"
+    account_to_update.etag = "some_old_etag"
+
+    payload = json.dumps(account_to_update.__dict__)
+
+    response = client.put("/accounts/", json=json.loads(payload))
+
+    assert response.status_code == 412
+
+
 # Asserts a 500 status code is returned.
 def test_put_returns_500():
-    app.dependency_overrides[accounts_db] = init_accounts_db_get_raises_exception
+    app.dependency_overrides[accounts_db] = init_accounts_db_patch_raises_exception
+    app.dependency_overrides[owner_index_db] = init_owner_index_db
 
     account_to_update = UpdateAccountModel()
     account_to_update.account_id = "1234"
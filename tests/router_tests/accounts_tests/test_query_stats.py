@@ -0,0 +1,41 @@
+from fastapi.testclient import TestClient
+from src.main import app
+from src.routers.accounts import authorize_access, accounts_db, inject_jwt_bearer
+from unittest.mock import AsyncMock
+
+# Setup
+def init_inject_jwt_bearer_authenticates():
+    return "some_token"
+
+
+def init_authorize_access_returns_user():
+    return "some_user"
+
+
+def init_accounts_db_queries_accounts_page():
+    accounts_db_mock = AsyncMock()
+    accounts_db_mock.query_page.return_value = (list(), None)
+
+    return accounts_db_mock
+
+
+client = TestClient(app)
+
+# Test
+# Asserts a 200 status code is returned with the share of searches of each shape.
+def test_query_stats_returns_200():
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
+    app.dependency_overrides[accounts_db] = init_accounts_db_queries_accounts_page
+
+    client.get("/accounts?account_institution=some_bank&cursor=true")
+
+    response = client.get("/accounts/query-stats")
+
+    assert response.status_code == 200
+
+    stats = response.json()["content"]
+
+    assert stats["templates"] >= 1
+    assert stats["queries"] >= 1
+    assert "account_institution" in stats["shapes"]
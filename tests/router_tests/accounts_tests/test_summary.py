@@ -0,0 +1,95 @@
+from fastapi.testclient import TestClient
+from src.data_models.AccountSummary import AccountSummary
+from src.main import app
+from src.routers.accounts import authorize_access, inject_jwt_bearer, projections_db
+from unittest.mock import AsyncMock
+
+# Setup
+def init_inject_jwt_bearer_authenticates():
+    return "some_token"
+
+
+def init_authorize_access_returns_user():
+    return "some_user"
+
+
+def init_projections_db_reads_summary():
+    projections_db_mock = AsyncMock()
+    projections_db_mock.read.return_value = AccountSummary("institution", "Some Bank", 3, 123456).__dict__
+
+    return projections_db_mock
+
+
+def init_projections_db_reads_none():
+    projections_db_mock = AsyncMock()
+    projections_db_mock.read.return_value = None
+
+    return projections_db_mock
+
+
+def init_projections_db_read_raises_exception():
+    projections_db_mock = AsyncMock()
+    projections_db_mock.read.side_effect = Exception()
+
+    return projections_db_mock
+
+
+client = TestClient(app)
+
+# Test
+# Asserts a 200 status code is returned.
+def test_summary_returns_200():
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
+    projections_db_mock = init_projections_db_reads_summary()
+    app.dependency_overrides[projections_db] = lambda: projections_db_mock
+
+    response = client.get("/accounts/summary?by=institution&value=Some Bank")
+
+    assert response.status_code == 200
+    assert response.json()["content"] == { "dimension": "institution", "value": "Some Bank", "count": 3, "balance": "1234.56" }
+    summary_id = AccountSummary("institution", "Some Bank").id
+    projections_db_mock.read.assert_awaited_once_with(summary_id, summary_id)
+
+    # Test the user's own summary.
+    response = client.get("/accounts/summary?value=user::someone_else")
+
+    assert response.status_code == 200
+    assert projections_db_mock.read.call_args.args[0] == AccountSummary("owner", "user::some_user").id
+
+
+# Asserts a 400 status code is returned.
+def test_summary_returns_400():
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
+    app.dependency_overrides[projections_db] = init_projections_db_reads_summary
+
+    response = client.get("/accounts/summary?by=balance")
+
+    assert response.status_code == 400
+
+    response = client.get("/accounts/summary?by=type")
+
+    assert response.status_code == 400
+
+
+# Asserts a 404 status code is returned.
+def test_summary_returns_404():
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
+    app.dependency_overrides[projections_db] = init_projections_db_reads_none
+
+    response = client.get("/accounts/summary?by=type&value=checking")
+
+    assert response.status_code == 404
+
+
+# Asserts a 500 status code is returned.
+def test_summary_returns_500():
+    app.dependency_overrides[authorize_access] = init_authorize_access_returns_user
+    app.dependency_overrides[inject_jwt_bearer] = init_inject_jwt_bearer_authenticates
+    app.dependency_overrides[projections_db] = init_projections_db_read_raises_exception
+
+    response = client.get("/accounts/summary?by=type&value=checking")
+
+    assert response.status_code == 500
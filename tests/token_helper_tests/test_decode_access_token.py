@@ -0,0 +1,62 @@
+import unittest
+
+from datetime import datetime, timedelta
+from jose import jwt
+from unittest.mock import patch
+from src.libs.utils.TtlCache import TtlCache
+from src.token_helper.TokenHelper import TokenHelper, ExpiredSignatureError, JWTError
+
+class DecodeAccessTokenTests(unittest.TestCase):
+    # Assert that a repeated token is served from the cache without verifying its signature again.
+    def test_decode_access_token_caches_verified_token(self):
+        token_helper = TokenHelper("some_secret", "HS256", 30, TtlCache(10))
+        token = token_helper.create_access_token({ "sub": "some_user" })
+
+        with patch("src.token_helper.TokenHelper.jwt.decode", wraps=jwt.decode) as decode_mock:
+            for i in range(3):
+                self.assertEqual("some_user", token_helper.decode_access_token(token))
+
+        self.assertEqual(1, decode_mock.call_count)
+        self.assertEqual({ "hits": 2, "misses": 1, "size": 1 }, token_helper.get_cache_stats())
+
+
+    # Assert that an expired token is not served from the cache.
+    def test_decode_access_token_raises_expired_signature_error(self):
+        token_helper = TokenHelper("some_secret", "HS256", 30, TtlCache(10))
+        token = jwt.encode({ "sub": "some_user", "exp": datetime.utcnow() + timedelta(seconds=30) }, "some_secret", algorithm="HS256")
+
+        token_helper.decode_access_token(token)
+
+        with patch("src.token_helper.TokenHelper.datetime") as datetime_mock, patch("jose.jwt.datetime") as jose_datetime_mock:
+            later = datetime.utcnow() + timedelta(minutes=5)
+            datetime_mock.utcnow.return_value = later
+            jose_datetime_mock.now.return_value = later
+
+            with self.assertLogs(level="ERROR"):
+                with self.assertRaises(ExpiredSignatureError):
+                    token_helper.decode_access_token(token)
+
+
+    # Assert that a token that fails verification is not cached.
+    def test_decode_access_token_does_not_cache_invalid_token(self):
+        token_helper = TokenHelper("some_secret", "HS256", 30, TtlCache(10))
+        token = jwt.encode({ "sub": "some_user" }, "other_secret", algorithm="HS256")
+
+        for i in range(2):
+            with self.assertLogs(level="ERROR"):
+                with self.assertRaises(JWTError):
+                    token_helper.decode_access_token(token)
+
+        self.assertEqual(0, token_helper.get_cache_stats()["size"])
+
+
+    # Assert that every token is verified when the cache is disabled.
+    def test_decode_access_token_without_cache(self):
+        token_helper = TokenHelper("some_secret", "HS256")
+        token = token_helper.create_access_token({ "sub": "some_user" })
+
+        with patch("src.token_helper.TokenHelper.jwt.decode", wraps=jwt.decode) as decode_mock:
+            token_helper.decode_access_token(token)
+            token_helper.decode_access_token(token)
+
+        self.assertEqual(2, decode_mock.call_count)
@@ -0,0 +1,151 @@
+import signal
+import time
+import unittest
+
+from fastapi import HTTPException
+from unittest.mock import AsyncMock, Mock, patch
+from src.libs.utils.authorize import authorize_access, invalidate_user, reload_token_key, token_helper, verified_users, SECRET_KEY, ALGORITHM
+
+def init_request():
+    request = Mock()
+    request.headers = { "Authorization": "Bearer some_token" }
+
+    return request
+
+
+def init_request_with_token(token: str):
+    request = Mock()
+    request.headers = { "Authorization": "Bearer {0}".format(token) }
+
+    return request
+
+
+def init_token_helper():
+    token_helper = Mock()
+    token_helper.decode_access_token.return_value = "some_user"
+
+    return token_helper
+
+
+class AuthorizeAccessTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        verified_users.clear()
+
+
+    # Assert that a verified user is only looked up in the database once.
+    async def test_authorize_access_caches_verified_user(self):
+        users_db = AsyncMock()
+        users_db.read.return_value = { "id": "user::some_user" }
+
+        for i in range(3):
+            user = await authorize_access(init_request(), init_token_helper(), users_db)
+
+        self.assertEqual("some_user", user)
+        self.assertEqual(1, users_db.read.await_count)
+
+
+    # Assert that an unknown user is cached and denied without another database lookup.
+    async def test_authorize_access_caches_unknown_user(self):
+        users_db = AsyncMock()
+        users_db.read.return_value = None
+
+        for i in range(2):
+            with self.assertLogs(level="ERROR"):
+                with self.assertRaises(HTTPException) as context:
+                    await authorize_access(init_request(), init_token_helper(), users_db)
+
+            self.assertEqual(403, context.exception.status_code)
+
+        self.assertEqual(1, users_db.read.await_count)
+
+
+    # Assert that an invalidated user is looked up in the database again.
+    async def test_invalidate_user_forces_lookup(self):
+        users_db = AsyncMock()
+        users_db.read.return_value = { "id": "user::some_user" }
+
+        await authorize_access(init_request(), init_token_helper(), users_db)
+        invalidate_user("some_user")
+        await authorize_access(init_request(), init_token_helper(), users_db)
+
+        self.assertEqual(2, users_db.read.await_count)
+
+
+
+    # Assert that a database error is not cached as an unknown user.
+    async def test_authorize_access_does_not_cache_errors(self):
+        users_db = AsyncMock()
+        users_db.read.side_effect = [Exception("Request rate is large."), { "id": "user::some_user" }]
+
+        with self.assertLogs(level="ERROR"):
+            with self.assertRaises(HTTPException) as context:
+                await authorize_access(init_request(), init_token_helper(), users_db)
+
+        self.assertEqual(500, context.exception.status_code)
+        self.assertEqual("some_user", await authorize_access(init_request(), init_token_helper(), users_db))
+
+
+
+    # Assert that reloading a changed key rejects tokens signed with the old key and accepts the new key's tokens.
+    async def test_reload_token_key_rotates_key(self):
+        users_db = AsyncMock()
+        users_db.read.return_value = { "id": "user::some_user" }
+        old_token = token_helper().create_access_token({ "sub": "some_user" })
+
+        try:
+            self.assertEqual("some_user", await authorize_access(init_request_with_token(old_token), token_helper(), users_db))
+
+            with patch("src.libs.utils.authorize.Settings", return_value=Mock(secret_key="other_secret", algorithm=ALGORITHM)):
+                self.assertTrue(reload_token_key())
+                self.assertFalse(reload_token_key())
+
+            with self.assertLogs(level="ERROR"):
+                with self.assertRaises(HTTPException) as context:
+                    await authorize_access(init_request_with_token(old_token), token_helper(), users_db)
+
+            self.assertEqual(403, context.exception.status_code)
+
+            new_token = token_helper().create_access_token({ "sub": "some_user" })
+
+            self.assertEqual("some_user", await authorize_access(init_request_with_token(new_token), token_helper(), users_db))
+
+        finally:
+            token_helper.rotate_key(SECRET_KEY, ALGORITHM)
+
+
+    # Assert that the SIGHUP handler reloads the token key.
+    async def test_signal_reloads_token_key(self):
+        from src.main import rotate_token_key_on_signal
+
+        old_token_helper = token_helper()
+
+        try:
+            with patch("src.libs.utils.authorize.Settings", return_value=Mock(secret_key="other_secret", algorithm=ALGORITHM)):
+                rotate_token_key_on_signal(signal.SIGHUP, None)
+
+                for i in range(100):
+                    if token_helper() is not old_token_helper:
+                        break
+
+                    time.sleep(0.01)
+
+            self.assertEqual("other_secret", token_helper().secret_key)
+
+        finally:
+            token_helper.rotate_key(SECRET_KEY, ALGORITHM)
+
+
+    # Assert that the SIGHUP handler is only installed when it is turned on.
+    @unittest.skipUnless(hasattr(signal, "SIGHUP"), "SIGHUP is not supported on this platform.")
+    async def test_sighup_handler_is_opt_in(self):
+        from src.main import install_signal_handlers, rotate_token_key_on_signal
+
+        with patch("src.main.signal.signal") as signal_mock:
+            await install_signal_handlers()
+
+            signal_mock.assert_not_called()
+
+            with patch("src.main.ROTATE_TOKEN_KEY_ON_SIGHUP", True):
+                await install_signal_handlers()
+
+            signal_mock.assert_called_once_with(signal.SIGHUP, rotate_token_key_on_signal)
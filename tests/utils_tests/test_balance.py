@@ -0,0 +1,23 @@
+import unittest
+
+from src.libs.utils.balance import from_cents, to_cents
+
+class BalanceTests(unittest.TestCase):
+    # Assert that cents are formatted with 2 decimal places.
+    def test_from_cents_formats_2_decimal_places(self):
+        self.assertEqual("0.00", from_cents(0))
+        self.assertEqual("0.05", from_cents(5))
+        self.assertEqual("-0.05", from_cents(-5))
+        self.assertEqual("1000.00", from_cents(100000))
+        self.assertEqual("-1234.56", from_cents(-123456))
+
+
+    # Assert that large values are exact and not in exponent form.
+    def test_from_cents_formats_large_values(self):
+        self.assertEqual("10000000000000000000000000000.00", from_cents(10 ** 30))
+
+
+    # Assert that a formatted value converts back to the same cents.
+    def test_from_cents_round_trips(self):
+        for cents in (0, 1, -1, 99, 100, 123456789):
+            self.assertEqual(cents, to_cents(from_cents(cents)))
@@ -0,0 +1,66 @@
+import time
+import unittest
+
+from src.libs.utils.TtlCache import TtlCache
+
+class TtlCacheTests(unittest.TestCase):
+    # Assert that a cached value is returned and counted as a hit.
+    def test_get_returns_cached_value(self):
+        cache = TtlCache(2)
+        cache.set("key", "value")
+
+        self.assertEqual("value", cache.get("key"))
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(0, cache.misses)
+
+
+    # Assert that falsy values are cached and distinguishable from a miss.
+    def test_get_returns_falsy_value(self):
+        cache = TtlCache(2)
+        cache.set("key", False)
+
+        self.assertEqual(False, cache.get("key"))
+        self.assertIsNone(cache.get("missing"))
+        self.assertEqual(1, cache.misses)
+
+
+    # Assert that the least recently used entry is evicted when full.
+    def test_set_evicts_least_recently_used(self):
+        cache = TtlCache(2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(1, cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(2, len(cache))
+
+
+    # Assert that an entry expires after its time to live.
+    def test_get_expires_entries(self):
+        cache = TtlCache(2, 60)
+        cache.set("key", "value", ttl_seconds=0.01)
+
+        time.sleep(0.02)
+
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(0, len(cache))
+
+
+    # Assert that a cache with no size stores nothing.
+    def test_set_disabled_cache(self):
+        cache = TtlCache(0)
+        cache.set("key", "value")
+
+        self.assertIsNone(cache.get("key"))
+
+
+    # Assert that delete removes an entry.
+    def test_delete_removes_entry(self):
+        cache = TtlCache(2)
+        cache.set("key", "value")
+        cache.delete("key")
+        cache.delete("missing")
+
+        self.assertIsNone(cache.get("key"))